@@ -22,7 +22,7 @@ def repeat(el, n=1):
 class Command(SimpleCommand):
 
     col_size = 8
-    title_size = 14
+    title_size = 18
     repetitions = 10
     complexity = [1, 2, 5, 10, 100, 1000]
 
@@ -55,6 +55,16 @@ class Command(SimpleCommand):
 
         return "%.5f" % (time / self.repetitions)
 
+    def formatted_speedup(self, function, *args, buffered=True, **opts):
+
+        reference = sum(first(timed(function)(*args, **opts)) for i in range(self.repetitions))
+        time = sum(
+            first(timed(function)(*args, buffered=buffered, **opts))
+            for i in range(self.repetitions)
+        )
+
+        return "x%.2f" % (reference / time)
+
     def table_line(self, *iterable):
         self.print(
             *(
@@ -120,7 +130,9 @@ class Command(SimpleCommand):
                 for label, export_format, opts in (
                     ("wl", "wl", {}),
                     ("wxf", "wxf", {}),
+                    ("wxf buf", "wxf", {"buffered": True}),
                     ("wxf zip", "wxf", {"compress": True}),
+                    ("wxf zip buf", "wxf", {"compress": True, "buffered": True}),
                 ):
                     if key == "expr" or (key == "array" and label != "wl"):
                         self.table_line(
@@ -139,6 +151,26 @@ class Command(SimpleCommand):
 
             self.table_line()
 
+        self.table_line("* Buffered WXF export speedup")
+        self.table_line()
+
+        self.table_line("", *(force_text(c).ljust(self.col_size) for c in self.complexity))
+        self.table_divider(len(self.complexity) + 1)
+
+        for key in ("expr", "array"):
+            for label, opts in (("wxf", {}), ("wxf zip", {"compress": True})):
+                self.table_line(
+                    "{} {}".format(label, key),
+                    *(
+                        self.formatted_speedup(
+                            export, expr[key], target_format="wxf", buffered=True, **opts
+                        )
+                        for complexity, expr in benchmarks
+                    ),
+                )
+
+        self.table_line()
+
     def handle(self, profile, **opts):
         if profile:
             safe_import_string_and_call(
@@ -1,7 +1,23 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
-from wolframclient.deserializers.wxf import binary_deserialize
+from wolframclient.deserializers.wxf import (
+    binary_deserialize,
+    binary_deserialize_file,
+    binary_deserialize_sequence,
+)
 from wolframclient.deserializers.wxf.wxfconsumer import WXFConsumer, WXFConsumerNumpy
+from wolframclient.deserializers.wxf.wxflazy import LazyWXF
 from wolframclient.deserializers.wxf.wxfparser import WXFToken
+from wolframclient.deserializers.wxf.wxfpush import WXFPushParser
 
-__all__ = ["WXFConsumer", "WXFToken", "binary_deserialize", "WXFConsumer", "WXFConsumerNumpy"]
+__all__ = [
+    "WXFConsumer",
+    "WXFToken",
+    "binary_deserialize",
+    "binary_deserialize_file",
+    "binary_deserialize_sequence",
+    "WXFConsumer",
+    "WXFConsumerNumpy",
+    "LazyWXF",
+    "WXFPushParser",
+]
@@ -1,13 +1,18 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+import mmap
+from functools import partial
+
 from wolframclient.deserializers.wxf.wxfconsumer import WXFConsumerNumpy
-from wolframclient.deserializers.wxf.wxfparser import WXFParser
+from wolframclient.deserializers.wxf.wxfdecoder import WXFDirectDecoder
+from wolframclient.deserializers.wxf.wxfparser import BUFFER_TYPES, parser_from_input
+from wolframclient.deserializers.wxf.wxfpush import WXFPushParser
 from wolframclient.exception import WolframParserException
 
-__all__ = ["binary_deserialize"]
+__all__ = ["binary_deserialize", "binary_deserialize_file", "binary_deserialize_sequence"]
 
 
-def binary_deserialize(wxf_input, consumer=None, **kwargs):
+def binary_deserialize(wxf_input, consumer=None, zero_copy=False, **kwargs):
     """Deserialize binary data and return a Python object.
 
     Serialize a Python object to WXF::
@@ -20,7 +25,9 @@ def binary_deserialize(wxf_input, consumer=None, **kwargs):
         {'key': [1, 2, 3]}
 
     A stream of :class:`~wolframclient.deserializers.wxf.wxfparser.WXFToken` is generated from the WXF input by a instance
-    of :class:`~wolframclient.deserializers.wxf.wxfparser.WXFParser`.
+    of :class:`~wolframclient.deserializers.wxf.wxfparser.WXFParser`. In-memory inputs, i.e. :class:`bytes`,
+    :class:`bytearray` and :class:`memoryview`, are parsed by
+    :class:`~wolframclient.deserializers.wxf.wxfparser.WXFBufferParser` instead.
 
     The consumer must be an instance of :class:`~wolframclient.deserializers.wxf.wxfconsumer.WXFConsumer`. If none is
     provided, :class:`~wolframclient.deserializers.wxf.wxfconsumer.WXFConsumerNumpy` is used. To disable NumPy array support,
@@ -31,8 +38,17 @@ def binary_deserialize(wxf_input, consumer=None, **kwargs):
 
     * `dict_class`: map WXF `Association` to `dict_class` in place of a regular :class:`dict`
 
+    When no consumer is provided and the input is already in memory, the default Python objects are built straight
+    from the bytes by :class:`~wolframclient.deserializers.wxf.wxfdecoder.WXFDirectDecoder`, skipping the token layer.
+
+    Set `zero_copy` to :data:`True` to avoid copying array data of in-memory inputs. NumPy arrays are then read-only
+    views into `wxf_input`, or into the inflated payload when it is compressed, and keep that buffer alive.
+
     """
-    parser = WXFParser(wxf_input)
+    if consumer is None and isinstance(wxf_input, BUFFER_TYPES):
+        return WXFDirectDecoder(wxf_input, zero_copy=zero_copy).decode(**kwargs)
+
+    parser = parser_from_input(wxf_input, zero_copy=zero_copy)
     if consumer is None:
         consumer = WXFConsumerNumpy()
 
@@ -47,3 +63,59 @@ def binary_deserialize(wxf_input, consumer=None, **kwargs):
             "Input data does not represent a valid expression in WXF format. Some expressions are incomplete."
         )
     return o
+
+
+def binary_deserialize_file(path, consumer=None, memory_map=True, zero_copy=True, **kwargs):
+    """Deserialize the WXF file at `path` and return a Python object.
+
+    By default the file is memory-mapped instead of being read, and NumPy arrays are read-only views backed by the
+    mapping. The file remains mapped as long as any of those arrays is referenced.
+
+    Set `memory_map` to :data:`False` to read the file as a stream. Other parameters are passed to
+    :func:`~wolframclient.deserializers.binary_deserialize`.
+    """
+    with open(path, "rb") as file:
+        if not memory_map:
+            return binary_deserialize(file, consumer=consumer, **kwargs)
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise WolframParserException("Cannot deserialize empty file %s." % path)
+
+    return binary_deserialize(mapped, consumer=consumer, zero_copy=zero_copy, **kwargs)
+
+
+def binary_deserialize_sequence(wxf_input, consumer=None, chunk_size=65536, **kwargs):
+    """Generate the expressions of a sequence of consecutive WXF documents.
+
+    Such sequences are written by :func:`~wolframclient.serializers.export` when `chunk_size` is set::
+
+        >>> wxf = export(iter(range(5)), target_format='wxf', chunk_size=2)
+        >>> tuple(binary_deserialize_sequence(wxf))
+        (0, 1, 2, 3, 4)
+
+    The parts of documents holding a `List` are generated one by one, as soon as they are decoded, so that
+    memory usage does not depend on the length of the sequence. Other documents are generated as a whole.
+
+    The input can be in memory, or an object implementing a `read` method which is read `chunk_size` bytes at a time.
+    Named parameters are passed to :class:`~wolframclient.deserializers.wxf.wxfpush.WXFPushParser`.
+    """
+    if isinstance(wxf_input, BUFFER_TYPES):
+        chunks = (wxf_input,)
+    else:
+        chunks = iter(partial(wxf_input.read, chunk_size), b"")
+
+    parser = WXFPushParser(consumer=consumer, **kwargs)
+    started = False
+    for chunk in chunks:
+        while chunk:
+            started = True
+            yield from parser.feed(chunk)
+            if not parser.finished:
+                break
+            # the rest of the chunk belongs to the next document.
+            chunk = parser.unused_data
+            parser = WXFPushParser(consumer=consumer, **kwargs)
+            started = False
+    if started:
+        parser.close()
@@ -0,0 +1,254 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import struct
+
+from wolframclient.deserializers.wxf.wxfconsumer import WXFConsumerNumpy
+from wolframclient.deserializers.wxf.wxfparser import WXFBufferParser, WXFToken
+from wolframclient.exception import WolframParserException
+from wolframclient.language.expression import WLFunction, WLSymbol
+from wolframclient.serializers.wxfencoder import constants
+from wolframclient.serializers.wxfencoder.serializer import NoEnforcingContext
+from wolframclient.utils.datastructures import immutabledict
+
+__all__ = ["WXFDirectDecoder"]
+
+_RULES = frozenset(
+    (constants.WXF_CONSTANTS.Rule[0], constants.WXF_CONSTANTS.RuleDelayed[0])
+)
+
+
+class WXFDirectDecoder(WXFBufferParser):
+    """Decode a WXF input held in memory straight into Python objects.
+
+    This class builds the same objects as :class:`~wolframclient.deserializers.wxf.wxfconsumer.WXFConsumerNumpy`,
+    i.e. :class:`tuple`, :class:`~wolframclient.utils.datastructures.immutabledict`,
+    :class:`~wolframclient.language.expression.WLFunction`, :class:`~wolframclient.language.expression.WLSymbol` and
+    NumPy arrays, without generating any intermediary
+    :class:`~wolframclient.deserializers.wxf.wxfparser.WXFToken` for atomic values.
+
+    It is used by :func:`~wolframclient.deserializers.binary_deserialize` when no consumer is specified and the input is
+    a :class:`bytes`, :class:`bytearray` or :class:`memoryview`. Custom consumers always go through the token parser.
+
+    With `zero_copy` set to :data:`True`, NumPy arrays are read-only views into the input buffer. Set
+    `binary_string_views` to also return binary strings as read-only :class:`memoryview` instead of :class:`bytes`.
+    """
+
+    _decoder_mapping = {
+        constants.WXF_CONSTANTS.Function: "decode_function",
+        constants.WXF_CONSTANTS.Symbol: "decode_symbol",
+        constants.WXF_CONSTANTS.String: "decode_string",
+        constants.WXF_CONSTANTS.BinaryString: "decode_binary_string",
+        constants.WXF_CONSTANTS.Integer8: "decode_integer8",
+        constants.WXF_CONSTANTS.Integer16: "decode_integer16",
+        constants.WXF_CONSTANTS.Integer32: "decode_integer32",
+        constants.WXF_CONSTANTS.Integer64: "decode_integer64",
+        constants.WXF_CONSTANTS.Real64: "decode_real64",
+        constants.WXF_CONSTANTS.BigInteger: "decode_bigint",
+        constants.WXF_CONSTANTS.BigReal: "decode_bigreal",
+        constants.WXF_CONSTANTS.PackedArray: "decode_packed_array",
+        constants.WXF_CONSTANTS.NumericArray: "decode_numeric_array",
+        constants.WXF_CONSTANTS.Association: "decode_association",
+        constants.WXF_CONSTANTS.Rule: "decode_rule",
+        constants.WXF_CONSTANTS.RuleDelayed: "decode_rule",
+    }
+
+    def __init__(self, wxf_input, consumer=None, zero_copy=False, binary_string_views=False):
+        super().__init__(wxf_input, zero_copy=zero_copy)
+        self.binary_string_views = binary_string_views
+        self.setup_decoders(consumer)
+
+    def setup_decoders(self, consumer=None):
+        # nesting is driven by the declared lengths, there is no token stream to validate.
+        self.context = NoEnforcingContext()
+        self.consumer = consumer or WXFConsumerNumpy()
+        self.dict_class = immutabledict
+        self._symbols = dict(self.consumer.BUILTIN_SYMBOL)
+        self._decoders = {
+            wxf_type[0]: getattr(self, decoder)
+            for wxf_type, decoder in self._decoder_mapping.items()
+        }
+
+    def decode(self, dict_class=immutabledict):
+        """Return the Python object represented by the WXF input.
+
+        The named option `dict_class` has the same meaning as in
+        :meth:`~wolframclient.deserializers.wxf.wxfconsumer.WXFConsumer.consume_association`.
+        """
+        self.dict_class = dict_class
+        return self.next_expression()
+
+    def next_expression(self):
+        try:
+            decoder = self._decoders[self.view[self.offset]]
+        except IndexError:
+            raise EOFError("Not enough data to read.")
+        except KeyError:
+            raise WolframParserException(
+                "Unexpected token %s" % self.view[self.offset : self.offset + 1].tobytes()
+            )
+        self.offset += 1
+        return decoder()
+
+    _LIST = WLSymbol("List")
+
+    def decode_function(self):
+        length = self.parse_varint()
+        next_expression = self.next_expression
+        head = next_expression()
+        args = tuple([next_expression() for _i in range(length)])
+        if head.__class__ is WLSymbol and head == self._LIST:
+            return args
+        return WLFunction(head, *args)
+
+    def decode_association(self):
+        length = self.parse_varint()
+        view = self.view
+        next_expression = self.next_expression
+        rules = []
+        for _i in range(length):
+            try:
+                wxf_type = view[self.offset]
+            except IndexError:
+                raise EOFError("Not enough data to read.")
+            if wxf_type not in _RULES:
+                raise WolframParserException("Association parts must be Rule or RuleDelayed.")
+            self.offset += 1
+            rules.append((next_expression(), next_expression()))
+        return self.dict_class(rules)
+
+    def decode_rule(self):
+        raise WolframParserException("Rule and RuleDelayed must be parts of an Association.")
+
+    def _read_text(self):
+        length = self.parse_varint()
+        return str(self.read(length), "utf8")
+
+    def decode_symbol(self):
+        name = self._read_text()
+        try:
+            return self._symbols[name]
+        except KeyError:
+            symbol = self._symbols[name] = WLSymbol(name)
+            return symbol
+
+    def decode_string(self):
+        return self._read_text()
+
+    def decode_binary_string(self):
+        length = self.parse_varint()
+        if self.binary_string_views:
+            return self.read(length).toreadonly()
+        return self.read(length).tobytes()
+
+    def _unpack(self, unpack_from, size):
+        offset = self.offset
+        self.offset += size
+        try:
+            return unpack_from(self.view, offset)[0]
+        except struct.error:
+            raise EOFError("Not enough data to read.")
+
+    def decode_integer8(self, unpack_from=constants.STRUCT_MAPPING.Integer8.unpack_from):
+        return self._unpack(unpack_from, 1)
+
+    def decode_integer16(self, unpack_from=constants.STRUCT_MAPPING.Integer16.unpack_from):
+        return self._unpack(unpack_from, 2)
+
+    def decode_integer32(self, unpack_from=constants.STRUCT_MAPPING.Integer32.unpack_from):
+        return self._unpack(unpack_from, 4)
+
+    def decode_integer64(self, unpack_from=constants.STRUCT_MAPPING.Integer64.unpack_from):
+        return self._unpack(unpack_from, 8)
+
+    def decode_real64(self, unpack_from=constants.STRUCT_MAPPING.Real64.unpack_from):
+        return self._unpack(unpack_from, 8)
+
+    # rare or large values are delegated to the consumer, through a token.
+
+    def _token(self, wxf_type, data):
+        token = WXFToken(wxf_type)
+        token.data = data
+        return token
+
+    def decode_bigint(self):
+        return self.consumer.consume_bigint(
+            self._token(constants.WXF_CONSTANTS.BigInteger, self._read_text()), None
+        )
+
+    def decode_bigreal(self):
+        return self.consumer.consume_bigreal(
+            self._token(constants.WXF_CONSTANTS.BigReal, self._read_text()), None
+        )
+
+    def decode_packed_array(self):
+        token = self.token_for_packed_array(WXFToken(constants.WXF_CONSTANTS.PackedArray))
+        return self.consumer.consume_packed_array(token, None)
+
+    def decode_numeric_array(self):
+        token = self.token_for_numeric_array(WXFToken(constants.WXF_CONSTANTS.NumericArray))
+        return self.consumer.consume_numeric_array(token, None)
+
+    # skipping relies on declared lengths only, nothing is decoded nor validated.
+
+    _fixed_sizes = {
+        constants.WXF_CONSTANTS.Integer8[0]: 1,
+        constants.WXF_CONSTANTS.Integer16[0]: 2,
+        constants.WXF_CONSTANTS.Integer32[0]: 4,
+        constants.WXF_CONSTANTS.Integer64[0]: 8,
+        constants.WXF_CONSTANTS.Real64[0]: 8,
+    }
+    _sized = frozenset(
+        wxf_type[0]
+        for wxf_type in (
+            constants.WXF_CONSTANTS.Symbol,
+            constants.WXF_CONSTANTS.String,
+            constants.WXF_CONSTANTS.BinaryString,
+            constants.WXF_CONSTANTS.BigInteger,
+            constants.WXF_CONSTANTS.BigReal,
+        )
+    )
+    _arrays = frozenset(
+        (constants.WXF_CONSTANTS.PackedArray[0], constants.WXF_CONSTANTS.NumericArray[0])
+    )
+
+    def skip_expression(self):
+        """Move the offset past the next expression without decoding it."""
+        view = self.view
+        remaining = 1
+        while remaining:
+            remaining -= 1
+            try:
+                wxf_type = view[self.offset]
+            except IndexError:
+                raise EOFError("Not enough data to read.")
+            self.offset += 1
+            if wxf_type in self._fixed_sizes:
+                self.offset += self._fixed_sizes[wxf_type]
+            elif wxf_type in self._sized:
+                length = self.parse_varint()
+                self.offset += length
+            elif wxf_type == constants.WXF_CONSTANTS.Function[0]:
+                # the head and all the parts.
+                remaining += self.parse_varint() + 1
+            elif wxf_type == constants.WXF_CONSTANTS.Association[0]:
+                remaining += self.parse_varint()
+            elif wxf_type in _RULES:
+                remaining += 2
+            elif wxf_type in self._arrays:
+                self._skip_array()
+            else:
+                raise WolframParserException(
+                    "Unexpected token %s" % view[self.offset - 1 : self.offset].tobytes()
+                )
+        if self.offset > len(view):
+            raise EOFError("Not enough data to read.")
+
+    def _skip_array(self):
+        array_type = self.read(1).tobytes()
+        try:
+            size = constants.ARRAY_TYPES_ELEM_SIZE[array_type]
+        except KeyError:
+            raise WolframParserException("Invalid array value type: %s" % array_type)
+        for _i in range(self.parse_varint()):
+            size *= self.parse_varint()
+        self.offset += size
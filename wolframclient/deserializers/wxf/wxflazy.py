@@ -0,0 +1,182 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+from wolframclient.deserializers.wxf.wxfdecoder import WXFDirectDecoder
+from wolframclient.serializers.wxfencoder import constants
+from wolframclient.utils.datastructures import immutabledict
+
+__all__ = ["LazyWXF"]
+
+_FUNCTION = constants.WXF_CONSTANTS.Function[0]
+_ASSOCIATION = constants.WXF_CONSTANTS.Association[0]
+
+
+class LazyWXF:
+    """Random-access view of a WXF expression held in memory.
+
+    Only the parts that are accessed are decoded, the others are jumped over using their declared lengths. Parts of a
+    function, e.g. a `List`, are accessed by position, values of an association by key::
+
+        >>> doc = LazyWXF(export({'Result': [1, 2, 3], 'Log': ['...']}, target_format='wxf'))
+        >>> doc['Result']
+        (1, 2, 3)
+        >>> doc.lazy('Result')[-1]
+        3
+
+    The first access builds an index of the offsets of the top-level parts, and of the keys of an association. This
+    index is available in :attr:`index` and can be passed back with `index` to a new view of the same input, to skip
+    this step.
+
+    Values are decoded with :class:`~wolframclient.deserializers.wxf.wxfdecoder.WXFDirectDecoder` and cached.
+    Parameters `zero_copy` and `binary_string_views` have the same meaning, `dict_class` is the class used for
+    associations. Since all accesses move the same decoder, a view must not be shared between threads.
+    """
+
+    def __init__(
+        self,
+        wxf_input,
+        zero_copy=False,
+        binary_string_views=False,
+        dict_class=immutabledict,
+        index=None,
+    ):
+        self.decoder = WXFDirectDecoder(
+            wxf_input, zero_copy=zero_copy, binary_string_views=binary_string_views
+        )
+        self.dict_class = dict_class
+        self._setup(self.decoder.offset, index)
+
+    def _setup(self, start, index=None):
+        self._start = start
+        self._index = index
+        self._cache = {}
+        try:
+            self._wxf_type = self.decoder.view[start]
+        except IndexError:
+            raise EOFError("Not enough data to read.")
+
+    def _decode_at(self, offset):
+        self.decoder.offset = offset
+        self.decoder.dict_class = self.dict_class
+        return self.decoder.next_expression()
+
+    def _container_length(self):
+        self.decoder.offset = self._start + 1
+        return self.decoder.parse_varint()
+
+    def _build_index(self):
+        decoder = self.decoder
+        length = self._container_length()
+        if self._wxf_type == _FUNCTION:
+            decoder.skip_expression()
+            offsets = []
+            for _i in range(length):
+                offsets.append(decoder.offset)
+                decoder.skip_expression()
+            return tuple(offsets)
+        decoder.dict_class = self.dict_class
+        offsets = {}
+        for _i in range(length):
+            # step over the Rule token, decode the key and skip the value.
+            decoder.offset += 1
+            key = decoder.next_expression()
+            offsets[key] = decoder.offset
+            decoder.skip_expression()
+        return offsets
+
+    @property
+    def is_function(self):
+        return self._wxf_type == _FUNCTION
+
+    @property
+    def is_association(self):
+        return self._wxf_type == _ASSOCIATION
+
+    @property
+    def index(self):
+        """The offsets of the parts of a function as a :class:`tuple`, or of the values of an association as a
+        :class:`dict` keyed by association keys. Atomic expressions have no index."""
+        if self._index is None and (self.is_function or self.is_association):
+            self._index = self._build_index()
+        return self._index
+
+    @property
+    def head(self):
+        """The decoded head of a function."""
+        if not self.is_function:
+            raise TypeError("Only functions have a head.")
+        self._container_length()
+        return self.decoder.next_expression()
+
+    def _offset(self, key):
+        if self.is_function or self.is_association:
+            return self.index[key]
+        raise TypeError("Atomic WXF expressions cannot be indexed.")
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return tuple(self[i] for i in range(*key.indices(len(self))))
+        if self.is_function and key < 0:
+            key += len(self)
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._decode_at(self._offset(key))
+            return value
+
+    def lazy(self, key):
+        """Return a :class:`LazyWXF` view of the part at `key`, without decoding it."""
+        doc = self.__class__.__new__(self.__class__)
+        doc.decoder = self.decoder
+        doc.dict_class = self.dict_class
+        doc._setup(self._offset(key))
+        return doc
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+    def keys(self):
+        if not self.is_association:
+            raise TypeError("Only associations have keys.")
+        return self.index.keys()
+
+    def values(self):
+        for key in self.keys():
+            yield self[key]
+
+    def items(self):
+        for key in self.keys():
+            yield key, self[key]
+
+    def __iter__(self):
+        if self.is_association:
+            return iter(self.keys())
+        return (self[i] for i in range(len(self)))
+
+    def __contains__(self, key):
+        if self.is_association:
+            return key in self.index
+        return any(value == key for value in self)
+
+    def __len__(self):
+        if self.is_function or self.is_association:
+            if self._index is None:
+                return self._container_length()
+            return len(self._index)
+        raise TypeError("Atomic WXF expressions have no length.")
+
+    def __bool__(self):
+        return not (self.is_function or self.is_association) or len(self) > 0
+
+    def decode(self):
+        """Decode the whole expression."""
+        return self._decode_at(self._start)
+
+    def __repr__(self):
+        if self.is_association:
+            return "<%s: Association of %i keys>" % (self.__class__.__name__, len(self))
+        if self.is_function:
+            return "<%s: Function of %i parts>" % (self.__class__.__name__, len(self))
+        return "<%s: %r>" % (self.__class__.__name__, self.decode())
@@ -1,5 +1,8 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+import mmap
+import struct
+
 from wolframclient.exception import WolframParserException
 from wolframclient.serializers.wxfencoder import constants
 from wolframclient.serializers.wxfencoder.serializer import (
@@ -10,8 +13,12 @@ from wolframclient.serializers.wxfencoder.serializer import (
 )
 from wolframclient.serializers.wxfencoder.streaming import ExactSizeReader, ZipCompressedReader
 from wolframclient.utils import six
+from wolframclient.utils.api import zlib
 from wolframclient.utils.dispatch import Dispatch
 
+# inputs held in memory, parsed through a memoryview.
+BUFFER_TYPES = tuple(six.buffer_types) + (mmap.mmap,)
+
 wxf_input_to_buffer = Dispatch()
 
 
@@ -90,6 +97,10 @@ class WXFParser:
         else:
             self.reader = ExactSizeReader(self.reader)
 
+        self._handlers = {
+            wxf_type: getattr(self, handler) for wxf_type, handler in self._mapping.items()
+        }
+
     def tokens(self):
         """Generate instances :class:`~wolframclient.deserializers.wxf.wxfparser.WXFToken` from a WXF input."""
         yield self.next_token()
@@ -124,9 +135,10 @@ class WXFParser:
             if dim == 0:
                 raise WolframParserException("Array dimensions cannot be zero.")
             token.dimensions.append(dim)
-        # reading values
+        # reading values straight into a buffer of the final size.
         bytecount = constants.ARRAY_TYPES_ELEM_SIZE[token.array_type] * token.element_count
-        token.data = self.reader.read(bytecount)
+        token.data = bytearray(bytecount)
+        self.reader.readinto(token.data)
 
     def token_for_string(self, token):
         self.context.add_part()
@@ -214,11 +226,196 @@ class WXFParser:
         next_byte = self.reader.read(1)
 
         try:
-            handler = self._mapping[next_byte]
+            handler = self._handlers[next_byte]
         except KeyError:
             raise WolframParserException("Unexpected token %s" % next_byte)
 
-        return getattr(self, handler)(WXFToken(next_byte))
+        return handler(WXFToken(next_byte))
+
+
+class WXFBufferParser(WXFParser):
+    """Parse a WXF input already held in memory.
+
+    The input `wxf_input` must be a :class:`bytes`, :class:`bytearray`, :class:`memoryview` or :class:`mmap.mmap`. The parser reads from a
+    :class:`memoryview` of it with a moving offset, instead of issuing a :meth:`read` call for each byte. Compressed
+    inputs are inflated at once.
+
+    This class generates the same tokens as :class:`~wolframclient.deserializers.wxf.wxfparser.WXFParser` and is
+    automatically used by :func:`~wolframclient.deserializers.binary_deserialize` for in-memory inputs.
+
+    When `zero_copy` is :data:`True`, array data is not copied: tokens hold a read-only :class:`memoryview` into the
+    input, or into the inflated payload for compressed inputs.
+    """
+
+    def __init__(self, wxf_input, zero_copy=False):
+        self.context = SerializationContext()
+        self.view = memoryview(wxf_input).cast("B")
+        self.offset = 0
+        self.zero_copy = zero_copy
+
+        version, compress = self.parse_header()
+        if compress is True:
+            # truncated payloads are partially inflated, and raise EOFError when parsed.
+            try:
+                self.view = memoryview(zlib.decompressobj().decompress(self.view[self.offset :]))
+            except zlib.error as e:
+                raise WolframParserException("Invalid compressed WXF input: %s" % e)
+            self.offset = 0
+
+        self._handlers = {
+            wxf_type[0]: (wxf_type, getattr(self, handler))
+            for wxf_type, handler in self._mapping.items()
+        }
+
+    def read(self, size):
+        """Return a :class:`memoryview` on the next `size` bytes and move the offset forward."""
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.view):
+            raise EOFError("Not enough data to read.")
+        return self.view[start : self.offset]
+
+    def parse_header(self):
+        header = self.view[:3].tobytes()
+        if header[:1] != WXF_VERSION:
+            raise WolframParserException("Invalid version %s." % header[:1])
+        if header[1:2] == WXF_HEADER_COMPRESS:
+            compress, self.offset = True, 3
+        else:
+            compress, self.offset = False, 2
+        if header[self.offset - 1 : self.offset] != WXF_HEADER_SEPARATOR:
+            raise WolframParserException(
+                "Invalid header. Failed to find header separator ':'."
+            )
+        return (int(WXF_VERSION), compress)
+
+    def parse_varint(self):
+        view = self.view
+        offset = self.offset
+        try:
+            next_byte = view[offset]
+            if next_byte < 0x80:
+                self.offset = offset + 1
+                return next_byte
+            length = 0
+            shift = 0
+            for _i in range(8):
+                next_byte = view[offset]
+                offset += 1
+                length |= (next_byte & 0x7F) << shift
+                shift += 7
+                if not next_byte & 0x80:
+                    self.offset = offset
+                    return length
+            next_byte = view[offset] & 0x7F
+            if next_byte == 0:
+                raise WolframParserException("Invalid last varint byte.")
+            self.offset = offset + 1
+            return length | next_byte << shift
+        except IndexError:
+            raise EOFError("EOF reached while parsing varint encoded integer.")
+
+    def parse_array(self, token):
+        rank = self.parse_varint()
+        if rank == 0:
+            raise WolframParserException("Array rank cannot be zero.")
+        token.dimensions = []
+        for _i in range(rank):
+            dim = self.parse_varint()
+            if dim == 0:
+                raise WolframParserException("Array dimensions cannot be zero.")
+            token.dimensions.append(dim)
+        bytecount = constants.ARRAY_TYPES_ELEM_SIZE[token.array_type] * token.element_count
+        if self.zero_copy:
+            token.data = self.read(bytecount).toreadonly()
+        else:
+            token.data = self.read(bytecount).tobytes()
+
+    def token_for_string(self, token):
+        self.context.add_part()
+        token.length = self.parse_varint()
+        token.data = str(self.read(token.length), "utf8")
+        return token
+
+    def _unpack(self, token, packer):
+        self.context.add_part()
+        offset = self.offset
+        self.offset += packer.size
+        try:
+            token.data = packer.unpack_from(self.view, offset)[0]
+        except struct.error:
+            raise EOFError("Not enough data to read.")
+        return token
+
+    def token_for_integer8(self, token):
+        return self._unpack(token, constants.STRUCT_MAPPING.Integer8)
+
+    def token_for_integer16(self, token):
+        return self._unpack(token, constants.STRUCT_MAPPING.Integer16)
+
+    def token_for_integer32(self, token):
+        return self._unpack(token, constants.STRUCT_MAPPING.Integer32)
+
+    def token_for_integer64(self, token):
+        return self._unpack(token, constants.STRUCT_MAPPING.Integer64)
+
+    def token_for_real64(self, token):
+        return self._unpack(token, constants.STRUCT_MAPPING.Real64)
+
+    def token_for_function(self, token):
+        token.length = self.parse_varint()
+        self.context.step_into_new_function(token.length)
+        return token
+
+    def token_for_association(self, token):
+        token.length = self.parse_varint()
+        self.context.step_into_new_assoc(token.length)
+        return token
+
+    def token_for_packed_array(self, token):
+        self.context.add_part()
+        token.array_type = self.read(1).tobytes()
+        if token.array_type not in constants.VALID_PACKED_ARRAY_TYPES:
+            raise WolframParserException(
+                "Invalid PackedArray value type: %s" % token.array_type
+            )
+        self.parse_array(token)
+        return token
+
+    def token_for_numeric_array(self, token):
+        self.context.add_part()
+        token.array_type = self.read(1).tobytes()
+        if token.array_type not in constants.ARRAY_TYPES_ELEM_SIZE:
+            raise WolframParserException(
+                "Invalid NumericArray value type: %s" % token.array_type
+            )
+        self.parse_array(token)
+        return token
+
+    def token_for_binary_string(self, token):
+        self.context.add_part()
+        token.length = self.parse_varint()
+        token.data = self.read(token.length).tobytes()
+        return token
+
+    def next_token(self):
+        try:
+            wxf_type, handler = self._handlers[self.view[self.offset]]
+        except IndexError:
+            raise EOFError("Not enough data to read.")
+        except KeyError:
+            raise WolframParserException(
+                "Unexpected token %s" % self.view[self.offset : self.offset + 1].tobytes()
+            )
+        self.offset += 1
+        return handler(WXFToken(wxf_type))
+
+
+def parser_from_input(wxf_input, zero_copy=False):
+    """Return the most efficient parser for `wxf_input`."""
+    if isinstance(wxf_input, BUFFER_TYPES):
+        return WXFBufferParser(wxf_input, zero_copy=zero_copy)
+    return WXFParser(wxf_input)
 
 
 class WXFToken:
@@ -0,0 +1,237 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+from wolframclient.deserializers.wxf.wxfdecoder import _RULES, WXFDirectDecoder
+from wolframclient.exception import WolframParserException
+from wolframclient.language.expression import WLFunction, WLSymbol
+from wolframclient.serializers.wxfencoder import constants
+from wolframclient.serializers.wxfencoder.serializer import (
+    WXF_HEADER_COMPRESS,
+    WXF_HEADER_SEPARATOR,
+    WXF_VERSION,
+)
+from wolframclient.utils.api import zlib
+from wolframclient.utils.datastructures import immutabledict
+
+__all__ = ["WXFPushParser"]
+
+_FUNCTION = constants.WXF_CONSTANTS.Function[0]
+_ASSOCIATION = constants.WXF_CONSTANTS.Association[0]
+_LIST = WLSymbol("List")
+
+
+class _Frame:
+    """A function, association or rule being decoded."""
+
+    __slots__ = "wxf_type", "remaining", "items", "streaming"
+
+    def __init__(self, wxf_type, remaining):
+        self.wxf_type = wxf_type
+        self.remaining = remaining
+        self.items = []
+        self.streaming = False
+
+
+class WXFPushParser(WXFDirectDecoder):
+    """Decode a WXF input fed by chunks, as they arrive.
+
+    Unlike :class:`~wolframclient.deserializers.wxf.wxfparser.WXFParser`, which pulls bytes from a blocking `read`,
+    this parser is pushed chunks of any size with :meth:`feed`, and never waits for data. Bytes are decoded as soon as
+    a token is complete; when a token is cut by the end of a chunk, decoding resumes from its beginning once more data
+    is fed.
+
+    :meth:`feed` returns the list of the expressions completed by the chunk. The parts of a top-level `List` are
+    returned one by one, as well as the rules of a top-level association, as `(key, value)` tuples. Any other
+    expression is returned once complete::
+
+        >>> parser = WXFPushParser()
+        >>> wxf = export([1, 2, 3], target_format='wxf')
+        >>> parser.feed(wxf[:-2])
+        [1, 2]
+        >>> parser.feed(wxf[-2:])
+        [3]
+        >>> parser.close()
+
+    Compressed inputs are inflated incrementally. Decoded values do not reference the internal buffer, which only
+    holds the incomplete token. Bytes found after the end of the document are kept in :attr:`unused_data`, and make
+    :meth:`close` fail.
+    """
+
+    def __init__(self, consumer=None, dict_class=immutabledict):
+        self.setup_decoders(consumer)
+        self.dict_class = dict_class
+        self.zero_copy = False
+        self.binary_string_views = False
+        self.pending = bytearray()
+        self.view = None
+        self.offset = 0
+        self.inflater = None
+        self.header_parsed = False
+        self.stack = []
+        self.done = False
+        self.is_list = False
+        self.is_association = False
+        self.unused_data = b""
+
+    def feed(self, chunk):
+        """Decode `chunk` and return the list of the expressions it completed."""
+        if self.header_parsed:
+            self._extend(chunk)
+        else:
+            self.pending += chunk
+            if not self._parse_pending_header():
+                return []
+        if self.done:
+            self._keep_trailing_data()
+            return []
+
+        completed = []
+        with memoryview(self.pending) as self.view:
+            self.offset = 0
+            try:
+                self._decode_tokens(completed)
+            finally:
+                self.view = None
+        # discard the bytes that were decoded, the rest is an incomplete token.
+        del self.pending[: self.offset]
+        self.offset = 0
+        if self.done:
+            self._keep_trailing_data()
+        return completed
+
+    @property
+    def finished(self):
+        """Whether the whole document was read, including the end of the compressed stream if any."""
+        return self.done and (self.inflater is None or self.inflater.eof)
+
+    def _extend(self, chunk):
+        if self.inflater is None:
+            self.pending += chunk
+        elif self.inflater.eof:
+            self.unused_data += chunk
+        else:
+            try:
+                self.pending += self.inflater.decompress(chunk)
+            except zlib.error as e:
+                raise WolframParserException("Invalid compressed WXF input: %s" % e)
+            if self.inflater.eof:
+                self.unused_data += self.inflater.unused_data
+
+    def _keep_trailing_data(self):
+        if self.pending:
+            if self.inflater is not None:
+                raise WolframParserException("Data found after the end of the expression.")
+            self.unused_data += self.pending
+            self.pending = bytearray()
+
+    def close(self):
+        """Check that the input was complete and release the internal buffer."""
+        self.inflater = None
+        if not self.done:
+            raise WolframParserException(
+                "Input data does not represent a valid expression in WXF format. Expecting more input data."
+            )
+        if self.unused_data:
+            raise WolframParserException("Data found after the end of the expression.")
+        self.pending = bytearray()
+
+    def _parse_pending_header(self):
+        header = bytes(self.pending[:3])
+        if header[:1] and header[:1] != WXF_VERSION:
+            raise WolframParserException("Invalid version %s." % header[:1])
+        if len(header) < 2 or (header[1:2] == WXF_HEADER_COMPRESS and len(header) < 3):
+            return False
+        if header[1:2] == WXF_HEADER_COMPRESS:
+            size = 3
+            self.inflater = zlib.decompressobj()
+        else:
+            size = 2
+        if header[size - 1 : size] != WXF_HEADER_SEPARATOR:
+            raise WolframParserException("Invalid header. Failed to find header separator ':'.")
+        body = self.pending[size:]
+        self.pending = bytearray()
+        self.header_parsed = True
+        self._extend(body)
+        return True
+
+    def _decode_tokens(self, completed):
+        stack = self.stack
+        while not self.done:
+            start = self.offset
+            try:
+                wxf_type = self.view[start]
+            except IndexError:
+                return
+            if stack and stack[-1].wxf_type == _ASSOCIATION and wxf_type not in _RULES:
+                raise WolframParserException("Association parts must be Rule or RuleDelayed.")
+            self.offset += 1
+            try:
+                if wxf_type == _FUNCTION:
+                    stack.append(_Frame(wxf_type, self.parse_varint() + 1))
+                elif wxf_type == _ASSOCIATION:
+                    frame = _Frame(wxf_type, self.parse_varint())
+                    stack.append(frame)
+                    if len(stack) == 1:
+                        frame.streaming = self.is_association = True
+                elif wxf_type in _RULES:
+                    if not stack or stack[-1].wxf_type != _ASSOCIATION:
+                        raise WolframParserException(
+                            "Rule and RuleDelayed must be parts of an Association."
+                        )
+                    stack.append(_Frame(wxf_type, 2))
+                else:
+                    try:
+                        decoder = self._decoders[wxf_type]
+                    except KeyError:
+                        raise WolframParserException(
+                            "Unexpected token %s" % self.view[start : start + 1].tobytes()
+                        )
+                    self._complete(decoder(), completed)
+                    continue
+            except EOFError:
+                # the token is cut, decode it again when more data is available.
+                self.offset = start
+                return
+            self._complete_empty(completed)
+
+    def _complete_empty(self, completed):
+        frame = self.stack[-1]
+        if not frame.remaining:
+            self.stack.pop()
+            if frame.streaming:
+                self.done = True
+            else:
+                self._complete(self._build(frame), completed)
+
+    def _build(self, frame):
+        if frame.wxf_type == _FUNCTION:
+            head, args = frame.items[0], tuple(frame.items[1:])
+            if head.__class__ is WLSymbol and head == _LIST:
+                return args
+            return WLFunction(head, *args)
+        if frame.wxf_type == _ASSOCIATION:
+            return self.dict_class(frame.items)
+        return tuple(frame.items)
+
+    def _complete(self, value, completed):
+        stack = self.stack
+        while stack:
+            frame = stack[-1]
+            frame.remaining -= 1
+            if frame.streaming:
+                completed.append(value)
+            else:
+                frame.items.append(value)
+                if len(stack) == 1 and frame.wxf_type == _FUNCTION and len(frame.items) == 1:
+                    # the parts of a top-level List are returned as soon as they are complete.
+                    if value.__class__ is WLSymbol and value == _LIST:
+                        frame.streaming = self.is_list = True
+                        frame.items = []
+            if frame.remaining:
+                return
+            stack.pop()
+            if frame.streaming:
+                self.done = True
+                return
+            value = self._build(frame)
+        completed.append(value)
+        self.done = True
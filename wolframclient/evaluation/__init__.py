@@ -9,7 +9,11 @@ from wolframclient.evaluation.cloud import (
     WolframCloudSession,
     WolframServer,
 )
-from wolframclient.evaluation.kernel import WolframLanguageAsyncSession, WolframLanguageSession
+from wolframclient.evaluation.kernel import (
+    WolframKernelStandby,
+    WolframLanguageAsyncSession,
+    WolframLanguageSession,
+)
 from wolframclient.evaluation.pool import WolframEvaluatorPool, parallel_evaluate
 from wolframclient.evaluation.result import (
     WolframAPIResponse,
@@ -34,6 +38,7 @@ __all__ = [
     "WolframEvaluationJSONResponseAsync",
     "WolframEvaluatorPool",
     "WolframKernelEvaluationResult",
+    "WolframKernelStandby",
     "WolframLanguageAsyncSession",
     "WolframLanguageSession",
     "WolframResult",
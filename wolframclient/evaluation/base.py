@@ -69,6 +69,18 @@ class WolframEvaluator(WolframEvaluatorBase):
         # for consistency with the async version, return a list.
         return list(map(self.evaluate, expr_list))
 
+    def evaluate_batch(self, exprs):
+        """Evaluate a batch of Wolfram Language expressions in order and return the list of their results.
+
+        Evaluators able to send many expressions at once override this method, by default it is
+        :meth:`evaluate_many`.
+        """
+        return self.evaluate_many(exprs)
+
+    def evaluate_batch_wrap(self, exprs):
+        """Evaluate a batch of Wolfram Language expressions and return the list of result objects."""
+        return list(map(self.evaluate_wrap, exprs))
+
     def evaluate_wrap(self, expr):
         """Evaluate a given Wolfram Language expression and return a result object with the result and meta
         information."""
@@ -156,6 +168,12 @@ class WolframAsyncEvaluator(WolframEvaluatorBase):
     async def evaluate_many(self, expr_list):
         return await asyncio.gather(*map(self.evaluate, expr_list))
 
+    async def evaluate_batch(self, exprs):
+        return await self.evaluate_many(exprs)
+
+    async def evaluate_batch_wrap(self, exprs):
+        return await asyncio.gather(*map(self.evaluate_wrap, exprs))
+
     async def evaluate_wrap(self, expr):
         raise NotImplementedError
 
@@ -2,6 +2,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import json
 import logging
+from collections import deque
 
 from wolframclient.evaluation.base import WolframAsyncEvaluator
 from wolframclient.evaluation.cloud.asyncoauth import (
@@ -10,7 +11,7 @@ from wolframclient.evaluation.cloud.asyncoauth import (
 from wolframclient.evaluation.cloud.asyncoauth import (
     XAuthAIOHttpAsyncSession as XAuthAsyncSession,
 )
-from wolframclient.evaluation.cloud.base import WolframAPICallBase
+from wolframclient.evaluation.cloud.base import WolframAPICallBase, encode_evaluation_input
 from wolframclient.evaluation.cloud.server import DEFAULT_CA_PATH, WOLFRAM_PUBLIC_CLOUD_SERVER
 from wolframclient.evaluation.result import (
     WolframAPIResponseBuilder,
@@ -19,7 +20,7 @@ from wolframclient.evaluation.result import (
 from wolframclient.exception import AuthenticationException
 from wolframclient.serializers import export
 from wolframclient.utils import six
-from wolframclient.utils.api import aiohttp, ssl
+from wolframclient.utils.api import aiohttp, asyncio, ssl
 from wolframclient.utils.url import evaluation_api_url, user_api_url
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,14 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
 
     The initialization options of the class :class:`~wolframclient.evaluation.WolframCloudSession` are also supported by
     this class.
+
+    Connections to the server are kept alive and reused, along with their TLS session, for `keepalive_timeout`
+    seconds. At most `pool_maxsize` connections are open at once, or any number if it is 0. Set `keep_alive` to
+    :data:`False` to close connections after each request.
+
+    Expressions are sent for evaluation as InputForm text when `evaluation_format` is ``'wl'``, or as WXF when it is
+    ``'wxf'``, which is smaller and cheaper to parse on the server for array-heavy expressions. Set `compress` to
+    zlib compress WXF request bodies.
     """
 
     def __init__(
@@ -51,6 +60,11 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
         xauth_session_class=None,
         http_sessionclass=None,
         ssl_context_class=None,
+        evaluation_format="wl",
+        compress=False,
+        pool_maxsize=100,
+        keep_alive=True,
+        keepalive_timeout=15,
     ):
         super().__init__(inputform_string_evaluation=inputform_string_evaluation)
         self.server = server or WOLFRAM_PUBLIC_CLOUD_SERVER
@@ -62,6 +76,13 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
         self.oauth_session_class = oauth_session_class or OAuthAsyncSession
         self.ssl_context_class = ssl_context_class or ssl.SSLContext
         self.oauth_session = None
+        # an authenticated session of the session this one duplicates.
+        self._shared_oauth_session = None
+        self.evaluation_format = evaluation_format
+        self.compress = compress
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.keepalive_timeout = keepalive_timeout
         if self.server.certificate is not None:
             self._ssl_context = self.ssl_context_class()
             self._ssl_context.load_verify_locations(self.server.certificate)
@@ -71,7 +92,10 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
             self._ssl_context = None
 
     def duplicate(self):
-        return self.__class__(
+        """Return a new session with the same configuration.
+
+        If this session is authenticated, the new session shares its tokens instead of authenticating again."""
+        session = self.__class__(
             credentials=self.credentials,
             server=self.server,
             inputform_string_evaluation=self.inputform_string_evaluation,
@@ -79,7 +103,15 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
             xauth_session_class=self.xauth_session_class,
             http_sessionclass=self.http_sessionclass,
             ssl_context_class=self.ssl_context_class,
+            evaluation_format=self.evaluation_format,
+            compress=self.compress,
+            pool_maxsize=self.pool_maxsize,
+            keep_alive=self.keep_alive,
+            keepalive_timeout=self.keepalive_timeout,
         )
+        if self.authorized():
+            session._shared_oauth_session = self.oauth_session
+        return session
 
     async def start(self):
         self.stopped = False
@@ -87,7 +119,8 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
             if not self.started:
                 if self.http_session is None or self.http_session.closed:
                     self.http_session = self.http_sessionclass(
-                        headers={"User-Agent": "WolframClientForPython/1.0"}
+                        headers={"User-Agent": "WolframClientForPython/1.0"},
+                        connector=self._connector(),
                     )
                 if not self.anonymous():
                     await self._authenticate()
@@ -97,6 +130,13 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
             finally:
                 raise e
 
+    def _connector(self):
+        if self.keep_alive:
+            return aiohttp.TCPConnector(
+                limit=self.pool_maxsize, keepalive_timeout=self.keepalive_timeout
+            )
+        return aiohttp.TCPConnector(limit=self.pool_maxsize, force_close=True)
+
     @property
     def started(self):
         return self.http_session is not None and (self.anonymous() or self.authorized())
@@ -128,6 +168,9 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
         logger.info("Authenticating to the server.")
         if self.credentials is None:
             raise AuthenticationException("Missing credentials.")
+        if self._shared_oauth_session is not None and self._shared_oauth_session.authorized():
+            self.oauth_session = self._shared_oauth_session.share(self.http_session)
+            return
         if self.credentials.is_xauth:
             self.oauth_session = self.xauth_session_class(
                 self.credentials, self.http_session, self.server
@@ -192,6 +235,32 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
 
         return WolframAPIResponseBuilder.build(response)
 
+    def call_many(
+        self, api, inputs, concurrency=10, ordered=True, max_retries=3, backoff=0.5, **kwargs
+    ):
+        """Call a given API once for each dictionary of input parameters from `inputs`, and return an asynchronous
+        iterator over the responses.
+
+        `inputs` is an iterable or an asynchronous iterable. It is consumed as calls complete, so that it can stream
+        input parameters from a large source. At most `concurrency` calls are in flight, or completed and waiting for
+        the iteration to reach them.
+
+        With `ordered`, responses are returned in the order of `inputs`. Otherwise, tuples `(index, response)` are
+        returned as calls complete, where `index` is the position of the input parameters in `inputs`::
+
+            async for index, response in session.call_many(api, rows, ordered=False):
+                scores[index] = await response.get()
+
+        Calls answered with a :attr:`~wolframclient.evaluation.result.WolframAPIResponse.retryable` response, e.g.
+        status 429 or 503, are sent again up to `max_retries` times. The delay before a new attempt starts at `backoff`
+        seconds and doubles each time, unless the server advised a longer one.
+
+        Other parameters are passed to :func:`~wolframclient.evaluation.WolframCloudAsyncSession.call`.
+        """
+        return _APICallIterator(
+            self, api, inputs, concurrency, ordered, max_retries, backoff, kwargs
+        )
+
     async def _post(self, url, headers={}, data=None, params={}):
         """Do a POST request, signing the content only if authentication has been successful."""
         if not self.started:
@@ -209,7 +278,13 @@ class WolframCloudAsyncSession(WolframAsyncEvaluator):
             )
 
     async def _call_evaluation_api(self, expr, **kwargs):
-        data = aiohttp.BytesPayload(export(expr, target_format="wl", **kwargs))
+        data, content_type = encode_evaluation_input(
+            expr, target_format=self.evaluation_format, compress=self.compress, **kwargs
+        )
+        if content_type:
+            data = aiohttp.BytesPayload(data, content_type=content_type)
+        else:
+            data = aiohttp.BytesPayload(data)
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Sending expression to cloud server for evaluation: %s", data)
         response = await self._post(self.evaluation_api_url, data=data)
@@ -254,6 +329,105 @@ class WolframAPICallAsync(WolframAPICallBase):
         )
 
 
+class _APICallIterator:
+    """Asynchronous iterator over the responses of
+    :func:`~wolframclient.evaluation.WolframCloudAsyncSession.call_many`."""
+
+    def __init__(self, session, api, inputs, concurrency, ordered, max_retries, backoff, kwargs):
+        if concurrency <= 0:
+            raise ValueError(
+                "Invalid concurrency value %i. Expecting a positive integer." % concurrency
+            )
+        self.session = session
+        self.api = api
+        self.concurrency = concurrency
+        self.ordered = ordered
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.kwargs = kwargs
+        if hasattr(inputs, "__aiter__"):
+            self._inputs = inputs.__aiter__()
+            self._asynchronous = True
+        else:
+            self._inputs = iter(inputs)
+            self._asynchronous = False
+        self._exhausted = False
+        self._index = 0
+        # calls in flight, in input order, and completed calls not yet returned when unordered.
+        self._pending = deque()
+        self._completed = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.session.started:
+            await self.session.start()
+        try:
+            await self._fill()
+            if self.ordered:
+                if not self._pending:
+                    raise StopAsyncIteration
+                return await self._pending.popleft()
+            if not self._completed:
+                if not self._pending:
+                    raise StopAsyncIteration
+                done, _ = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    self._pending.remove(task)
+                    self._completed.append(task)
+            return self._completed.popleft().result()
+        except StopAsyncIteration:
+            raise
+        except BaseException:
+            self.cancel()
+            raise
+
+    async def _fill(self):
+        while not self._exhausted and len(self._pending) + len(self._completed) < self.concurrency:
+            try:
+                if self._asynchronous:
+                    parameters = await self._inputs.__anext__()
+                else:
+                    parameters = next(self._inputs)
+            except (StopIteration, StopAsyncIteration):
+                self._exhausted = True
+                return
+            self._pending.append(asyncio.ensure_future(self._call(self._index, parameters)))
+            self._index += 1
+
+    async def _call(self, index, parameters):
+        delay = self.backoff
+        attempt = 0
+        while True:
+            response = await self.session.call(self.api, input_parameters=parameters, **self.kwargs)
+            if not response.retryable or attempt >= self.max_retries:
+                break
+            # read the body to release the connection.
+            await response.build()
+            retry_after = getattr(response, "retry_after", None)
+            logger.info(
+                "Call %i failed with status %i, retrying in %.2fs.",
+                index,
+                response.status,
+                max(delay, retry_after or 0),
+            )
+            await asyncio.sleep(max(delay, retry_after or 0))
+            delay *= 2
+            attempt += 1
+        if self.ordered:
+            return response
+        return index, response
+
+    def cancel(self):
+        """Cancel the calls in flight."""
+        for task in self._pending:
+            task.cancel()
+        self._pending.clear()
+        self._completed.clear()
+        self._exhausted = True
+
+
 ### Some internal utilities focused on cloud data manipulation and
 # formatting for http requests, based on aiohttp objects.
 
@@ -62,7 +62,7 @@ class OAuthAIOHttpAsyncSessionBase(OAuthAsyncSessionBase):
             body = buffer.getvalue()
             req_headers["Content-Type"] = "application/x-www-form-urlencoded"
 
-        uri, req_headers, signed_body = self._client.sign(
+        uri, req_headers, signed_body = self._signer.sign(
             uri,
             method,
             body=body if form_encoded else None,
@@ -1,8 +1,13 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+import binascii
+import copy
+import hashlib
+import hmac
 import json
 from io import IOBase
 
+from wolframclient.serializers import export
 from wolframclient.utils import six
 from wolframclient.utils.api import oauth, urllib
 
@@ -11,8 +16,12 @@ __all__ = [
     "UserIDPassword",
     "OAuthSessionBase",
     "OAuthAsyncSessionBase",
+    "encode_evaluation_input",
 ]
 
+#: content type of evaluation request bodies, by serialization format. InputForm text is sent without one.
+EVALUATION_CONTENT_TYPES = {"wl": None, "wxf": "application/vnd.wolfram.wxf"}
+
 
 class SecuredAuthenticationKey:
     """Represents a Secured Authentication Key generated using the Wolfram Language
@@ -62,6 +71,7 @@ class OAuthSessionBase:
         self.signature_method = signature_method or oauth.SIGNATURE_HMAC
         self.client_class = client_class
         self._client = None
+        self._signer = None
         self._oauth_token = None
         self._oauth_token_secret = None
         self.server = server
@@ -83,6 +93,14 @@ class OAuthSessionBase:
             and bool(self._client.resource_owner_secret)
         )
 
+    def share(self, http_session):
+        """Return a copy of this session sending requests with `http_session`.
+
+        The copy shares the tokens of this session, and does not have to authenticate again."""
+        shared = copy.copy(self)
+        shared.http_session = http_session
+        return shared
+
     def _update_client(self):
         self._client = self.client_class(
             self.consumer_key,
@@ -93,6 +111,7 @@ class OAuthSessionBase:
             realm=self.server.cloudbase,
             encoding="iso-8859-1",
         )
+        self._signer = _OAuthSigner(self._client)
 
     def _update_token_from_request_body(self, body):
         try:
@@ -105,6 +124,117 @@ class OAuthSessionBase:
             self._oauth_token_secret = token[b"oauth_token_secret"][0]
 
 
+class _OAuthSigner:
+    """Sign requests like :meth:`oauthlib.oauth1.Client.sign`, reusing what does not change between requests.
+
+    The signing key, the protocol parameters and the normalized URI of each endpoint are computed once. The
+    parameters of recently signed small bodies are kept, so that replaying the same inputs only computes a nonce, a
+    timestamp and the signature. Requests signed with another method, or with an unexpected body, are signed by the
+    client.
+    """
+
+    #: number of endpoints and bodies whose parameters are kept.
+    CACHE_SIZE = 256
+    #: length of the longest body whose parameters are kept, so that the cache holds a few megabytes at most.
+    MAX_CACHED_BODY_LENGTH = 2048
+
+    def __init__(self, client):
+        self.client = client
+        self.enabled = (
+            client.signature_method == oauth.SIGNATURE_HMAC
+            and client.signature_type == oauth.SIGNATURE_TYPE_AUTH_HEADER
+            and not client.callback_uri
+            and not client.verifier
+        )
+        if not self.enabled:
+            return
+        key = "{}&{}".format(
+            oauth.escape(client.client_secret or ""),
+            oauth.escape(client.resource_owner_secret or ""),
+        )
+        self._hmac = hmac.new(key.encode("utf-8"), digestmod=hashlib.sha1)
+        params = [
+            ("oauth_version", "1.0"),
+            ("oauth_signature_method", client.signature_method),
+            ("oauth_consumer_key", client.client_key),
+        ]
+        if client.resource_owner_key:
+            params.append(("oauth_token", client.resource_owner_key))
+        self._params = _escape_params(params)
+        self._header = ", ".join('{}="{}"'.format(k, v) for k, v in self._params)
+        self._endpoints = {}
+        self._bodies = {}
+
+    def sign(self, uri, http_method="GET", body=None, headers=None, realm=None):
+        headers = dict(headers or ())
+        if not self.enabled or (
+            body is not None
+            and headers.get("Content-Type") != "application/x-www-form-urlencoded"
+        ):
+            return self.client.sign(
+                uri, http_method=http_method, body=body, headers=headers, realm=realm
+            )
+        endpoint = self._endpoints.get(uri)
+        if endpoint is None:
+            endpoint = (
+                oauth.escape(oauth.base_string_uri(uri)),
+                _escape_params(oauth.urldecode(urllib.urlparse(uri).query)),
+            )
+            _cache(self._endpoints, uri, endpoint, self.CACHE_SIZE)
+        base_uri, params = endpoint
+        params = list(params)
+        if body is not None:
+            if isinstance(body, six.binary_type):
+                body = body.decode(self.client.encoding or "utf-8")
+            cached = len(body) <= self.MAX_CACHED_BODY_LENGTH
+            body_params = self._bodies.get(body) if cached else None
+            if body_params is None:
+                decoded = oauth.extract_params(body)
+                if decoded is None:
+                    # let the client report the invalid body.
+                    return self.client.sign(
+                        uri, http_method=http_method, body=body, headers=headers, realm=realm
+                    )
+                body_params = _escape_params(decoded)
+                if cached:
+                    _cache(self._bodies, body, body_params, self.CACHE_SIZE)
+            params.extend(body_params)
+        # nonces and timestamps are made of digits, which are never escaped.
+        nonce = oauth.generate_nonce()
+        timestamp = oauth.generate_timestamp()
+        params.append(("oauth_nonce", nonce))
+        params.append(("oauth_timestamp", timestamp))
+        params.extend(self._params)
+        params.sort()
+        normalized = "&".join("{}={}".format(k, v) for k, v in params)
+        signer = self._hmac.copy()
+        signer.update(
+            "{}&{}&{}".format(http_method.upper(), base_uri, oauth.escape(normalized)).encode(
+                "utf-8"
+            )
+        )
+        signature = binascii.b2a_base64(signer.digest())[:-1].decode("utf-8")
+        realm = realm or self.client.realm
+        headers["Authorization"] = 'OAuth {}oauth_nonce="{}", oauth_timestamp="{}", {}, oauth_signature="{}"'.format(
+            'realm="%s", ' % realm if realm else "",
+            nonce,
+            timestamp,
+            self._header,
+            oauth.escape(signature),
+        )
+        return uri, headers, body
+
+
+def _escape_params(params):
+    return tuple((oauth.escape(k), oauth.escape(v)) for k, v in params)
+
+
+def _cache(cache, key, value, size):
+    if len(cache) >= size:
+        cache.clear()
+    cache[key] = value
+
+
 class OAuthAsyncSessionBase(OAuthSessionBase):
     async def authenticate(self):
         """Asynchronous OAuth authentication class dealing with various tokens and signing requests."""
@@ -189,3 +319,23 @@ class WolframAPICallBase:
 
     def __str__(self):
         return repr(self)
+
+
+def encode_evaluation_input(expr, target_format="wl", compress=False, **kwargs):
+    """Serialize `expr` as the body of an evaluation request, and return it with its content type.
+
+    `target_format` is either ``'wl'``, to send InputForm text, or ``'wxf'``. WXF bodies are smaller and faster to
+    parse, in particular for numeric arrays which InputForm embeds as base64 encoded WXF. Set `compress` to zlib
+    compress a WXF body.
+    """
+    try:
+        content_type = EVALUATION_CONTENT_TYPES[target_format]
+    except KeyError:
+        raise ValueError(
+            "Invalid evaluation format {}. Choices are: {}".format(
+                target_format, ", ".join(EVALUATION_CONTENT_TYPES.keys())
+            )
+        )
+    if target_format == "wxf":
+        kwargs["compress"] = compress
+    return export(expr, target_format=target_format, **kwargs), content_type
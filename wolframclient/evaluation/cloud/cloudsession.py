@@ -3,15 +3,17 @@ from __future__ import absolute_import, print_function, unicode_literals
 import logging
 
 from wolframclient.evaluation.base import WolframEvaluator
-from wolframclient.evaluation.cloud.base import WolframAPICallBase
+from wolframclient.evaluation.cloud.base import WolframAPICallBase, encode_evaluation_input
 from wolframclient.evaluation.cloud.oauth import OAuth1RequestsSyncSession as OAuthSession
 from wolframclient.evaluation.cloud.oauth import XAuthRequestsSyncSession as XAuthSession
 from wolframclient.evaluation.cloud.server import WOLFRAM_PUBLIC_CLOUD_SERVER
 from wolframclient.evaluation.result import (
     WolframAPIResponseBuilder,
     WolframCloudEvaluationWXFResponse,
+    WolframEvaluationDataResult,
 )
 from wolframclient.exception import AuthenticationException
+from wolframclient.language import wl
 from wolframclient.serializers import export
 from wolframclient.utils import six
 from wolframclient.utils.api import futures, json, requests
@@ -41,6 +43,14 @@ class WolframCloudSession(WolframEvaluator):
     It is strongly advised to reuse a session to make multiple calls to mitigate the cost of initialization.
 
     `max_workers` can be specified and is passed to the :class:`~concurrent.futures.ThreadPoolExecutor` used for future methods.
+
+    Connections to the server are kept alive and reused, along with their TLS session, by up to `pool_maxsize`
+    concurrent requests. It defaults to `max_workers`, so that each worker keeps its connection. Set `keep_alive` to
+    :data:`False` to close connections after each request.
+
+    Expressions are sent for evaluation as InputForm text when `evaluation_format` is ``'wl'``, or as WXF when it is
+    ``'wxf'``, which is smaller and cheaper to parse on the server for array-heavy expressions. Set `compress` to
+    zlib compress WXF request bodies.
     """
 
     def __init__(
@@ -52,6 +62,10 @@ class WolframCloudSession(WolframEvaluator):
         xauth_session_class=None,
         http_sessionclass=None,
         max_workers=4,
+        evaluation_format="wl",
+        compress=False,
+        pool_maxsize=None,
+        keep_alive=True,
     ):
         super().__init__(inputform_string_evaluation=inputform_string_evaluation)
         self.server = server or WOLFRAM_PUBLIC_CLOUD_SERVER
@@ -63,12 +77,21 @@ class WolframCloudSession(WolframEvaluator):
         self.xauth_session_class = xauth_session_class or XAuthSession
         self.oauth_session_class = oauth_session_class or OAuthSession
         self.oauth_session = None
+        # an authenticated session of the session this one duplicates.
+        self._shared_oauth_session = None
         self.verify = self.server.certificate
         self._pool = None
         self._max_workers = max_workers
+        self.evaluation_format = evaluation_format
+        self.compress = compress
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
 
     def duplicate(self):
-        return self.__class__(
+        """Return a new session with the same configuration.
+
+        If this session is authenticated, the new session shares its tokens instead of authenticating again."""
+        session = self.__class__(
             credentials=self.credentials,
             server=self.server,
             inputform_string_evaluation=self.inputform_string_evaluation,
@@ -76,7 +99,14 @@ class WolframCloudSession(WolframEvaluator):
             xauth_session_class=self.xauth_session_class,
             http_sessionclass=self.http_sessionclass,
             max_workers=self._max_workers,
+            evaluation_format=self.evaluation_format,
+            compress=self.compress,
+            pool_maxsize=self.pool_maxsize,
+            keep_alive=self.keep_alive,
         )
+        if self.authorized():
+            session._shared_oauth_session = self.oauth_session
+        return session
 
     @property
     def started(self):
@@ -87,10 +117,25 @@ class WolframCloudSession(WolframEvaluator):
         if not self.started:
             if self.http_session is None:
                 self.http_session = self.http_sessionclass()
-                self.http_session.headers = {"User-Agent": "WolframClientForPython/1.0"}
+                self.http_session.headers = {
+                    "User-Agent": "WolframClientForPython/1.0",
+                    "Accept-Encoding": "gzip, deflate",
+                }
+                self._configure_connections()
             if not self.anonymous():
                 self._authenticate()
 
+    def _configure_connections(self):
+        """Size the connection pools of the HTTP session to the number of concurrent requests."""
+        if not self.keep_alive:
+            self.http_session.headers["Connection"] = "close"
+        if isinstance(self.http_session, requests.Session):
+            # the default pools keep 10 connections, others are closed once used. One pool is kept for each of the
+            # last 10 hosts, as by default.
+            adapter = requests.HTTPAdapter(pool_maxsize=self.pool_maxsize or self._max_workers)
+            self.http_session.mount("https://", adapter)
+            self.http_session.mount("http://", adapter)
+
     def stop(self):
         self._stop(gracefully=True)
 
@@ -122,6 +167,9 @@ class WolframCloudSession(WolframEvaluator):
         logger.info("Authenticating to the server.")
         if self.credentials is None:
             raise AuthenticationException("Missing credentials.")
+        if self._shared_oauth_session is not None and self._shared_oauth_session.authorized():
+            self.oauth_session = self._shared_oauth_session.share(self.http_session)
+            return
         if self.credentials.is_xauth:
             self.oauth_session = self.xauth_session_class(
                 self.credentials,
@@ -139,19 +187,28 @@ class WolframCloudSession(WolframEvaluator):
             )
         self.oauth_session.authenticate()
 
-    def _post(self, url, headers={}, body={}, files={}, params={}):
-        """Do a POST request, signing the content only if authentication has been successful."""
+    def _post(self, url, headers={}, body={}, files={}, params={}, stream=False):
+        """Do a POST request, signing the content only if authentication has been successful.
+
+        Set `stream` to read the response body while it is decoded. The connection is then held until the body is
+        read or the response closed."""
         self.ensure_started()
         headers["User-Agent"] = "WolframClientForPython/1.0"
         if self.authorized():
             logger.info("Authenticated call to api %s", url)
             return self.oauth_session.signed_request(
-                url, headers=headers, body=body, files=files
+                url, headers=headers, body=body, files=files, stream=stream
             )
         else:
             logger.info("Anonymous call to api %s", url)
             return self.http_session.post(
-                url, params=params, headers=headers, data=body, files=files, verify=self.verify
+                url,
+                params=params,
+                headers=headers,
+                data=body,
+                files=files,
+                verify=self.verify,
+                stream=stream,
             )
 
     def ensure_started(self):
@@ -211,11 +268,18 @@ class WolframCloudSession(WolframEvaluator):
         return WolframAPIResponseBuilder.build(response)
 
     def _call_evaluation_api(self, expr, **kwargs):
-        data = export(expr, target_format="wl", **kwargs)
+        data, content_type = encode_evaluation_input(
+            expr, target_format=self.evaluation_format, compress=self.compress, **kwargs
+        )
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Sending expression to cloud server for evaluation: %s", data)
-        response = self._post(self.evaluation_api_url, body=data)
-        return WolframCloudEvaluationWXFResponse(response)
+        headers = {"Content-Type": content_type} if content_type else {}
+        response = self._post(self.evaluation_api_url, headers=headers, body=data, stream=True)
+        try:
+            return WolframCloudEvaluationWXFResponse(response)
+        except BaseException:
+            response.close()
+            raise
 
     def evaluate(self, expr, **kwargs):
         """Send `expr` to the cloud for evaluation and return the result.
@@ -231,6 +295,24 @@ class WolframCloudSession(WolframEvaluator):
         """
         return self._call_evaluation_api(self.normalize_input(expr), **kwargs)
 
+    def evaluate_batch_wrap(self, exprs, **kwargs):
+        """Send a batch of expressions to the cloud in a single request, and return the list of result objects.
+
+        Each expression is evaluated in order by :wl:`EvaluationData`, and its result is a
+        :class:`~wolframclient.evaluation.result.WolframEvaluationDataResult`.
+        """
+        batch = wl.List(*(wl.EvaluationData(self.normalize_input(expr)) for expr in exprs))
+        response = self._call_evaluation_api(batch, **kwargs)
+        return [WolframEvaluationDataResult(data) for data in response.get()]
+
+    def evaluate_batch(self, exprs, **kwargs):
+        """Send a batch of expressions to the cloud in a single request, and return the list of their results.
+
+        Contrary to :func:`~wolframclient.evaluation.cloud.cloudsession.WolframCloudSession.evaluate_many`, the
+        overhead of a request is paid once per batch.
+        """
+        return [result.get() for result in self.evaluate_batch_wrap(exprs, **kwargs)]
+
     # Future methods
 
     @property
@@ -49,7 +49,7 @@ class OAuthRequestsSyncSessionBase(OAuthSessionBase):
             msg = "Request failed with status %i" % response.status_code
             raise AuthenticationException(response, msg=msg)
 
-    def signed_request(self, uri, headers={}, body={}, files={}, method="POST"):
+    def signed_request(self, uri, headers={}, body={}, files={}, method="POST", stream=False):
         if not self.authorized():
             self.authenticate()
 
@@ -85,7 +85,7 @@ class OAuthRequestsSyncSessionBase(OAuthSessionBase):
                 logger.fatal("Invalid body: %s", body)
                 raise ValueError("Body must be dict or string type.")
 
-        uri, req_headers, signed_body = self._client.sign(
+        uri, req_headers, signed_body = self._signer.sign(
             uri,
             method,
             body=encoded_body if sign_body else None,
@@ -104,6 +104,7 @@ class OAuthRequestsSyncSessionBase(OAuthSessionBase):
             data=signed_body if sign_body else body,
             files=files,
             verify=self.verify,
+            stream=stream,
         )
 
 
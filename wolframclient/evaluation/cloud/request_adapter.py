@@ -5,6 +5,9 @@ from wolframclient.utils.encoding import force_text
 
 __all__ = ["wrap_response"]
 
+#: size of the body chunks read from streamed responses.
+CHUNK_SIZE = 64 * 1024
+
 
 class HTTPResponseAdapterBase:
     """Unify various request classes as a unique API."""
@@ -33,6 +36,16 @@ class HTTPResponseAdapterBase:
         """Request body as raw bytes"""
         return self.response.content
 
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Iterate over the body by chunks, decoding gzip or deflate content encodings.
+
+        The body is only read as it is consumed when the request was sent with `stream` set."""
+        return self.response.iter_content(chunk_size)
+
+    def close(self):
+        """Release the connection of the response."""
+        self.response.close()
+
     def url(self):
         """String URL."""
         return force_text(self.response.url)
@@ -62,6 +75,12 @@ class AIOHttpHTTPRequestAdapter(HTTPResponseAdapterBase):
     async def content(self):
         return await self.response.read()
 
+    async def read_chunk(self):
+        """Next chunk of the body as it arrives, or empty bytes once the body was read.
+
+        Chunks are decompressed when the server used a gzip or deflate content encoding."""
+        return await self.response.content.readany()
+
 
 def wrap_response(response):
     if isinstance(response, requests.Response):
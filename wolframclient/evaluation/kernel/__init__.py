@@ -2,5 +2,6 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 from wolframclient.evaluation.kernel.asyncsession import WolframLanguageAsyncSession
 from wolframclient.evaluation.kernel.localsession import WolframLanguageSession
+from wolframclient.evaluation.kernel.standby import WolframKernelStandby
 
-__all__ = ["WolframLanguageSession", "WolframLanguageAsyncSession"]
+__all__ = ["WolframLanguageSession", "WolframLanguageAsyncSession", "WolframKernelStandby"]
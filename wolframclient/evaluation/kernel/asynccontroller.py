@@ -0,0 +1,358 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import logging
+from collections import deque
+from subprocess import PIPE
+
+from wolframclient.evaluation.kernel.kernelcontroller import (
+    TO_PY_LOG_LEVEL,
+    KernelLogger,
+    WolframKernelControllerBase,
+)
+from wolframclient.evaluation.kernel.zmqsocket import Socket
+from wolframclient.exception import WolframKernelException
+from wolframclient.utils.api import asyncio, json, time, zmq
+
+__all__ = ["WolframKernelAsyncController"]
+
+logger = logging.getLogger(__name__)
+
+
+class WolframKernelAsyncController(WolframKernelControllerBase):
+    """Control a Wolfram kernel from an :mod:`asyncio` event loop.
+
+    This controller is the counterpart of :class:`~wolframclient.evaluation.kernel.kernelcontroller.WolframKernelController`
+    used by :class:`~wolframclient.evaluation.WolframLanguageAsyncSession`. The kernel process is started with
+    :func:`asyncio.create_subprocess_exec` and communicates through :mod:`zmq.asyncio` sockets, so that no thread is
+    dedicated to the kernel. Results are read by a single task, which wakes up as soon as a result arrives or the
+    kernel process exits.
+
+    Evaluations are pipelined up to the session parameter ``'PIPELINE_DEPTH'``. All the coroutines of a controller
+    must be awaited from the same event loop.
+    """
+
+    def __init__(
+        self,
+        kernel=None,
+        initfile=None,
+        consumer=None,
+        kernel_loglevel=logging.NOTSET,
+        stdin=PIPE,
+        stdout=PIPE,
+        stderr=PIPE,
+        **kwargs,
+    ):
+        self._configure(
+            kernel=kernel,
+            initfile=initfile,
+            consumer=consumer,
+            kernel_loglevel=kernel_loglevel,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            **kwargs,
+        )
+        self.kernel_socket_in = None
+        self.kernel_socket_out = None
+        self.kernel_logger_socket = None
+        self.kernel_proc = None
+        self.evaluation_count = 0
+        # futures of the expressions sent to the kernel in order, with their callback, whether they are a batch, and
+        # the time they were sent.
+        self._in_flight = deque()
+        self._exited = None
+        self._tasks = []
+        self._pipeline = None
+        self._send_lock = None
+        # serializes concurrent calls to start.
+        self._start_lock = None
+        self._started = False
+        self._terminated = False
+
+    @property
+    def started(self):
+        """Is the kernel started and ready to evaluate expressions."""
+        return self._started and not self._terminated
+
+    @property
+    def terminated(self):
+        """Is the controller terminated. Terminated controllers no more handle evaluations."""
+        return self._terminated
+
+    def is_kernel_alive(self):
+        """Return the status of the kernel process."""
+        return self.kernel_proc is not None and self.kernel_proc.returncode is None
+
+    async def start(self):
+        """Start the kernel and wait until it is ready. Calling this coroutine twice is a no-op.
+
+        Concurrent calls start a single kernel: they wait for the first one to complete."""
+        if self.started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.started:
+                return
+            if self._terminated:
+                raise WolframKernelException("Cannot start a terminated controller.")
+            try:
+                await self._kernel_start()
+            except BaseException:
+                logger.warning("Failed to start.")
+                await self._kernel_stop(gracefully=False)
+                raise
+            self._started = True
+
+    async def _kernel_start(self):
+        context = zmq.AsyncContext.instance()
+        # Socket to which we push new expressions for evaluation.
+        self.kernel_socket_out = Socket(zmq_type=zmq.PUSH, context=context)
+        self.kernel_socket_in = Socket(zmq_type=zmq.PULL, context=context)
+        self.kernel_socket_out.bind(**self.bind_options("out"))
+        self.kernel_socket_in.bind(**self.bind_options("in"))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Kernel writes commands to socket: %s", self.kernel_socket_out)
+            logger.info(
+                "Kernel receives evaluated expressions from socket: %s", self.kernel_socket_in
+            )
+        if self.loglevel != logging.NOTSET:
+            self.kernel_logger_socket = Socket(zmq_type=zmq.SUB, context=context)
+            self.kernel_logger_socket.bind(**self.bind_options("log"))
+            # Subscribe to all since we want all log messages.
+            self.kernel_logger_socket.zmq_socket.setsockopt(zmq.SUBSCRIBE, b"")
+            cmd = self.kernel_command(logger_uri=self.kernel_logger_socket.uri)
+        else:
+            cmd = self.kernel_command()
+        t_start = time.perf_counter()
+        try:
+            self.kernel_proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=self._stdin,
+                stdout=self._stdout,
+                stderr=self._stderr,
+                startupinfo=self.startupinfo(),
+            )
+        except Exception as e:
+            logger.exception(e)
+            raise WolframKernelException("Failed to start kernel process.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Kernel process started with PID: %s" % self.kernel_proc.pid)
+        self._exited = asyncio.ensure_future(self.kernel_proc.wait())
+        # First message must be "OK", acknowledging everything is up and running on the kernel side.
+        try:
+            response = await self._recv(timeout=self.get_parameter("STARTUP_TIMEOUT"))
+        except (WolframKernelException, asyncio.TimeoutError) as e:
+            if self.kernel_proc.returncode == self._KERNEL_VERSION_NOT_SUPPORTED:
+                raise WolframKernelException(
+                    "Wolfram kernel version is not supported. Please consult library prerequisites."
+                )
+            logger.warning("Socket exception: %s", e)
+            raise WolframKernelException("Failed to communicate with kernel: %s." % self.kernel)
+        if response.bytes != self._KERNEL_OK:
+            raise WolframKernelException("Kernel %s failed to start properly." % self.kernel)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Kernel {} is ready. Startup took {:.2f} seconds.".format(
+                    self.pid, time.perf_counter() - t_start
+                )
+            )
+        self._pipeline = asyncio.Semaphore(max(self.get_parameter("PIPELINE_DEPTH"), 1))
+        self._send_lock = asyncio.Lock()
+        self._tasks.append(asyncio.ensure_future(self._read_results()))
+        if self.kernel_logger_socket is not None:
+            self._tasks.append(asyncio.ensure_future(self._read_logs()))
+
+    async def _recv(self, timeout=None):
+        """Receive the next message from the kernel, or raise as soon as the kernel process exits."""
+        received = asyncio.ensure_future(self.kernel_socket_in.recv(copy=False))
+        try:
+            done, _ = await asyncio.wait(
+                (received, self._exited), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            if not received.done():
+                received.cancel()
+        if received in done:
+            return received.result()
+        if self._exited in done:
+            logger.info("Kernel process is not running anymore.")
+            raise WolframKernelException("Kernel is not running anymore.")
+        raise asyncio.TimeoutError(
+            "Failed to read any message from socket %s after %.1f seconds."
+            % (self.kernel_socket_in.uri, timeout)
+        )
+
+    async def _read_results(self):
+        try:
+            while True:
+                frame = await self._recv()
+                if not self._in_flight:
+                    logger.warning("Unexpected message received from kernel.")
+                    continue
+                future, result_update_callback, is_batch, start = self._in_flight.popleft()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Expression received from kernel after %.06fsec",
+                        time.perf_counter() - start,
+                    )
+                try:
+                    result = self._build_results(frame.buffer, is_batch, result_update_callback)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+                # the future is cancelled when the evaluation is no longer awaited.
+                if not future.done():
+                    future.set_result(result)
+        except WolframKernelException as e:
+            # the kernel died, no more evaluation can be served.
+            self._terminated = True
+            self._fail_in_flight(e)
+
+    def _log_message(self, kernel_logger, msg):
+        level = TO_PY_LOG_LEVEL.get(msg.get("level", 3))
+        kernel_logger.log(level, msg.get("msg", 'Malformed kernel message. Missing key "msg".'))
+
+    async def _read_logs(self):
+        kernel_logger = self._kernel_logger()
+        while True:
+            try:
+                msg = await self.kernel_logger_socket.zmq_socket.recv_json()
+            except json.JSONDecodeError as e:
+                logger.warning("Invalid message: %s", e.doc)
+            else:
+                self._log_message(kernel_logger, msg)
+
+    def _kernel_logger(self):
+        kernel_logger = logging.getLogger("WolframKernel-<%s>" % self.kernel_logger_socket.uri)
+        kernel_logger.setLevel(self.loglevel)
+        return kernel_logger
+
+    async def _drain_logs(self):
+        """Log the messages the kernel sent before it stopped."""
+        kernel_logger = self._kernel_logger()
+        for _ in range(KernelLogger.MAX_MESSAGE_BEFORE_QUIT):
+            try:
+                msg = await self.kernel_logger_socket.zmq_socket.recv_json(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                return
+            except json.JSONDecodeError as e:
+                logger.warning("Invalid message: %s", e.doc)
+            else:
+                self._log_message(kernel_logger, msg)
+        logger.warning(
+            "The maximum number of messages to log after a session finishes has been reached. "
+            "Some messages may have been discarded."
+        )
+
+    async def _submit(self, wxf, is_batch, result_update_callback):
+        if not self.started:
+            raise WolframKernelException("Kernel is not running.")
+        async with self._pipeline:
+            if self._terminated:
+                raise WolframKernelException("Kernel is not running anymore.")
+            future = asyncio.Future()
+            async with self._send_lock:
+                self._in_flight.append(
+                    (future, result_update_callback, is_batch, time.perf_counter())
+                )
+                # once queued, the expression must be sent for the results to match their futures.
+                await asyncio.shield(self.kernel_socket_out.send(wxf, copy=False))
+            return await future
+
+    async def evaluate(self, wxf, result_update_callback=None):
+        """Evaluate the WXF serialized expression `wxf` and return the result.
+
+        The result is a :class:`~wolframclient.evaluation.result.WolframKernelEvaluationResult` updated with
+        `result_update_callback`, if any.
+        """
+        return await self._submit(wxf, False, result_update_callback)
+
+    async def evaluate_batch(self, wxf, result_update_callback=None):
+        """Evaluate a batch of expressions serialized as a single WXF `ClientLibrary`Private`EvaluateBatch` function.
+
+        Return the list of the results of each expression, updated with `result_update_callback`.
+        """
+        return await self._submit(wxf, True, result_update_callback)
+
+    def _fail_in_flight(self, exception):
+        while self._in_flight:
+            future = self._in_flight.popleft()[0]
+            if not future.done():
+                future.set_exception(exception)
+
+    async def stop(self):
+        """Wait for the pending evaluations, then stop the kernel."""
+        await self._kernel_stop(gracefully=True)
+
+    async def terminate(self):
+        """Stop the kernel immediately. Pending evaluations fail."""
+        await self._kernel_stop(gracefully=False)
+
+    async def _kernel_stop(self, gracefully=True):
+        logger.info("Start termination on kernel %s", self)
+        self._terminated = True
+        pending = [entry[0] for entry in self._in_flight]
+        if gracefully and pending:
+            await asyncio.wait(pending)
+        if self.is_kernel_alive():
+            error = not gracefully
+            if gracefully:
+                # Graceful stop: first send a Quit command to the kernel.
+                try:
+                    await self.kernel_socket_out.send(b"8:f\x00s\x04Quit", flags=zmq.NOBLOCK)
+                except Exception:
+                    logger.info("Failed to send Quit[] command to the kernel.")
+                    error = True
+                if not error:
+                    _, running = await asyncio.wait(
+                        (self._exited,), timeout=self.get_parameter("TERMINATE_TIMEOUT")
+                    )
+                    if running:
+                        logger.info(
+                            "Kernel process failed to stop after %.02f seconds. Killing it."
+                            % self.get_parameter("TERMINATE_TIMEOUT")
+                        )
+                        error = True
+            if self.kernel_proc.stdin is not None:
+                self.kernel_proc.stdin.close()
+            if error:
+                logger.info("Killing kernel process: %i" % self.kernel_proc.pid)
+                self.kernel_proc.kill()
+                await self.kernel_proc.wait()
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+        self._tasks = []
+        if self._exited is not None and not self._exited.done():
+            self._exited.cancel()
+        self._fail_in_flight(WolframKernelException("Kernel is not running anymore."))
+        if self.kernel_logger_socket is not None:
+            try:
+                await self._drain_logs()
+            finally:
+                self.kernel_logger_socket.close()
+                self.kernel_logger_socket = None
+        for socket in (self.kernel_socket_out, self.kernel_socket_in):
+            if socket is not None:
+                try:
+                    socket.close()
+                except Exception as e:
+                    logger.fatal(e)
+        self.kernel_socket_out = self.kernel_socket_in = None
+        self.remove_ipc_directory()
+        self.kernel_proc = None
+
+    def __repr__(self):
+        if self.started:
+            return '<%s[✅], "%s", pid:%i, kernel sockets: (in:%s, out:%s)>' % (
+                self.__class__.__name__,
+                self.kernel,
+                self.kernel_proc.pid,
+                self.kernel_socket_in.uri,
+                self.kernel_socket_out.uri,
+            )
+        else:
+            return '<{}[❌], "{}">'.format(self.__class__.__name__, self.kernel)
@@ -4,7 +4,10 @@ import logging
 from subprocess import PIPE
 
 from wolframclient.evaluation.base import WolframAsyncEvaluator
+from wolframclient.evaluation.kernel.asynccontroller import WolframKernelAsyncController
 from wolframclient.evaluation.kernel.localsession import WolframLanguageSession
+from wolframclient.language import wl
+from wolframclient.serializers import export
 from wolframclient.utils.api import asyncio
 
 logger = logging.getLogger(__name__)
@@ -22,12 +25,14 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
         async with WolframLanguageAsyncSession() as session:
             await session.evaluate('Now')
 
-    Coroutines all run in their own thread. Since a Wolfram kernel is single threaded, there can
-    be only one evaluation at a time. In a sense, from the event loop point of view, evaluations
-    are atomic operations. Even when many asynchronous sessions are started, the number of
-    threads equals the number of kernel instances running and should not be problematic. Ensuring
-    that only one thread runs all operations of a given Wolfram kernel significantly reduces the
-    complexity of the code without any real drawback.
+    The kernel is controlled from the event loop by a
+    :class:`~wolframclient.evaluation.kernel.asynccontroller.WolframKernelAsyncController`, using :mod:`zmq.asyncio`
+    sockets and an :mod:`asyncio` subprocess: no thread is dedicated to the kernel, and results are handled as soon as
+    they arrive. Since a Wolfram kernel is single threaded, there can be only one evaluation at a time. In a sense,
+    from the event loop point of view, evaluations are atomic operations.
+
+    Kernels of a :class:`~wolframclient.evaluation.WolframKernelStandby` are controlled from a thread, and cannot be
+    handed to an asynchronous session: `standby` is not supported.
     """
 
     def __init__(
@@ -40,8 +45,15 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
         stdout=PIPE,
         stderr=PIPE,
         inputform_string_evaluation=True,
+        controller_class=WolframKernelAsyncController,
+        standby=None,
         **kwargs,
     ):
+        if standby is not None:
+            raise ValueError(
+                "Standby kernels are controlled from a thread and cannot be used by %s."
+                % self.__class__.__name__
+            )
         super().__init__(
             kernel=kernel,
             consumer=consumer,
@@ -51,6 +63,7 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
             stdout=stdout,
             stderr=stderr,
             inputform_string_evaluation=inputform_string_evaluation,
+            controller_class=controller_class,
             **kwargs,
         )
 
@@ -64,14 +77,15 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
             stdout=self._stdout,
             stderr=self._stderr,
             inputform_string_evaluation=self.inputform_string_evaluation,
+            controller_class=self.controller_class,
             **self.parameters,
         )
 
     async def do_evaluate_future(self, expr, result_update_callback=None, **kwargs):
-        future = super().do_evaluate_future(
-            expr, result_update_callback=result_update_callback, **kwargs
+        wxf = export(self.normalize_input(expr), target_format="wxf", **kwargs)
+        return asyncio.ensure_future(
+            self.kernel_controller.evaluate(wxf, result_update_callback=result_update_callback)
         )
-        return asyncio.wrap_future(future)
 
     async def evaluate_future(self, expr, **kwargs):
         await self.ensure_started()
@@ -113,6 +127,39 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
         await future
         return future.result()
 
+    async def do_evaluate_batch_future(self, exprs, result_update_callback=None, **kwargs):
+        wxf = export(
+            wl.ClientLibrary.Private.EvaluateBatch(*map(self.normalize_input, exprs)),
+            target_format="wxf",
+            **kwargs,
+        )
+        return asyncio.ensure_future(
+            self.kernel_controller.evaluate_batch(
+                wxf, result_update_callback=result_update_callback
+            )
+        )
+
+    async def evaluate_batch_wrap_future(self, exprs, **kwargs):
+        await self.ensure_started()
+        return await self.do_evaluate_batch_future(exprs, **kwargs)
+
+    async def evaluate_batch_wrap(self, exprs, **kwargs):
+        """Evaluate a batch of expressions sent as a single message, and return the list of result objects.
+
+        This method is a coroutine."""
+        future = await self.evaluate_batch_wrap_future(exprs, **kwargs)
+        await future
+        return future.result()
+
+    async def evaluate_batch(self, exprs, **kwargs):
+        """Evaluate a batch of expressions sent as a single message, and return the list of their results.
+
+        This method is a coroutine."""
+        results = await self.evaluate_batch_wrap(exprs, **kwargs)
+        for result in results:
+            self.log_message_from_result(result)
+        return [result.get() for result in results]
+
     async def evaluate_many(self, expr_list):
         return await super().evaluate_many(expr_list)
 
@@ -131,8 +178,18 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
         """Asynchronously start the session.
 
         This method is a coroutine."""
-        future = super().start_future()
-        await asyncio.wrap_future(future)
+        self.stopped = False
+        if self.kernel_controller.terminated:
+            self.kernel_controller = self.kernel_controller.duplicate()
+        await self.kernel_controller.start()
+
+    def start_future(self):
+        """Request the Wolfram kernel to start and return an :mod:`asyncio` future."""
+        return asyncio.ensure_future(self.start())
+
+    def stop_future(self, gracefully=True):
+        """Request the Wolfram kernel to stop and return an :mod:`asyncio` future."""
+        return asyncio.ensure_future(self._async_terminate(gracefully))
 
     async def stop(self):
         """Asynchronously stop the session (graceful termination).
@@ -148,5 +205,8 @@ class WolframLanguageAsyncSession(WolframAsyncEvaluator, WolframLanguageSession)
 
     async def _async_terminate(self, gracefully):
         logger.info("Terminating asynchronous kernel session.")
-        future = super().stop_future(gracefully=gracefully)
-        await asyncio.wrap_future(future)
+        self.stopped = True
+        if gracefully:
+            await self.kernel_controller.stop()
+        else:
+            await self.kernel_controller.terminate()
@@ -161,10 +161,10 @@ addPrintHandler[] := Internal`AddHandler[
  	Composition[ClientLibrary`info, ReleaseHold]
 ];
 
-socketEventHandler[data_] := Block[
+SetAttributes[evaluationData, HoldAllComplete];
+evaluationData[input_] := Block[
 	{expr},
-	ClientLibrary`debug["Evaluating a new expression."];
-	expr = EvaluationData[BinaryDeserialize[data]];
+	expr = EvaluationData[input];
 	(* Produce inline InputForm string messages. *)
 	AssociateTo[
 		expr, {
@@ -175,6 +175,17 @@ socketEventHandler[data_] := Block[
 			]
 		}
 	];
+	expr
+];
+
+(* The expressions of a batch are evaluated in order, and answered with the list of their evaluation data. *)
+evaluateInput[Hold[EvaluateBatch[exprs___]]] := List @@ Map[evaluationData, Hold[exprs]];
+evaluateInput[Hold[input_]] := evaluationData[input];
+
+socketEventHandler[data_] := Block[
+	{expr},
+	ClientLibrary`debug["Evaluating a new expression."];
+	expr = evaluateInput[BinaryDeserialize[data, Hold]];
 	ClientLibrary`debug["Done evaluating."];
 	SocketWriteByteArrayFunc[
 		$OutputSocket,
@@ -1,6 +1,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import logging
+import shutil
+import tempfile
+from collections import deque
 from concurrent import futures
 from itertools import count as _count
 from queue import Queue
@@ -8,6 +11,7 @@ from subprocess import PIPE, Popen
 from threading import Event, RLock, Thread
 
 from wolframclient.evaluation.kernel.zmqsocket import (
+    AbortEvent,
     Socket,
     SocketAborted,
     SocketOperationTimeout,
@@ -22,7 +26,7 @@ from wolframclient.utils.functional import iterate
 if six.WINDOWS:
     from subprocess import STARTF_USESHOWWINDOW, STARTUPINFO
 
-__all__ = ["WolframKernelController"]
+__all__ = ["WolframKernelController", "WolframKernelControllerBase"]
 
 logger = logging.getLogger(__name__)
 
@@ -42,10 +46,10 @@ class KernelLogger(Thread):
 
     MAX_MESSAGE_BEFORE_QUIT = 32
 
-    def __init__(self, name=None, level=logging.WARN):
+    def __init__(self, name=None, level=logging.WARN, protocol="tcp", host="127.0.0.1"):
         super().__init__(name=name)
         self.socket = Socket(zmq_type=zmq.SUB)
-        self.socket.bind()
+        self.socket.bind(protocol=protocol, host=host)
         # Subscribe to all since we want all log messages.
         self.socket.zmq_socket.setsockopt(zmq.SUBSCRIBE, b"")
         if logger.isEnabledFor(logging.INFO):
@@ -88,21 +92,11 @@ class KernelLogger(Thread):
                 logger.fatal("Failed to close ZMQ logging socket.")
 
 
-class WolframKernelController(Thread):
-    """Control a Wolfram kernel from a Python thread.
-
-    A controller can start and stop a Wolfram kernel specified by its path `kernel`. It
-    can evaluate expression, one at a time.
-
-    Most methods from this class return instances of :class:`~concurrent.futures.Future`.
-
-    This class is a low level component of the library which is used by local evaluators.
-
-    ZMQ sockets are not thread safe, this class ensures encapsulation of them, while enabling
-    asynchronous operations.
-    """
+class WolframKernelControllerBase:
+    """Configuration of a Wolfram kernel shared by controllers: kernel path, initialization files, session
+    parameters, and the command line starting the kernel."""
 
-    def __init__(
+    def _configure(
         self,
         kernel=None,
         initfile=None,
@@ -113,9 +107,6 @@ class WolframKernelController(Thread):
         stderr=PIPE,
         **kwargs,
     ):
-        self.id = _thread_counter()
-        super().__init__(name="wolfram-kernel-%i" % self.id)
-
         self.kernel = kernel or self.default_kernel_path()
 
         if self.kernel:
@@ -143,14 +134,9 @@ class WolframKernelController(Thread):
                 "Initializing kernel {} using script: {}".format(self.kernel, self.initfile)
             )
 
-        self.tasks_queue = Queue()
-        self.kernel_socket_in = None
-        self.kernel_socket_out = None
-        self.kernel_proc = None
         self.consumer = consumer
         self.loglevel = kernel_loglevel
-        self.kernel_logger = None
-        self.evaluation_count = 0
+        self._ipc_directory = None
         self._stdin = stdin
         self._stdout = stdout
         self._stderr = stderr
@@ -162,12 +148,6 @@ class WolframKernelController(Thread):
             # ignore kwargs unknowns key
             except KeyError:
                 pass
-        # this is a state: this event is set when the kernel will not serve any more evaluation.
-        self._state_terminated = False
-        # lock controlling concurrent access to the state above.
-        self._state_lock = RLock()
-        # this is a trigger that will abort most blocking operations.
-        self.trigger_termination_requested = Event()
 
     def duplicate(self):
         """Build a new object using the same configuration as the current one."""
@@ -186,6 +166,8 @@ class WolframKernelController(Thread):
         "STARTUP_TIMEOUT": 20,
         "TERMINATE_TIMEOUT": 3,
         "HIDE_SUBPROCESS_WINDOW": True,
+        "PIPELINE_DEPTH": 1,
+        "SOCKET_PROTOCOL": "tcp",
     }
 
     def get_parameter(self, parameter_name):
@@ -195,6 +177,8 @@ class WolframKernelController(Thread):
 
         * ``'STARTUP_TIMEOUT'``: time to wait, in seconds, after the kernel startup is requested. Default is 20 seconds.
         * ``'TERMINATE_TIMEOUT'``: time to wait, in seconds, after the ``Quit[]`` command is sent to the kernel. The kernel is killed after this duration. Default is 3 seconds.
+        * ``'PIPELINE_DEPTH'``: maximum number of expressions sent to the kernel and waiting for their result. Default is 1, i.e. each expression is sent once the previous result was received.
+        * ``'SOCKET_PROTOCOL'``: transport of the sockets connecting the kernel. Either ``'tcp'``, the default, binding random ports of the loopback interface, or ``'ipc'``, binding Unix domain sockets in a private temporary directory.
         """
         try:
             return self.parameters.get(
@@ -214,6 +198,8 @@ class WolframKernelController(Thread):
 
         * ``'STARTUP_TIMEOUT'``: time to wait, in seconds, after the kernel startup is requested. Default is 20 seconds.
         * ``'TERMINATE_TIMEOUT'``: time to wait, in seconds, after the ``Quit[]`` command is sent to the kernel. The kernel is killed after this duration. Default is 3 seconds.
+        * ``'PIPELINE_DEPTH'``: maximum number of expressions sent to the kernel and waiting for their result. Default is 1, i.e. each expression is sent once the previous result was received.
+        * ``'SOCKET_PROTOCOL'``: transport of the sockets connecting the kernel. Either ``'tcp'``, the default, binding random ports of the loopback interface, or ``'ipc'``, binding Unix domain sockets in a private temporary directory.
         """
         if parameter_name not in self._DEFAULT_PARAMETERS:
             raise KeyError(
@@ -226,6 +212,152 @@ class WolframKernelController(Thread):
     def default_kernel_path(self):
         return find_default_kernel_path()
 
+    def bind_options(self, name):
+        """Return the named parameters of :meth:`~wolframclient.evaluation.kernel.zmqsocket.Socket.bind` for the
+        kernel socket `name`, according to the ``'SOCKET_PROTOCOL'`` parameter."""
+        protocol = self.get_parameter("SOCKET_PROTOCOL")
+        if protocol == "tcp":
+            return {}
+        if protocol != "ipc":
+            raise WolframKernelException("Unsupported socket protocol: %s." % protocol)
+        if not zmq.has("ipc"):
+            raise WolframKernelException("ZMQ does not support the ipc protocol on this platform.")
+        if self._ipc_directory is None:
+            # readable and writable by the current user only.
+            self._ipc_directory = tempfile.mkdtemp(prefix="wolframclient-")
+        return {"protocol": "ipc", "host": os.path_join(self._ipc_directory, name)}
+
+    def remove_ipc_directory(self):
+        """Remove the directory holding the ipc endpoints, once the sockets are closed."""
+        if self._ipc_directory is not None:
+            shutil.rmtree(self._ipc_directory, ignore_errors=True)
+            self._ipc_directory = None
+
+    _KERNEL_OK = b"OK"
+    _KERNEL_VERSION_NOT_SUPPORTED = 10
+
+    def kernel_command(self, logger_uri=None):
+        """Return the command line starting the kernel, connected to the evaluation sockets and optionally to the
+        logging socket at `logger_uri`."""
+        cmd = [self.kernel, "-noprompt"]
+
+        for path in self.initfile:
+            cmd.append("-initfile")
+            cmd.append(path)
+
+        cmd.append("-run")
+        if logger_uri:
+            cmd.append(
+                'ClientLibrary`Private`KernelPrivateStart["%s", "%s", "%s", %i];'
+                % (
+                    self.kernel_socket_out.uri,
+                    self.kernel_socket_in.uri,
+                    logger_uri,
+                    FROM_PY_LOG_LEVEL[self.loglevel],
+                )
+            )
+        else:
+            cmd.append(
+                'ClientLibrary`Private`KernelPrivateStart["{}", "{}"];'.format(
+                    self.kernel_socket_out.uri, self.kernel_socket_in.uri
+                )
+            )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Kernel called using command: %s." % " ".join(cmd))
+        return cmd
+
+    def startupinfo(self):
+        """Return the startup information hiding the kernel window, on Windows."""
+        # hide the WolframKernel window.
+        if six.WINDOWS and self.get_parameter("HIDE_SUBPROCESS_WINDOW"):
+            startupinfo = STARTUPINFO()
+            startupinfo.dwFlags |= STARTF_USESHOWWINDOW
+            return startupinfo
+        return None
+
+    @property
+    def pid(self):
+        """Return the PID of the Wolfram kernel process, if any, or None."""
+        try:
+            return self.kernel_proc.pid
+        except AttributeError:
+            return None
+
+    def _build_results(self, wxf_eval_data, is_batch, result_update_callback):
+        """Return the result of an evaluation from the kernel reply, or the list of results of a batch."""
+        if is_batch:
+            results = WolframKernelEvaluationResult.from_batch(
+                wxf_eval_data, consumer=self.consumer
+            )
+        else:
+            results = [WolframKernelEvaluationResult(wxf_eval_data, consumer=self.consumer)]
+        self.evaluation_count += len(results)
+        for i, result in enumerate(results):
+            # parts of a batch share a decoder, which is not thread safe: build them all in this thread.
+            for msg in result.iter_messages():
+                logger.warning(msg)
+            if result_update_callback:
+                results[i] = result_update_callback(result)
+        return results if is_batch else results[0]
+
+
+class WolframKernelController(WolframKernelControllerBase, Thread):
+    """Control a Wolfram kernel from a Python thread.
+
+    A controller can start and stop a Wolfram kernel specified by its path `kernel`. It
+    can evaluate expression, one at a time.
+
+    Evaluations are pipelined when the parameter ``'PIPELINE_DEPTH'`` is greater than one: queued expressions are
+    sent to the kernel while it is still busy, up to that number of them, and the results are matched to their
+    futures in order. The kernel still evaluates one expression at a time.
+
+    Most methods from this class return instances of :class:`~concurrent.futures.Future`.
+
+    This class is a low level component of the library which is used by local evaluators.
+
+    ZMQ sockets are not thread safe, this class ensures encapsulation of them, while enabling
+    asynchronous operations.
+    """
+
+    def __init__(
+        self,
+        kernel=None,
+        initfile=None,
+        consumer=None,
+        kernel_loglevel=logging.NOTSET,
+        stdin=PIPE,
+        stdout=PIPE,
+        stderr=PIPE,
+        **kwargs,
+    ):
+        self.id = _thread_counter()
+        super().__init__(name="wolfram-kernel-%i" % self.id)
+        self._configure(
+            kernel=kernel,
+            initfile=initfile,
+            consumer=consumer,
+            kernel_loglevel=kernel_loglevel,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            **kwargs,
+        )
+        self.tasks_queue = Queue()
+        self.kernel_socket_in = None
+        self.kernel_socket_out = None
+        self.kernel_proc = None
+        # file descriptor readable once the kernel process has exited, when the platform provides one.
+        self._kernel_pidfd = None
+        self.kernel_logger = None
+        self.evaluation_count = 0
+        # this is a state: this event is set when the kernel will not serve any more evaluation.
+        self._state_terminated = False
+        # lock controlling concurrent access to the state above.
+        self._state_lock = RLock()
+        # this is a trigger that will abort most blocking operations.
+        self.trigger_termination_requested = AbortEvent()
+
     def _kernel_terminate(self):
         self._kernel_stop(gracefully=False)
 
@@ -288,6 +420,9 @@ class WolframKernelController(Thread):
                 logger.info("Killing kernel process: %i" % self.kernel_proc.pid)
                 self.kernel_proc.kill()
             self.kernel_proc = None
+        if self._kernel_pidfd is not None:
+            os.close(self._kernel_pidfd)
+            self._kernel_pidfd = None
         if self.kernel_socket_out is not None:
             try:
                 self.kernel_socket_out.close()
@@ -310,6 +445,7 @@ class WolframKernelController(Thread):
                 logger.fatal(e)
             finally:
                 self.kernel_logger = None
+        self.remove_ipc_directory()
         assert self.kernel_proc is None
         assert self.kernel_socket_in is None
         assert self.kernel_socket_out is None
@@ -369,9 +505,6 @@ class WolframKernelController(Thread):
             finally:
                 raise e
 
-    _KERNEL_OK = b"OK"
-    _KERNEL_VERSION_NOT_SUPPORTED = 10
-
     def _kernel_start(self):
         """Start a new kernel process and open sockets to communicate with it."""
         # Socket to which we push new expressions for evaluation.
@@ -380,51 +513,25 @@ class WolframKernelController(Thread):
         if self.kernel_socket_in is None:
             self.kernel_socket_in = Socket(zmq_type=zmq.PULL)
         # start the evaluation zmq sockets
-        self.kernel_socket_out.bind()
-        self.kernel_socket_in.bind()
+        self.kernel_socket_out.bind(**self.bind_options("out"))
+        self.kernel_socket_in.bind(**self.bind_options("in"))
         if logger.isEnabledFor(logging.INFO):
             logger.info("Kernel writes commands to socket: %s", self.kernel_socket_out)
             logger.info(
                 "Kernel receives evaluated expressions from socket: %s", self.kernel_socket_in
             )
         # start the kernel process
-        cmd = [self.kernel, "-noprompt"]
-
-        for path in self.initfile:
-            cmd.append("-initfile")
-            cmd.append(path)
-
         if self.loglevel != logging.NOTSET:
             self.kernel_logger = KernelLogger(
-                name="wolfram-kernel-logger-%i" % self.id, level=self.loglevel
+                name="wolfram-kernel-logger-%i" % self.id,
+                level=self.loglevel,
+                **self.bind_options("log"),
             )
             self.kernel_logger.start()
-            cmd.append("-run")
-            cmd.append(
-                'ClientLibrary`Private`KernelPrivateStart["%s", "%s", "%s", %i];'
-                % (
-                    self.kernel_socket_out.uri,
-                    self.kernel_socket_in.uri,
-                    self.kernel_logger.socket.uri,
-                    FROM_PY_LOG_LEVEL[self.loglevel],
-                )
-            )
-        else:
-            cmd.append("-run")
-            cmd.append(
-                'ClientLibrary`Private`KernelPrivateStart["{}", "{}"];'.format(
-                    self.kernel_socket_out.uri, self.kernel_socket_in.uri
-                )
-            )
-
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug("Kernel called using command: %s." % " ".join(cmd))
-        # hide the WolframKernel window.
-        if six.WINDOWS and self.get_parameter("HIDE_SUBPROCESS_WINDOW"):
-            startupinfo = STARTUPINFO()
-            startupinfo.dwFlags |= STARTF_USESHOWWINDOW
+            cmd = self.kernel_command(logger_uri=self.kernel_logger.socket.uri)
         else:
-            startupinfo = None
+            cmd = self.kernel_command()
+        startupinfo = self.startupinfo()
         try:
             self.kernel_proc = Popen(
                 cmd,
@@ -439,6 +546,7 @@ class WolframKernelController(Thread):
         except Exception as e:
             logger.exception(e)
             raise WolframKernelException("Failed to start kernel process.")
+        self._kernel_pidfd = _open_pidfd(self.kernel_proc.pid)
         try:
             # First message must be "OK", acknowledging everything is up and running
             # on the kernel side.
@@ -467,14 +575,6 @@ class WolframKernelController(Thread):
                 "Failed to communicate with kernel: %s." % self.kernel
             )
 
-    @property
-    def pid(self):
-        """Return the PID of the Wolfram kernel process, if any, or None."""
-        try:
-            return self.kernel_proc.pid
-        except AttributeError:
-            return None
-
     START = object()
     STOP = object()
 
@@ -513,13 +613,20 @@ class WolframKernelController(Thread):
     def evaluate_future(self, wxf, future, result_update_callback=None, **kwargs):
         self.enqueue_task(wxf, future, result_update_callback)
 
+    def evaluate_batch_future(self, wxf, future, result_update_callback=None, **kwargs):
+        """Enqueue a batch of expressions serialized as a single WXF `ClientLibrary`Private`EvaluateBatch` function.
+
+        The result of `future` is the list of the results of each expression, updated with `result_update_callback`.
+        """
+        self.enqueue_task(_Batch(wxf), future, result_update_callback)
+
     def _new_running_event(self):
         """
         Create a new event that triggers when the kernel process has terminated or when termination was requested.
         :return:
         """
         return _ProcessAliveNotAbortedEvent(
-            self.kernel_proc, self.trigger_termination_requested
+            self.kernel_proc, self.trigger_termination_requested, self._kernel_pidfd
         )
 
     def _recv_check_process(self, copy=False):
@@ -537,29 +644,52 @@ class WolframKernelController(Thread):
             logger.info("Kernel process is not running anymore.")
             raise WolframKernelException("Kernel is not running anymore.")
 
-    def _do_evaluate(self, wxf, future, result_update_callback):
+    def _send_check_process(self, frame):
+        try:
+            self.kernel_socket_out.send_abortable(frame, abort_event=self._new_running_event())
+        except SocketAborted:
+            logger.info("Kernel process is not running anymore.")
+            raise WolframKernelException("Kernel is not running anymore.")
+
+    def _send_task(self, payload):
         start = time.perf_counter()
-        self.kernel_socket_out.send(zmq.Frame(wxf))
+        if isinstance(payload, _Batch):
+            payload = payload.wxf
+        frame = zmq.Frame(payload)
+        try:
+            self.kernel_socket_out.send(frame, flags=zmq.NOBLOCK)
+        except zmq.Again:
+            # a PUSH socket has no peer once the kernel is gone, wait until it comes back or the process is dead.
+            self._send_check_process(frame)
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Expression sent to kernel in %.06fsec", time.perf_counter() - start)
-            start = time.perf_counter()
+        return time.perf_counter()
+
+    def _receive_task(self, in_flight):
+        """Receive the result of the oldest expression sent to the kernel and set it to its future."""
+        future, result_update_callback, is_batch, start = in_flight[0]
         wxf_eval_data = self._recv_check_process()
         if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Expression received from kernel after %.06fsec", time.perf_counter() - start
             )
-        self.evaluation_count += 1
-        result = WolframKernelEvaluationResult(wxf_eval_data.buffer, consumer=self.consumer)
-        if logger.isEnabledFor(logging.WARNING):
-            for msg in result.iter_messages():
-                logger.warning(msg)
-        if result_update_callback:
-            result = result_update_callback(result)
+        result = self._build_results(wxf_eval_data.buffer, is_batch, result_update_callback)
+        in_flight.popleft()
         future.set_result(result)
 
+    def _next_task(self, in_flight):
+        """Return the next task, receiving results until one is queued and the pipeline is not full."""
+        depth = max(self.get_parameter("PIPELINE_DEPTH"), 1)
+        while len(in_flight) >= depth or (in_flight and self.tasks_queue.empty()):
+            self._receive_task(in_flight)
+        return self.tasks_queue.get()
+
     def run(self):
         future = None
         task = None
+        # futures of the expressions sent to the kernel in order, with their callback, whether they are a batch, and
+        # the time they were sent.
+        in_flight = deque()
         try:
             task = self.tasks_queue.get()
             payload, future, result_update_callback = task
@@ -581,6 +711,9 @@ class WolframKernelController(Thread):
                 self._safe_kernel_start()
             while not self.trigger_termination_requested.is_set():
                 if payload is self.STOP:
+                    # pending evaluations complete before the kernel is stopped.
+                    while in_flight:
+                        self._receive_task(in_flight)
                     # lock controlling concurrent access to state above.
                     with self._state_lock:
                         self._state_terminated = True
@@ -591,11 +724,18 @@ class WolframKernelController(Thread):
                     task = None
                     self.tasks_queue.task_done()
                     break
-                self._do_evaluate(payload, future, result_update_callback)
+                in_flight.append(
+                    (
+                        future,
+                        result_update_callback,
+                        isinstance(payload, _Batch),
+                        self._send_task(payload),
+                    )
+                )
                 future = None
                 task = None
                 self.tasks_queue.task_done()
-                task = self.tasks_queue.get()
+                task = self._next_task(in_flight)
                 payload, future, result_update_callback = task
         except (KeyboardInterrupt, RuntimeError, futures.CancelledError) as e:
             self.trigger_termination_requested.set()
@@ -603,13 +743,17 @@ class WolframKernelController(Thread):
             raise
         except Exception as e:
             self.trigger_termination_requested.set()
+            failed = self._fail_in_flight(in_flight, e)
             if future and not future.done():
                 future.set_exception(e)
                 future = None
-            else:
+            elif not failed:
                 raise
         finally:
             try:
+                self._fail_in_flight(
+                    in_flight, WolframKernelException("Kernel is not running anymore.")
+                )
                 if task:
                     self.tasks_queue.task_done()
                 self._cancel_tasks()
@@ -622,9 +766,19 @@ class WolframKernelController(Thread):
                     future.set_exception(e)
                     future = None
             finally:
+                self.trigger_termination_requested.close()
                 if future and not future.done():
                     future.set_result(True)
 
+    def _fail_in_flight(self, in_flight, exception):
+        """Set `exception` to the futures of the expressions sent to the kernel. Return whether there was any."""
+        failed = bool(in_flight)
+        while in_flight:
+            future = in_flight.popleft()[0]
+            if not future.done():
+                future.set_exception(exception)
+        return failed
+
     def _cancel_tasks(self):
         while not self.tasks_queue.empty():
             task = self.tasks_queue.get()
@@ -645,14 +799,42 @@ class WolframKernelController(Thread):
             return '<{}[{} ❌], "{}">'.format(self.__class__.__name__, self.name, self.kernel)
 
 
+class _Batch:
+    """A WXF payload holding a batch of expressions."""
+
+    __slots__ = ("wxf",)
+
+    def __init__(self, wxf):
+        self.wxf = wxf
+
+
+def _open_pidfd(pid):
+    """Return a file descriptor readable once the process `pid` has exited, or None if the platform has none."""
+    try:
+        return os.pidfd_open(pid)
+    except (ImportError, OSError):
+        # pidfd_open requires Python 3.9 and Linux 5.3.
+        return None
+
+
 class _ProcessAliveNotAbortedEvent:
-    def __init__(self, subprocess, abort_event):
+    def __init__(self, subprocess, abort_event, pidfd=None):
         self.subprocess = subprocess
         self.abort_event = abort_event
+        self.pidfd = pidfd
 
     def is_set(self):
         return self.subprocess.poll() is not None or self.abort_event.is_set()
 
+    def filenos(self):
+        """Return the file descriptors readable once the event is set, or None if process exit is not observable."""
+        if self.pidfd is None:
+            return None
+        fds = self.abort_event.filenos()
+        if fds is None:
+            return None
+        return (self.pidfd,) + tuple(fds)
+
 
 class _KernelProcessDied:
     def __init__(self, subprocess):
@@ -6,7 +6,9 @@ from subprocess import PIPE
 
 from wolframclient.evaluation.base import WolframEvaluator
 from wolframclient.evaluation.kernel.kernelcontroller import WolframKernelController
+from wolframclient.language import wl
 from wolframclient.serializers import export
+from wolframclient.utils.encoding import force_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +17,7 @@ __all__ = ["WolframLanguageSession"]
 
 # Some callback methods for internal use.
 def do_get_wxf(result):
-    return result.wxf
+    return force_bytes(result.wxf)
 
 
 def do_get_result(result):
@@ -83,6 +85,13 @@ class WolframLanguageSession(WolframEvaluator):
     parameters. Valid values are those accepted by :class:`subprocess.Popen` (e.g. :data:`sys.stdout`). Those parameters
     should be handled with care as deadlocks can arise from misconfiguration.
 
+    Set `standby` to a :class:`~wolframclient.evaluation.WolframKernelStandby` to take a kernel already started by the
+    standby each time the session starts, instead of waiting for a new kernel. The kernel configuration of the standby
+    then applies::
+
+        standby = WolframKernelStandby(size=2, init='Needs["MyPackage`"]')
+        session = WolframLanguageSession(standby=standby)
+
     """
 
     def __init__(
@@ -97,6 +106,7 @@ class WolframLanguageSession(WolframEvaluator):
         inputform_string_evaluation=True,
         wxf_bytes_evaluation=True,
         controller_class=WolframKernelController,
+        standby=None,
         **kwargs,
     ):
         super().__init__(inputform_string_evaluation=inputform_string_evaluation)
@@ -109,15 +119,19 @@ class WolframLanguageSession(WolframEvaluator):
         self._stderr = stderr
         self.wxf_bytes_evaluation = wxf_bytes_evaluation
         self.controller_class = controller_class
-        self.kernel_controller = self.controller_class(
-            kernel=kernel,
-            initfile=initfile,
-            kernel_loglevel=kernel_loglevel,
-            stdin=stdin,
-            stdout=stdout,
-            stderr=stderr,
-            **kwargs,
-        )
+        self.standby = standby
+        if standby is None:
+            self.kernel_controller = self.controller_class(
+                kernel=kernel,
+                initfile=initfile,
+                kernel_loglevel=kernel_loglevel,
+                stdin=stdin,
+                stdout=stdout,
+                stderr=stderr,
+                **kwargs,
+            )
+        else:
+            self.kernel_controller = standby.template.duplicate()
         self.parameters = kwargs
         self.stopped = True
 
@@ -132,6 +146,7 @@ class WolframLanguageSession(WolframEvaluator):
             stderr=self._stderr,
             inputform_string_evaluation=self.inputform_string_evaluation,
             controller_class=self.controller_class,
+            standby=self.standby,
             **self.parameters,
         )
 
@@ -162,6 +177,9 @@ class WolframLanguageSession(WolframEvaluator):
         The result of the future object is :data:`True` when the kernel is ready to evaluate input.
         """
         self.stopped = False
+        if self.standby is not None and not self.started:
+            self.kernel_controller, future = self.standby.acquire()
+            return future
         if self.kernel_controller.terminated:
             self.kernel_controller = self.kernel_controller.duplicate()
         if not self.started:
@@ -225,6 +243,18 @@ class WolframLanguageSession(WolframEvaluator):
         )
         return future
 
+    def do_evaluate_batch_future(self, exprs, result_update_callback=None, **kwargs):
+        future = futures.Future()
+        wxf = export(
+            wl.ClientLibrary.Private.EvaluateBatch(*map(self.normalize_input, exprs)),
+            target_format="wxf",
+            **kwargs,
+        )
+        self.kernel_controller.evaluate_batch_future(
+            wxf, future, result_update_callback=result_update_callback, **kwargs
+        )
+        return future
+
     def evaluate_future(self, expr, **kwargs):
         """Evaluate an expression and return a future object.
 
@@ -256,9 +286,40 @@ class WolframLanguageSession(WolframEvaluator):
         self.ensure_started()
         return self.do_evaluate_future(expr, **kwargs)
 
+    def evaluate_batch_wrap_future(self, exprs, **kwargs):
+        """Evaluate a batch of expressions and return a future object.
+
+        The future object result is the list of result objects, one per expression.
+        See :func:`~wolframclient.evaluation.WolframLanguageSession.evaluate_batch`.
+        """
+        self.ensure_started()
+        return self.do_evaluate_batch_future(exprs, **kwargs)
+
     def evaluate_wrap(self, expr, **kwargs):
         return self.evaluate_wrap_future(expr, **kwargs).result()
 
+    def evaluate_batch_wrap(self, exprs, **kwargs):
+        """Evaluate a batch of expressions and return the list of result objects, one per expression."""
+        return self.evaluate_batch_wrap_future(exprs, **kwargs).result()
+
+    def evaluate_batch(self, exprs, **kwargs):
+        """Evaluate a batch of expressions in order and return the list of their results.
+
+        Contrary to :func:`~wolframclient.evaluation.WolframLanguageSession.evaluate_many`, all the expressions are
+        sent to the kernel as a single WXF message, and the kernel answers with a single message holding all the
+        results. Communication overhead is thus paid once per batch::
+
+            >>> session.evaluate_batch(['1+1', wl.Range(3)])
+            [2, (1, 2, 3)]
+
+        Messages issued by each evaluation are logged as with
+        :func:`~wolframclient.evaluation.WolframLanguageSession.evaluate`.
+        """
+        results = self.evaluate_batch_wrap(exprs, **kwargs)
+        for result in results:
+            self.log_message_from_result(result)
+        return [result.get() for result in results]
+
     def evaluate(self, expr, **kwargs):
         result = self.evaluate_wrap(expr, **kwargs)
         self.log_message_from_result(result)
@@ -270,7 +331,7 @@ class WolframLanguageSession(WolframEvaluator):
         This method does not deserialize the Wolfram kernel input."""
         result = self.evaluate_wrap(expr, **kwargs)
         self.log_message_from_result(result)
-        return result.wxf
+        return force_bytes(result.wxf)
 
     def log_message_from_result(self, result):
         if not result.success:
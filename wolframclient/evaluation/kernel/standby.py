@@ -0,0 +1,149 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+import logging
+from collections import deque
+from concurrent import futures
+from functools import partial
+from threading import RLock
+
+from wolframclient.evaluation.kernel.kernelcontroller import WolframKernelController
+from wolframclient.language import wlexpr
+from wolframclient.serializers import export
+from wolframclient.utils import six
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["WolframKernelStandby"]
+
+
+class WolframKernelStandby:
+    """Keep kernels started in advance, ready to be handed to a
+    :class:`~wolframclient.evaluation.WolframLanguageSession`.
+
+    Starting a kernel takes seconds. A standby starts `size` kernels in the background and hands one to a session
+    each time the session starts, or restarts after its kernel died. A replacement kernel is immediately started in
+    the background, so that the next session start does not have to wait either::
+
+        standby = WolframKernelStandby('/path/to/kernel', size=2)
+        standby.start()
+        session = WolframLanguageSession(standby=standby)
+        session.evaluate('$ProcessID')
+
+    Set `init` to an expression evaluated once by each kernel before it is handed to a session, e.g. to load
+    packages. Strings are evaluated as input form.
+
+    Other parameters are passed to the kernel controller, and are the same as those of
+    :class:`~wolframclient.evaluation.WolframLanguageSession`, including session parameters such as
+    ``'STARTUP_TIMEOUT'``. They apply to every kernel of the standby.
+
+    Kernels still waiting in the standby are terminated by :meth:`terminate`. Kernels handed to a session belong to
+    that session.
+    """
+
+    def __init__(
+        self, kernel=None, size=1, init=None, controller_class=WolframKernelController, **kwargs
+    ):
+        if size <= 0:
+            raise ValueError("Invalid standby size value %i. Expecting a positive integer." % size)
+        self.size = size
+        self.init = init
+        # configuration shared by all the kernels, duplicated for each of them.
+        self.template = controller_class(kernel=kernel, **kwargs)
+        self._ready = deque()
+        self._lock = RLock()
+        self.stopped = True
+
+    def start(self):
+        """Start the kernels in the background and return immediately."""
+        with self._lock:
+            self.stopped = False
+            while len(self._ready) < self.size:
+                self._ready.append(self._spawn())
+
+    def _spawn(self):
+        controller = self.template.duplicate()
+        started = controller.request_kernel_start()
+        if self.init is None:
+            return controller, started
+        init = self.init
+        if isinstance(init, six.string_types):
+            init = wlexpr(init)
+        ready = futures.Future()
+        evaluated = futures.Future()
+        evaluated.add_done_callback(partial(_init_done, started, ready))
+        try:
+            # tasks are queued in order, the init expression is evaluated as soon as the kernel is started.
+            controller.evaluate_future(export(init, target_format="wxf"), evaluated)
+        except RuntimeError:
+            # the kernel already failed to start, the controller no longer accepts tasks.
+            evaluated.cancel()
+        return controller, ready
+
+    def acquire(self):
+        """Return a kernel controller and a future object whose result is :data:`True` once the kernel is ready.
+
+        The standby is started if needed, and a kernel is started in the background to replace the one returned.
+        Kernels that failed to start, or died while waiting, are skipped and replaced as well.
+        """
+        with self._lock:
+            if self.stopped:
+                self.start()
+            attempts = len(self._ready)
+            while True:
+                controller, future = self._ready.popleft()
+                self._ready.append(self._spawn())
+                attempts -= 1
+                if attempts <= 0 or not _failed(controller, future):
+                    break
+                logger.warning("Discarding standby kernel which is not running: %s", controller)
+                controller.terminate()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Kernel handed out from standby: %s", controller)
+        return controller, future
+
+    def terminate(self):
+        """Terminate the kernels waiting in the standby."""
+        with self._lock:
+            self.stopped = True
+            while self._ready:
+                controller, _ = self._ready.popleft()
+                controller.terminate()
+
+    def __len__(self):
+        return len(self._ready)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.terminate()
+
+    def __repr__(self):
+        return "<{} {}/{} kernels, {}>".format(
+            self.__class__.__name__, len(self._ready), self.size, self.template.kernel
+        )
+
+
+def _failed(controller, future):
+    if not future.done():
+        return False
+    return future.cancelled() or future.exception() is not None or not controller.is_kernel_alive()
+
+
+def _init_done(started, ready, evaluated):
+    if evaluated.cancelled():
+        # the init evaluation is cancelled when the kernel fails to start, report why.
+        exception = started.exception()
+        if exception is not None:
+            ready.set_exception(exception)
+        else:
+            ready.cancel()
+    elif evaluated.exception() is not None:
+        ready.set_exception(evaluated.exception())
+    else:
+        result = evaluated.result()
+        if not result.success:
+            for msg in result.messages:
+                logger.warning("Standby init expression: %s", msg)
+        ready.set_result(True)
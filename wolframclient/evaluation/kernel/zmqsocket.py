@@ -1,7 +1,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import logging
+import socket as _socket
 from functools import wraps
+from threading import Event, Lock
 
 from wolframclient.exception import WolframLanguageException
 from wolframclient.utils.api import time, zmq
@@ -21,11 +23,67 @@ class SocketOperationTimeout(SocketException):
     pass
 
 
-def abortable():
+class AbortEvent:
+    """A :class:`threading.Event` that wakes up the socket operations waiting for it.
+
+    The event holds a pair of connected sockets, created on first use, whose reading end becomes readable once the
+    event is set. :func:`abortable` operations poll it along with the ZMQ socket, and are aborted as soon as the event
+    is set instead of checking it periodically.
+    """
+
+    def __init__(self):
+        self._event = Event()
+        self._lock = Lock()
+        self._pair = None
+        self._closed = False
+
+    def is_set(self):
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        return self._event.wait(timeout=timeout)
+
+    def set(self):
+        with self._lock:
+            if not self._event.is_set():
+                self._event.set()
+                if self._pair is not None:
+                    self._pair[1].send(b"\x00")
+
+    def filenos(self):
+        """Return the file descriptor that is readable once the event is set."""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._pair is None:
+                self._pair = _socket.socketpair()
+                if self._event.is_set():
+                    self._pair[1].send(b"\x00")
+            return (self._pair[0].fileno(),)
+
+    def close(self):
+        """Release the sockets. The event keeps working, only its file descriptor is gone."""
+        with self._lock:
+            self._closed = True
+            if self._pair is not None:
+                for s in self._pair:
+                    s.close()
+                self._pair = None
+
+
+def abortable(send=False):
+    """Make a receive method abortable, and give it a timeout. Set `send` to :data:`True` to decorate a send method.
+
+    `abort_event` is any object with an `is_set` method. When it also has a `filenos` method returning file descriptors
+    that become readable as soon as the event is set, they are polled along with the socket, and the operation blocks
+    until the socket is ready, the event is set or `timeout` expires. Otherwise, `abort_event` is checked every
+    `abort_check_period` seconds.
+    """
+
     def outer(recv_method):
         @wraps(recv_method)
         def recv_abortable(
-            socket, timeout=None, abort_check_period=0.1, abort_event=None, **kwargs
+            socket, *args, timeout=None, abort_check_period=0.1, abort_event=None, **kwargs
         ):
             if not socket.bound:
                 raise SocketException("ZMQ socket not bound.")
@@ -33,14 +91,24 @@ def abortable():
                 raise ValueError("Timeout must be a positive number.")
             retry = 0
             start = time.perf_counter()
-            # fix inconsistencies
-            if timeout and abort_check_period > timeout:
-                abort_check_period = timeout
-            abort_check_period = 1000.0 * abort_check_period
+            poller = zmq.Poller()
+            poller.register(socket.zmq_socket, zmq.POLLOUT if send else zmq.POLLIN)
+            filenos = abort_event is not None and getattr(abort_event, "filenos", None)
+            fds = filenos() if filenos else None
+            if fds is not None:
+                for fd in fds:
+                    poller.register(fd, zmq.POLLIN)
+                # abort_event wakes up the poller, no need to check it periodically.
+                abort_check_period = None
             while True:
-                if socket.zmq_socket.poll(timeout=abort_check_period) > 0:
+                wait = abort_check_period
+                if timeout:
+                    remaining = max(timeout - (time.perf_counter() - start), 0)
+                    wait = remaining if wait is None else min(wait, remaining)
+                events = dict(poller.poll(timeout=None if wait is None else 1000.0 * wait))
+                if events.get(socket.zmq_socket):
                     try:
-                        return recv_method(socket, flags=zmq.NOBLOCK, **kwargs)
+                        return recv_method(socket, *args, flags=zmq.NOBLOCK, **kwargs)
                     # just in case there is more than one consumer.
                     except zmq.Again:
                         pass
@@ -50,8 +118,13 @@ def abortable():
                 if timeout and (time.perf_counter() - start > timeout):
                     break
             raise SocketOperationTimeout(
-                "Failed to read any message from socket %s after %.1f seconds and %i retries."
-                % (socket.uri, time.perf_counter() - start, retry)
+                "Failed to %s socket %s after %.1f seconds and %i retries."
+                % (
+                    "send any message to" if send else "read any message from",
+                    socket.uri,
+                    time.perf_counter() - start,
+                    retry,
+                )
             )
 
         return recv_abortable
@@ -60,13 +133,19 @@ def abortable():
 
 
 class Socket:
-    """Wrapper around ZMQ socket"""
+    """Wrapper around ZMQ socket
 
-    def __init__(self, protocol="tcp", host="127.0.0.1", port=None, zmq_type=zmq.PAIR):
+    Set `context` to a :class:`zmq.asyncio.Context` to get a socket whose `recv` and `send` methods return awaitable
+    futures. The default is the global :class:`zmq.Context` instance.
+    """
+
+    def __init__(
+        self, protocol="tcp", host="127.0.0.1", port=None, zmq_type=zmq.PAIR, context=None
+    ):
         self.zmq_type = zmq_type
         self.uri = None
         self.bound = False
-        self.zmq_socket = zmq.Context.instance().socket(zmq_type)
+        self.zmq_socket = (context or zmq.Context.instance()).socket(zmq_type)
         self.closed = False
 
     def can_bind_or_fail(self):
@@ -85,8 +164,9 @@ class Socket:
 
     def bind(self, protocol="tcp", host="127.0.0.1", port=None):
         self.can_bind_or_fail()
-        if protocol == "inproc":
-            self.uri = "inproc://%s" % host
+        if protocol in ("inproc", "ipc"):
+            # host is the name of the endpoint, a path for ipc.
+            self.uri = "{}://{}".format(protocol, host)
             self.zmq_socket.bind(self.uri)
         elif port:
             self.uri = "{}://{}:{}".format(protocol, host, port)
@@ -113,7 +193,7 @@ class Socket:
     @abortable()
     def recv_abortable(self, **kwargs):
         # def abortable_recv(self, timeout=None, abort_check_period=0.1, abort_event=None, copy=True):
-        """Read a socket in a non-blocking fashion, until a timeout is reached, or until an abort Event is set."""
+        """Read a socket in a non-blocking fashion, until a timeout is reached, or until an abort event is set."""
         return self.recv(**kwargs)
 
     @abortable()
@@ -121,6 +201,11 @@ class Socket:
         """Read a socket for a json message, in a non-blocking fashion, until a timeout is reached, or until an abort Event is set."""
         return self.recv_json(**kwargs)
 
+    @abortable(send=True)
+    def send_abortable(self, *args, **kwargs):
+        """Write to a socket in a non-blocking fashion, until a timeout is reached, or until an abort event is set."""
+        return self.send(*args, **kwargs)
+
     def close(self):
         self.zmq_socket.close()
         self.closed = True
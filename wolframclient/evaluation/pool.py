@@ -2,13 +2,16 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import itertools
 import logging
+import math
 from asyncio import CancelledError
+from collections import deque
 
 from wolframclient.evaluation.base import WolframAsyncEvaluator
 from wolframclient.evaluation.kernel.asyncsession import WolframLanguageAsyncSession
 from wolframclient.exception import WolframKernelException
+from wolframclient.language import wl
 from wolframclient.utils import six
-from wolframclient.utils.api import asyncio
+from wolframclient.utils.api import asyncio, time
 from wolframclient.utils.asyncio import run_in_loop
 from wolframclient.utils.functional import is_iterable
 
@@ -16,6 +19,27 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["WolframEvaluatorPool", "parallel_evaluate"]
 
+# returned instead of a queue entry once the replacement of a recycled kernel is started.
+_REPLACED = object()
+# returned instead of a queue entry when a kernel is idle for longer than the pool idle timeout.
+_IDLE = object()
+
+
+class _PoolTask:
+    """An evaluation queued in a pool."""
+
+    __slots__ = "future", "func", "args", "kwargs", "cost", "affinity_key", "setup", "queued_at"
+
+    def __init__(self, future, func, args, kwargs, cost=1, affinity_key=None, setup=None):
+        self.future = future
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.cost = cost
+        self.affinity_key = affinity_key
+        self.setup = setup
+        self.queued_at = time.perf_counter()
+
 
 class WolframEvaluatorPool(WolframAsyncEvaluator):
     """A pool of kernels to dispatch one-shot evaluations asynchronously.
@@ -58,15 +82,68 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
     Set `load_factor` to specify how many workloads are queued per kernel before a new evaluation becomes a blocking
     operation. Values below or equal to 0 mean an infinite queue size.
 
+    Kernels take queued evaluations as soon as they are idle, so that an evaluation is never queued behind a slow one
+    while another kernel is available. Evaluation methods accept extra named parameters:
+
+    * `priority`: queued evaluations with lower values are evaluated first. Default is 0. Evaluations of equal
+      priority are evaluated in order.
+    * `cost`: an estimate of the evaluation cost, relative to a default of 1. It is used to measure queued work.
+    * `affinity_key`: evaluations with the same key are evaluated by the same kernel, as long as it is part of the
+      pool. Otherwise, the key is assigned to another kernel. Keyed evaluations come before those of the pool queue.
+    * `setup`: an expression evaluated by a local kernel before the first evaluation requiring it, and again after
+      the kernel restarted. Other evaluators evaluate it each time.
+
+    Run an interactive request ahead of the queued batch evaluations::
+
+        await pool.evaluate('Range[3]', priority=-1)
+
+    Load a package once per kernel, and reuse definitions made by a previous evaluation::
+
+        await pool.evaluate('data = f[1]', affinity_key='user-1', setup='Needs["MyPackage`"]')
+        await pool.evaluate('g[data]', affinity_key='user-1', setup='Needs["MyPackage`"]')
+
+    Long-lived kernels accumulate definitions and memory. Local kernels are recycled, i.e. replaced by a new kernel,
+    once they reach one of the following limits:
+
+    * `max_evaluations`: number of evaluations.
+    * `max_age`: time, in seconds, since the kernel started.
+    * `max_memory`: memory in use, in bytes, as returned by ``MemoryInUse[]``. It is checked at most every
+      :attr:`MEMORY_CHECK_PERIOD` seconds.
+
+    The replacement is started in the background while the recycled kernel keeps evaluating, and the recycled kernel
+    is stopped as soon as the replacement is ready, so that the pool capacity does not drop. Kernels are recycled one
+    at a time: a kernel reaching a limit while another one is being replaced waits for its turn. Recycling is disabled
+    by default.
+
+    Set `max_poolsize` to a value greater than `poolsize` to scale the pool with the load. `poolsize` kernels are
+    started first, and a new one, duplicated from the first evaluator, is added when either:
+
+    * the queued work, i.e. the sum of the costs of queued evaluations, reaches `scale_up_queue_depth` per running
+      kernel, or
+    * the 95th percentile of the time spent by recent evaluations in the queue exceeds `scale_up_wait` seconds.
+
+    Kernels are added one at a time, up to `max_poolsize`. When a new kernel fails to start, e.g. due to licencing
+    restrictions, the pool size is capped to its current value. Kernels that stay idle for `idle_timeout` seconds are
+    stopped, down to `poolsize` kernels.
+
     `kwargs` are passed to :class:`~wolframclient.evaluation.WolframLanguageAsyncSession` during initialization.
     """
 
+    MEMORY_CHECK_PERIOD = 1.0
+
     def __init__(
         self,
         async_evaluators=None,
         poolsize=4,
         load_factor=0,
         async_language_session_class=WolframLanguageAsyncSession,
+        max_evaluations=None,
+        max_age=None,
+        max_memory=None,
+        max_poolsize=None,
+        scale_up_queue_depth=2,
+        scale_up_wait=None,
+        idle_timeout=60,
         **kwargs,
     ):
         super().__init__()
@@ -74,9 +151,18 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
             raise ValueError(
                 "Invalid pool size value %i. Expecting a positive integer." % poolsize
             )
-        self._queue = asyncio.Queue(load_factor * poolsize)
+        if max_poolsize is not None and max_poolsize < poolsize:
+            raise ValueError(
+                "Invalid maximum pool size value %i. Expecting at least the pool size %i."
+                % (max_poolsize, poolsize)
+            )
+        self._queue = asyncio.PriorityQueue(load_factor * (max_poolsize or poolsize))
+        # queue entries of equal priority are evaluated in order.
+        self._sequence = itertools.count()
+        self._queued_cost = 0
         self.async_language_session_class = async_language_session_class
         self._evaluators = set()
+        self._template = None
         if async_evaluators is None or isinstance(async_evaluators, six.string_types):
             for _ in range(poolsize):
                 self._add_evaluator(async_evaluators, **kwargs)
@@ -88,7 +174,27 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
                     break
                 self._add_evaluator(evaluator)
 
+        self.max_evaluations = max_evaluations
+        self.max_age = max_age
+        self.max_memory = max_memory
+        self._memory_checks = {}
+        # the kernel being replaced. Kernels are recycled one at a time.
+        self._recycled = None
+        self.max_poolsize = max_poolsize
+        self.scale_up_queue_depth = scale_up_queue_depth
+        self.scale_up_wait = scale_up_wait
+        self.idle_timeout = idle_timeout
+        self._size_cap = max_poolsize
+        self._scale_up_task = None
+        # time spent in the queue by the most recent evaluations.
+        self._wait_times = deque(maxlen=100)
+        # affinity keys routing, and setup expressions evaluated by each kernel.
+        self._affinity = {}
+        self._affinity_keys = {}
+        self._affinity_queues = {}
+        self._loaded = {}
         self._kernel_start_tasks = ()
+        self._kernel_spawn_tasks = set()
         self._kernel_evaluation_loop_tasks = []
         self.last = 0
         self.eval_count = 0
@@ -96,37 +202,75 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
 
     def _add_evaluator(self, evaluator, **kwargs):
         if evaluator is None or isinstance(evaluator, six.string_types):
-            self._evaluators.add(self.async_language_session_class(kernel=evaluator, **kwargs))
+            evaluator = self.async_language_session_class(kernel=evaluator, **kwargs)
         elif isinstance(evaluator, WolframAsyncEvaluator):
             if evaluator in self._evaluators:
-                self._evaluators.add(evaluator.duplicate())
-            else:
-                self._evaluators.add(evaluator)
+                evaluator = evaluator.duplicate()
         else:
             raise ValueError(
                 "Invalid asynchronous evaluator specifications. %s is neither a string nor a WolframAsyncEvaluator instance."
                 % evaluator
             )
+        self._evaluators.add(evaluator)
+        if self._template is None:
+            self._template = evaluator
 
     async def _kernel_loop(self, kernel):
+        recycling = self._recycling(kernel)
+        started_at = time.perf_counter()
+        evaluations = 0
+        replacement = None
+        retired = False
+        # evaluations routed to this kernel by their affinity key.
+        own = self._affinity_queues[kernel] = asyncio.PriorityQueue()
         while True:
             try:
                 future = None
                 task = None
+                source = None
                 logger.debug("Wait for a new queue entry.")
-                task = await self._queue.get()
+                task, source = await self._next_task(own, replacement)
+                if task is _REPLACED:
+                    if replacement.result():
+                        retired = True
+                        break
+                    # the replacement failed to start, keep this kernel for another recycling period.
+                    replacement = None
+                    self._recycled = None
+                    started_at = time.perf_counter()
+                    evaluations = 0
+                    continue
+                if task is _IDLE:
+                    if len(self._kernel_evaluation_loop_tasks) > self.requestedsize:
+                        retired = True
+                        break
+                    continue
                 if task is None:
                     logger.info("Termination requested for kernel: %s." % kernel)
                     break
-                # func is one of the evaluate* methods from WolframAsyncEvaluator.
-                future, func, args, kwargs = task
+                future = task.future
+                self._wait_times.append(time.perf_counter() - task.queued_at)
+                if source is self._queue:
+                    self._queued_cost -= task.cost
                 # these methods can't be cancelled since the kernel is evaluating anyway.
                 try:
-                    func = getattr(kernel, func)
-                    result = await asyncio.shield(func(*args, **kwargs))
+                    if task.setup is not None:
+                        await asyncio.shield(self._ensure_setup(kernel, task.setup))
+                    # func is one of the evaluate* methods from WolframAsyncEvaluator.
+                    func = getattr(kernel, task.func)
+                    result = await asyncio.shield(func(*task.args, **task.kwargs))
                     future.set_result(result)
                 except Exception as e:
                     future.set_exception(e)
+                evaluations += 1
+                if (
+                    recycling
+                    and replacement is None
+                    and self._recycled is None
+                    and await self._should_recycle(kernel, started_at, evaluations)
+                ):
+                    self._recycled = kernel
+                    replacement = self._start_replacement(kernel)
             # First exceptions are those we can't recover from.
             except KeyboardInterrupt:
                 logger.exception("Loop associated to kernel %s interrupted by user.", kernel)
@@ -148,8 +292,183 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
                     logger.warning("No future object. Exception raised in loop was: %s" % e)
                     raise
             finally:
-                if task:
-                    self._queue.task_done()
+                if source is not None:
+                    source.task_done()
+        self._release_affinity(kernel)
+        if self._recycled is kernel:
+            self._recycled = None
+        if retired:
+            await self._retire(kernel)
+
+    def _recycling(self, kernel):
+        """Whether `kernel` is subject to the recycling policy. Only local kernels are recycled."""
+        return isinstance(kernel, WolframLanguageAsyncSession) and (
+            self.max_evaluations or self.max_age or self.max_memory
+        )
+
+    async def _should_recycle(self, kernel, started_at, evaluations):
+        if self.max_evaluations and evaluations >= self.max_evaluations:
+            return True
+        now = time.perf_counter()
+        if self.max_age and now - started_at >= self.max_age:
+            return True
+        if self.max_memory and now - self._memory_checks.get(kernel, 0) >= self.MEMORY_CHECK_PERIOD:
+            self._memory_checks[kernel] = now
+            try:
+                return await kernel.evaluate(wl.MemoryInUse()) >= self.max_memory
+            except Exception as e:
+                logger.warning("Failed to read memory in use by kernel %s: %s", kernel, e)
+        return False
+
+    def _start_replacement(self, kernel):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Recycling kernel %s. Starting its replacement.", kernel)
+        return self._spawn(kernel.duplicate())
+
+    def _spawn(self, kernel):
+        """Start a new kernel in the background. The task result is whether it started."""
+        self._evaluators.add(kernel)
+        task = asyncio.ensure_future(self._async_spawn(kernel))
+        self._kernel_spawn_tasks.add(task)
+        task.add_done_callback(self._kernel_spawn_tasks.discard)
+        return task
+
+    async def _async_spawn(self, kernel):
+        started = await self._async_start_kernel(kernel)
+        if not started:
+            self._evaluators.discard(kernel)
+            # the start may have been cancelled before any clean-up.
+            await kernel.stop()
+        return started
+
+    async def _next_task(self, own, replacement=None):
+        """Return the next task of a kernel and the queue it comes from.
+
+        Tasks routed to the kernel, in `own`, come before those of the pool queue. :data:`_REPLACED` is returned once
+        `replacement` is done, even if tasks are queued, after the task taken while waiting for it, if any. :data:`_IDLE`
+        is returned if nothing was queued for `idle_timeout` seconds when the pool is scalable."""
+        if replacement is not None and replacement.done():
+            return _REPLACED, None
+        if not own.empty():
+            return own.get_nowait()[-1], own
+        own_get = asyncio.ensure_future(own.get())
+        get = asyncio.ensure_future(self._queue.get())
+        pending = {own_get, get} if replacement is None else {own_get, get, replacement}
+        timeout = self.idle_timeout if self.max_poolsize else None
+        await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        # a task taken from the pool queue is evaluated even if the replacement is done: producers blocked by a
+        # bounded queue may have filled the free slot already.
+        if get.done():
+            if own_get.done():
+                # both got an entry, the routed one is evaluated next.
+                own.put_nowait(own_get.result())
+                own.task_done()
+            else:
+                own_get.cancel()
+            return get.result()[-1], self._queue
+        get.cancel()
+        if own_get.done():
+            return own_get.result()[-1], own
+        own_get.cancel()
+        if replacement is not None and replacement.done():
+            return _REPLACED, None
+        return _IDLE, None
+
+    def _route(self, affinity_key):
+        """Return the queue of the kernel evaluating `affinity_key`.
+
+        New keys, and keys whose kernel left the pool, are assigned to the running kernel with the fewest keys. The
+        pool queue is returned when no kernel is running."""
+        kernel = self._affinity.get(affinity_key)
+        if kernel not in self._affinity_queues:
+            if not self._affinity_queues:
+                return self._queue
+            kernel = min(self._affinity_queues, key=lambda k: len(self._affinity_keys.get(k, ())))
+            self._affinity[affinity_key] = kernel
+            self._affinity_keys.setdefault(kernel, set()).add(affinity_key)
+        return self._affinity_queues[kernel]
+
+    def _release_affinity(self, kernel):
+        """Forget the keys of a kernel leaving the pool, and route its pending tasks again, unless the pool stopped."""
+        own = self._affinity_queues.pop(kernel, None)
+        for key in self._affinity_keys.pop(kernel, ()):
+            self._affinity.pop(key, None)
+        while own is not None and not own.empty():
+            entry = own.get_nowait()
+            if self.stopped:
+                entry[-1].future.cancel()
+                continue
+            queue = self._route(entry[-1].affinity_key)
+            if queue is self._queue:
+                self._queued_cost += entry[-1].cost
+            queue.put_nowait(entry)
+
+    async def _ensure_setup(self, kernel, setup):
+        """Evaluate `setup` with `kernel`, unless a local kernel already did since it started."""
+        if not isinstance(kernel, WolframLanguageAsyncSession):
+            await kernel.evaluate(setup)
+            return
+        controller, loaded = self._loaded.get(kernel, (None, ()))
+        if controller is kernel.kernel_controller and setup in loaded:
+            return
+        await kernel.evaluate(setup)
+        # a new controller is created when the kernel restarts, with a fresh state.
+        controller, loaded = self._loaded.get(kernel, (None, set()))
+        if controller is not kernel.kernel_controller:
+            controller, loaded = kernel.kernel_controller, set()
+            self._loaded[kernel] = (controller, loaded)
+        loaded.add(setup)
+
+    def _autoscale(self):
+        """Start a new kernel if the pool is scalable and the load requires it."""
+        if not self.max_poolsize or self._scale_up_task is not None or self.stopped:
+            return
+        size = len(self._kernel_evaluation_loop_tasks)
+        if size >= self._size_cap:
+            return
+        if self._queued_cost < self.scale_up_queue_depth * max(size, 1) and (
+            self.scale_up_wait is None or self._wait_percentile(95) <= self.scale_up_wait
+        ):
+            return
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Adding a kernel to the pool of %i kernels.", size)
+        self._scale_up_task = self._spawn(self._template.duplicate())
+        self._scale_up_task.add_done_callback(self._scaled_up)
+
+    def _scaled_up(self, task):
+        self._scale_up_task = None
+        # wait times measured before the new kernel was added are no longer relevant.
+        self._wait_times.clear()
+        # a start interrupted by stop says nothing about the pool capacity.
+        if task.cancelled() or self.stopped:
+            return
+        if task.result():
+            # the load may still require more kernels.
+            self._autoscale()
+        else:
+            self._size_cap = len(self._kernel_evaluation_loop_tasks)
+            logger.warning(
+                "Failed to add a kernel to the pool. Pool size is now limited to %i.", self._size_cap
+            )
+
+    def _wait_percentile(self, percent):
+        if not self._wait_times:
+            return 0
+        waits = sorted(self._wait_times)
+        return waits[(len(waits) - 1) * percent // 100]
+
+    async def _retire(self, kernel):
+        """Stop a kernel that was recycled or idle, once its evaluation loop is done."""
+        self._kernel_evaluation_loop_tasks.remove(asyncio.current_task())
+        self._evaluators.discard(kernel)
+        self._memory_checks.pop(kernel, None)
+        self._loaded.pop(kernel, None)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Kernel %s retired from the pool.", kernel)
+        try:
+            await kernel.stop()
+        except Exception as e:
+            logger.warning("Exception raised while stopping recycled kernel %s: %s", kernel, e)
 
     async def _async_start_kernel(self, kernel):
         kernel_started = False
@@ -180,6 +499,7 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
                 logger.info("New kernel started in pool: %s.", kernel)
             # register the task. The loop is not always started at this point.
             self._kernel_evaluation_loop_tasks.append(task)
+        return kernel_started
 
     @property
     def started(self):
@@ -227,13 +547,18 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
             try:
                 # request for loop termination.
                 for _ in range(len(self._kernel_evaluation_loop_tasks)):
-                    await self._queue.put(None)
+                    await self._queue.put((math.inf, next(self._sequence), None))
                 # wait for loop to finish before terminating the kernels
                 await asyncio.wait(self._kernel_evaluation_loop_tasks)
             except CancelledError:
                 pass
             except Exception as e:
                 logger.warning("Exception raised while terminating loop: %s", e)
+        # kernels started in the background are stopped with the other evaluators.
+        if len(self._kernel_spawn_tasks) > 0:
+            for task in self._kernel_spawn_tasks:
+                task.cancel()
+            await asyncio.wait(self._kernel_spawn_tasks)
         # terminate the kernel instances, if any started.
         tasks = {asyncio.create_task(kernel.stop()) for kernel in self._evaluators}
         # `wait` raises the first exception, but wait for all tasks to finish.
@@ -248,9 +573,23 @@ class WolframEvaluatorPool(WolframAsyncEvaluator):
         if self.stopped:
             await self.restart()
 
-    async def _put_evaluation_task(self, future, func, expr, **kwargs):
+    async def _put_evaluation_task(
+        self, future, func, expr, priority=0, cost=1, affinity_key=None, setup=None, **kwargs
+    ):
         await self.ensure_started()
-        await self._queue.put((future, func, (expr,), kwargs))
+        task = _PoolTask(future, func, (expr,), kwargs, cost, affinity_key, setup)
+        entry = (priority, next(self._sequence), task)
+        queue = self._queue if affinity_key is None else self._route(affinity_key)
+        if queue is self._queue:
+            self._queued_cost += cost
+            self._autoscale()
+            try:
+                await self._queue.put(entry)
+            except BaseException:
+                self._queued_cost -= cost
+                raise
+        else:
+            queue.put_nowait(entry)
         self.eval_count += 1
 
     async def evaluate(self, expr, **kwargs):
@@ -3,6 +3,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 import logging
 
 from wolframclient.deserializers import binary_deserialize
+from wolframclient.deserializers.wxf.wxflazy import LazyWXF
+from wolframclient.deserializers.wxf.wxfpush import WXFPushParser
 from wolframclient.evaluation.cloud.request_adapter import wrap_response
 from wolframclient.exception import (
     RequestException,
@@ -25,6 +27,7 @@ __all__ = [
     "WolframCloudEvaluationWXFResponse",
     "WolframCloudEvaluationJSONResponse",
     "WolframKernelEvaluationResult",
+    "WolframEvaluationDataResult",
     "WolframAPIResponseAsync",
     "WolframEvaluationJSONResponseAsync",
     "WolframEvaluationWXFResponseAsync",
@@ -228,10 +231,13 @@ class WolframKernelEvaluationResult(WolframEvaluationResultBase):
     the kernel then the success status is `False`.
 
     The evaluation result is lazily computed when accessing the field `result`. The WXF bytes holding the evaluation
-    result are stored in `wxf` and thus can be later parsed with a customized parser if necessary.
+    result are stored in `wxf`, as a read-only :class:`memoryview` into `wxf_eval_data`, and thus can be later parsed
+    with a customized parser if necessary.
 
     All strings printed during the evaluation (e.g. Print["something"]) are stored in property `output` as a list.
-    The dict holding evaluation data is available in `evaluation_data`.
+    The evaluation data is available in `parsed_response` as a
+    :class:`~wolframclient.deserializers.wxf.wxflazy.LazyWXF`, which only decodes the keys that are accessed.
+    `wxf_eval_data` can also be such a view, e.g. a part of the reply to a batch of evaluations.
     """
 
     def __init__(self, wxf_eval_data, consumer=None):
@@ -241,14 +247,43 @@ class WolframKernelEvaluationResult(WolframEvaluationResultBase):
         self.wxf = None
         self.consumer = consumer
 
+    @classmethod
+    def from_batch(cls, wxf_eval_data, consumer=None):
+        """Return the list of the results of a batch of evaluations, from the WXF list of their evaluation data."""
+        batch = LazyWXF(wxf_eval_data, zero_copy=True, binary_string_views=True)
+        return [cls(batch.lazy(i), consumer=consumer) for i in range(len(batch))]
+
     def parse_response(self):
-        self.parsed_response = binary_deserialize(self.wxf_evaluation_data)
+        # only the keys that are accessed are decoded, the serialized result is kept as a view into the kernel reply.
+        if isinstance(self.wxf_evaluation_data, LazyWXF):
+            self.parsed_response = self.wxf_evaluation_data
+        else:
+            self.parsed_response = LazyWXF(
+                self.wxf_evaluation_data, zero_copy=True, binary_string_views=True
+            )
         self.wxf = self.parsed_response["Result"]
 
     @cached_property
     def result(self):
         # Kernel evaluation encode the result as WXF. Lazily decoding it using the user consumer.
-        return binary_deserialize(super().result, consumer=self.consumer)
+        # Arrays decoded by the default consumer are views into the kernel reply.
+        return binary_deserialize(
+            super().result, consumer=self.consumer, zero_copy=self.consumer is None
+        )
+
+
+class WolframEvaluationDataResult(WolframEvaluationResultBase):
+    """Result object built from the association returned by :wl:`EvaluationData`, already decoded.
+
+    Results of the evaluations of a batch sent to the cloud are of this class.
+    """
+
+    def __init__(self, evaluation_data):
+        super().__init__()
+        self.evaluation_data = evaluation_data
+
+    def parse_response(self):
+        self.parsed_response = self.evaluation_data
 
 
 class WolframCloudEvaluationResponse(WolframEvaluationResultBase):
@@ -295,11 +330,14 @@ class WolframCloudEvaluationWXFResponse(WolframCloudEvaluationResponse):
     """Result object associated with cloud evaluation request WXF encoded."""
 
     def parse_response(self):
-        wxf = self.http_response.content()
+        # the body is decoded while it is read, so that it is never held in memory as a whole.
         try:
-            self.parsed_response = binary_deserialize(wxf)
+            self.parsed_response = _decode_wxf_chunks(self.http_response.iter_chunks())
         except WolframLanguageException:
             self.build_invalid_format(response_format_name="WXF")
+        finally:
+            # release the connection, even if the body was not entirely read.
+            self.http_response.close()
 
 
 class WolframCloudEvaluationJSONResponse(WolframCloudEvaluationResponse):
@@ -447,11 +485,16 @@ class WolframEvaluationWXFResponseAsync(WolframCloudEvaluationResponseAsync):
     """Asynchronous result object associated with cloud evaluation request encoded with WXF."""
 
     async def parse_response(self):
-        wxf = await self.http_response.content()
+        # the body is decoded while it is still arriving, rule by rule.
         try:
-            self.parsed_response = binary_deserialize(wxf)
+            response = await _decode_wxf_chunks_async(self.http_response)
         except WolframLanguageException:
             self.build_invalid_format(response_format_name="WXF")
+        else:
+            if isinstance(response, dict):
+                self.parsed_response = response
+            else:
+                self.build_invalid_format(response_format_name="WXF")
 
 
 _DEFAULT_DECODERS = {
@@ -460,14 +503,49 @@ _DEFAULT_DECODERS = {
 }
 
 
+def _wxf_parser_result(parser, parts):
+    """Return the expression decoded by a :class:`WXFPushParser`, given the parts returned by its feed method."""
+    parser.close()
+    if parser.is_association:
+        return parser.dict_class(parts)
+    if parser.is_list:
+        return tuple(parts)
+    return parts[0]
+
+
+def _decode_wxf_chunks(chunks):
+    """Decode a WXF body from an iterable of chunks, without buffering the whole body."""
+    parser = WXFPushParser()
+    parts = []
+    for chunk in chunks:
+        parts.extend(parser.feed(chunk))
+    return _wxf_parser_result(parser, parts)
+
+
+async def _decode_wxf_chunks_async(response):
+    """Decode a WXF body read by chunks from an asynchronous HTTP response adapter."""
+    parser = WXFPushParser()
+    parts = []
+    chunk = await response.read_chunk()
+    while chunk:
+        parts.extend(parser.feed(chunk))
+        chunk = await response.read_chunk()
+    return _wxf_parser_result(parser, parts)
+
+
 class WolframAPIResponse(WolframResult):
     """A generic API response.
 
     This class is lazily constructed when the response body becomes available.
 
     A decoder is inferred from the content type. Currently JSON and WXF formats are supported.
+
+    Responses are :attr:`retryable` when the same request may succeed if sent again later, e.g. after the server was
+    overloaded.
     """
 
+    retryable = False
+
     def __init__(self, response, decoder=None):
         self.response = response
         self.content_type = response.headers().get("Content-Type", None)
@@ -541,7 +619,14 @@ class WolframAPIResponse200(WolframAPIResponse):
 
     def build(self):
         self._built = True
-        if self.decoder is not None:
+        if self.decoder is binary_deserialize:
+            try:
+                self.result = _decode_wxf_chunks(self.response.iter_chunks())
+            except Exception as e:
+                self.success = False
+                self._failure = "Decoder error: {}".format(e)
+                self.exception = e
+        elif self.decoder is not None:
             try:
                 self.result = self.decoder(self.response.content())
             except Exception as e:
@@ -554,7 +639,14 @@ class WolframAPIResponse200(WolframAPIResponse):
 
 class WolframAPIResponse200Async(WolframAPIResponseAsync, WolframAPIResponse200):
     async def build(self):
-        if self.decoder is not None:
+        if self.decoder is binary_deserialize:
+            try:
+                self.result = await _decode_wxf_chunks_async(self.response)
+            except Exception as e:
+                self.success = False
+                self._failure = "Decoder error: {}".format(e)
+                self.exception = e
+        elif self.decoder is not None:
             try:
                 self.result = self.decoder(await self.response.content())
             except Exception as e:
@@ -723,17 +815,51 @@ class WolframAPIResponse404Async(WolframAPIResponse404, WolframAPIResponseAsync)
 
 
 class WolframAPIResponseGeneric(WolframAPIFailureResponse):
+    def __init__(self, response, decoder=None):
+        super().__init__(response, decoder)
+        # server errors such as 502 Bad Gateway or 503 Service Unavailable are transient.
+        self.retryable = self.status >= 500
+
     def build(self):
         self._failure = self.response.text()
         self._built = True
 
 
 class WolframAPIResponseGenericAsync(WolframAPIResponseAsync):
+    def __init__(self, response, decoder=None):
+        super().__init__(response, decoder)
+        self.retryable = self.status >= 500
+
     async def build(self):
         self._failure = await self.response.text()
         self._built = True
 
 
+def _retry_after(response):
+    """Return the delay in seconds from the Retry-After header of `response`, or None."""
+    try:
+        return float(response.headers().get("Retry-After"))
+    except (TypeError, ValueError):
+        # missing, or an HTTP date.
+        return None
+
+
+class WolframAPIResponse429(WolframAPIResponseGeneric):
+    """Too many requests were sent. :attr:`retry_after` is the delay in seconds advised by the server, if any."""
+
+    def __init__(self, response, decoder=None):
+        super().__init__(response, decoder)
+        self.retryable = True
+        self.retry_after = _retry_after(response)
+
+
+class WolframAPIResponse429Async(WolframAPIResponseGenericAsync):
+    def __init__(self, response, decoder=None):
+        super().__init__(response, decoder)
+        self.retryable = True
+        self.retry_after = _retry_after(response)
+
+
 class WolframAPIResponse500(WolframAPIResponseGeneric):
     def __init__(self, response, decoder=None):
         super().__init__(response, decoder)
@@ -758,6 +884,7 @@ class WolframAPIResponseBuilder:
         400: WolframAPIResponse400,
         401: WolframAPIResponse401,
         404: WolframAPIResponse404,
+        429: WolframAPIResponse429,
         500: WolframAPIResponse500,
     }
     async_response_mapper = {
@@ -767,6 +894,7 @@ class WolframAPIResponseBuilder:
         400: WolframAPIResponse400Async,
         401: WolframAPIResponse401Async,
         404: WolframAPIResponse404Async,
+        429: WolframAPIResponse429Async,
         500: WolframAPIResponse500Async,
     }
 
@@ -205,9 +205,9 @@ class Encoder:
         **kwargs,
     ):
 
-        self.encode = self.chain_normalizer(
-            normalizer, encoder=safe_import_string(encoder or wolfram_encoder)
-        )
+        self.encoder = safe_import_string(encoder or wolfram_encoder)
+        self.normalizer = normalizer
+        self.encode = self.chain_normalizer(normalizer, encoder=self.encoder)
         self.object_processor = object_processor
         self.target_kernel_version = target_kernel_version or installation_version()
         self._properties = kwargs
@@ -5,7 +5,7 @@ import math
 from wolframclient.language.array import NumericArray, PackedArray
 from wolframclient.language.expression import WLFunction, WLInputExpression, WLSymbol
 from wolframclient.serializers.serializable import WLSerializable
-from wolframclient.serializers.utils import safe_len
+from wolframclient.serializers.utils import pack_numbers, safe_len
 from wolframclient.utils import six
 from wolframclient.utils.datastructures import Association
 from wolframclient.utils.dispatch import Dispatch
@@ -142,6 +142,10 @@ def encode_complex(serializer, o):
 
 @encoder.dispatch(six.iterable_types)
 def encode_iter(serializer, o):
+    if serializer.get_property("auto_pack"):
+        packed = pack_numbers(o)
+        if packed:
+            return serializer.serialize_packed_array(*packed)
     return serializer.serialize_iterable(map(serializer.encode, o), length=safe_len(o))
 
 
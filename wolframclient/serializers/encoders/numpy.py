@@ -76,11 +76,10 @@ def _iencode(serializer, o, mapping, processor):
     if cast_to is not None:
         o = o.astype(cast_to)
 
-    if hasattr(o, "tobytes"):
-        # Numpy 1.9+ support array.tobytes, but previous versions don't and use tostring instead.
-        data = o.tobytes()
-    else:
-        data = o.tostring()
+    # a byte view on the array memory, the data is only copied when the array is not contiguous.
+    # zero-size arrays cannot be cast, their dimensions are rejected by the processor.
+    o = numpy.ascontiguousarray(o)
+    data = memoryview(o).cast("B") if o.size else o.tobytes()
 
     return processor(data, o.shape, wl_type)
 
@@ -1,7 +1,12 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+import array
+import cmath
 import decimal
+import math
 import re
+import sys
+from itertools import chain
 
 from wolframclient.utils.encoding import force_bytes
 
@@ -43,3 +48,74 @@ def safe_len(obj):
         return len(obj)
     except TypeError:
         return
+
+
+# array typecodes and WXF array types for integers, by increasing width.
+_INTEGER_TYPES = (
+    (-(1 << 7), 1 << 7, "b", "Integer8"),
+    (-(1 << 15), 1 << 15, "h", "Integer16"),
+    (-(1 << 31), 1 << 31, "l" if array.array("l").itemsize == 4 else "i", "Integer32"),
+    (-(1 << 63), 1 << 63, "q", "Integer64"),
+)
+
+
+def _pack_int(flat):
+    low, high = min(flat), max(flat)
+    for min_value, max_value, typecode, wl_type in _INTEGER_TYPES:
+        if min_value <= low and high < max_value:
+            return array.array(typecode, flat), wl_type
+
+
+def _pack_float(flat):
+    if all(map(math.isfinite, flat)):
+        return array.array("d", flat), "Real64"
+
+
+def _pack_complex(flat):
+    if all(map(cmath.isfinite, flat)):
+        return (
+            array.array("d", chain.from_iterable((c.real, c.imag) for c in flat)),
+            "ComplexReal64",
+        )
+
+
+_PACKERS = {int: _pack_int, float: _pack_float, complex: _pack_complex}
+
+
+def pack_numbers(o):
+    """Return `(data, dimensions, wl_type)` suitable for a PackedArray if `o` is a rectangular :class:`list` or
+    :class:`tuple`, nested or not, of numbers of the same type, or :data:`None` otherwise.
+
+    Other iterables, e.g. generators, sets or ranges, are not packed. Lists of :class:`int` that do not fit in 64 bits,
+    and lists of :class:`float` or :class:`complex` with non-finite values are not packed either. Data is packed
+    little endian with :mod:`array`."""
+    if o.__class__ not in (list, tuple):
+        return
+    dimensions = []
+    element = o
+    while element.__class__ in (list, tuple):
+        if not element:
+            return
+        dimensions.append(len(element))
+        element = element[0]
+
+    flat = o
+    for dimension in dimensions[1:]:
+        for sub in flat:
+            if sub.__class__ not in (list, tuple) or len(sub) != dimension:
+                return
+        flat = tuple(chain.from_iterable(flat))
+
+    types = set(map(type, flat))
+    if len(types) != 1:
+        return
+    try:
+        packed = _PACKERS[types.pop()](flat)
+    except KeyError:
+        return
+    if packed is None:
+        return
+    data, wl_type = packed
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data, dimensions, wl_type
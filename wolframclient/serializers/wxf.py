@@ -1,16 +1,24 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
-from itertools import chain, starmap
+import math
+import mmap
+import os
+import sys
+from functools import lru_cache
+from itertools import chain, repeat, starmap
 
 from wolframclient.serializers.base import FormatSerializer
-from wolframclient.serializers.utils import py_encode_decimal, safe_len
+from wolframclient.serializers.encoders import builtin
+from wolframclient.serializers.utils import pack_numbers, py_encode_decimal, safe_len
 from wolframclient.serializers.wxfencoder.constants import (
+    STRUCT_MAPPING,
     WXF_CONSTANTS,
     WXF_HEADER_COMPRESS,
     WXF_HEADER_SEPARATOR,
     WXF_VERSION,
 )
 from wolframclient.serializers.wxfencoder.utils import (
+    fixed_width_varint_bytes,
     float_to_bytes,
     integer_size,
     integer_to_bytes,
@@ -19,10 +27,15 @@ from wolframclient.serializers.wxfencoder.utils import (
     varint_bytes,
 )
 from wolframclient.utils import six
-from wolframclient.utils.api import zlib
+from wolframclient.utils.api import futures, zlib
 from wolframclient.utils.encoding import concatenate_bytes, force_bytes, force_text
 from wolframclient.utils.functional import partition
 
+_pack_real64 = STRUCT_MAPPING.Real64.pack
+
+# width of the length placeholders written by streaming exports, enough for 2**56 - 1 parts.
+STREAMING_LENGTH_WIDTH = 8
+
 
 def serialize_rule(key, value, sep=(WXF_CONSTANTS.Rule,)):
     return chain(sep, key, value)
@@ -42,6 +55,18 @@ def get_length(iterable, length=None):
     return iterable, len(iterable)
 
 
+class LengthPlaceholder:
+    """A token standing for the length of a function whose parts are counted while they are serialized.
+
+    It is yielded twice: before the head, and once all the parts were serialized with :attr:`length` set."""
+
+    __slots__ = "length", "position"
+
+    def __init__(self):
+        self.length = None
+        self.position = None
+
+
 def compress(data):
 
     compressor = zlib.compressobj()
@@ -51,23 +76,507 @@ def compress(data):
     yield compressor.flush()
 
 
-class WXFSerializer(FormatSerializer):
-    """Serialize python objects to WXF."""
+def write_varint(buffer, int_value):
+    if int_value < 0x80:
+        buffer.append(int_value)
+    else:
+        buffer += varint_bytes(int_value)
+
+
+@lru_cache(maxsize=1024)
+def symbol_to_wxf(name):
+    name = force_bytes(name)
+    return concatenate_bytes((WXF_CONSTANTS.Symbol, varint_bytes(len(name)), name))
+
+
+def _write_symbol(serializer, buffer, o):
+    buffer += symbol_to_wxf(o.name)
+
+
+def _write_booleans(serializer, buffer, o):
+    buffer += symbol_to_wxf(o and "True" or "False")
+
+
+def _write_none(serializer, buffer, o):
+    buffer += symbol_to_wxf("Null")
+
+
+def _write_int(serializer, buffer, o):
+    if -0x80 <= o < 0x80:
+        buffer += WXF_CONSTANTS.Integer8
+        buffer.append(o & 0xFF)
+        return
+    try:
+        wxf_type, int_size = integer_size(o)
+    except ValueError:
+        o = b"%i" % o
+        buffer += WXF_CONSTANTS.BigInteger
+        write_varint(buffer, len(o))
+        buffer += o
+    else:
+        buffer += wxf_type
+        buffer += integer_to_bytes(o, int_size)
+
+
+def _write_float(serializer, buffer, o):
+    if math.isinf(o):
+        buffer += WXF_CONSTANTS.Function
+        buffer.append(1)
+        buffer += symbol_to_wxf("DirectedInfinity")
+        _write_int(serializer, buffer, o < 0 and -1 or 1)
+    elif math.isnan(o):
+        buffer += symbol_to_wxf("Indeterminate")
+    else:
+        buffer += WXF_CONSTANTS.Real64
+        buffer += _pack_real64(o)
+
+
+def _write_complex(serializer, buffer, o):
+    buffer += WXF_CONSTANTS.Function
+    buffer.append(2)
+    buffer += symbol_to_wxf("Complex")
+    buffer += WXF_CONSTANTS.Real64
+    buffer += _pack_real64(o.real)
+    buffer += WXF_CONSTANTS.Real64
+    buffer += _pack_real64(o.imag)
+
+
+def _write_text(serializer, buffer, o):
+    o = o.encode("utf-8")
+    buffer += WXF_CONSTANTS.String
+    write_varint(buffer, len(o))
+    buffer += o
+
+
+def _write_bytes(serializer, buffer, o):
+    buffer += WXF_CONSTANTS.BinaryString
+    write_varint(buffer, len(o))
+    buffer += o
+
+
+def _write_dict(serializer, buffer, o):
+    write = serializer.write_expr
+    buffer += WXF_CONSTANTS.Association
+    write_varint(buffer, len(o))
+    for key, value in o.items():
+        buffer += WXF_CONSTANTS.Rule
+        write(buffer, key)
+        write(buffer, value)
+
+
+def _write_iter(serializer, buffer, o):
+    if serializer.get_property("auto_pack"):
+        packed = pack_numbers(o)
+        if packed:
+            for chunk in packed_array_to_wxf(*packed):
+                buffer += chunk
+            return
+    if safe_len(o) is None:
+        o = tuple(o)
+    write = serializer.write_expr
+    buffer += WXF_CONSTANTS.Function
+    write_varint(buffer, len(o))
+    buffer += symbol_to_wxf("List")
+    for element in o:
+        write(buffer, element)
+
+
+def _write_function(serializer, buffer, o):
+    write = serializer.write_expr
+    buffer += WXF_CONSTANTS.Function
+    write_varint(buffer, len(o.args))
+    write(buffer, o.head)
+    for arg in o.args:
+        write(buffer, arg)
+
+
+def _write_serializable(serializer, buffer, o):
+    serializer.write_expr(buffer, o.to_wl())
+
+
+# writers appending directly to a bytearray, indexed by the builtin encoder they replace.
+# objects resolved to any other encoder are serialized with the generic token generators.
+BUFFER_WRITERS = {
+    builtin.encode_booleans: _write_booleans,
+    builtin.encode_none: _write_none,
+    builtin.encode_bytes: _write_bytes,
+    builtin.encode_text: _write_text,
+    builtin.encode_dict: _write_dict,
+    builtin.encode_int: _write_int,
+    builtin.encode_float: _write_float,
+    builtin.encode_complex: _write_complex,
+    builtin.encode_iter: _write_iter,
+    builtin.encode_symbol: _write_symbol,
+    builtin.encode_function: _write_function,
+    builtin.encode_serializable: _write_serializable,
+}
+
+
+# adler32 modulus, used to combine the checksums of segments compressed in parallel.
+_ADLER_BASE = 65521
+
+
+def adler32_combine(adler1, adler2, length2):
+    """Return the adler32 checksum of two concatenated byte sequences from their checksums."""
+    rem = length2 % _ADLER_BASE
+    low1, high1 = adler1 & 0xFFFF, adler1 >> 16
+    low = (low1 + (adler2 & 0xFFFF) - 1) % _ADLER_BASE
+    high = (rem * low1 + high1 + (adler2 >> 16) - rem) % _ADLER_BASE
+    return low | high << 16
+
+
+def _serialize_segment(options, parts, is_mapping, compress, last):
+    # runs in a worker: serialize a slice of the parts of the top-level expression, without header.
+    serializer = WXFSerializer(**options)
+    buffer = bytearray()
+    if is_mapping:
+        for key, value in parts:
+            buffer += WXF_CONSTANTS.Rule
+            serializer.write_expr(buffer, key)
+            serializer.write_expr(buffer, value)
+    else:
+        for part in parts:
+            serializer.write_expr(buffer, part)
+
+    if not compress:
+        return bytes(buffer)
+
+    # raw deflate, ending on a byte boundary so that segments can be concatenated.
+    compressor = zlib.compressobj(wbits=-15)
+    data = compressor.compress(buffer) + compressor.flush(
+        last and zlib.Z_FINISH or zlib.Z_SYNC_FLUSH
+    )
+    return data, zlib.adler32(buffer), len(buffer)
+
+
+#: initial size of the files written by :meth:`WXFSerializer.write_mmap`.
+MMAP_INITIAL_SIZE = 1 << 20
+
+
+def _free_threading():
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
 
-    def __init__(self, normalizer=None, compress=False, **opts):
+
+class WXFSerializer(FormatSerializer):
+    """Serialize python objects to WXF.
+
+    When `buffered` is set to :data:`True`, builtin types are written in place into one growable :class:`bytearray`
+    instead of being yielded token by token. The output is the same in both modes. Passing a :class:`bytearray` as
+    `stream` to :meth:`export` always uses the buffered writer and appends the serialized bytes to it.
+
+    When `memory_map` is set to :data:`True` and `stream` is a file path, the file is preallocated to the final size and
+    the serialized bytes are copied into a memory mapping of it. Array data is not copied in memory beforehand.
+
+    Iterables without a length, e.g. generators, are normally turned into a :class:`tuple` to find their length before
+    being serialized. When `streaming` is set to :data:`True`, a fixed-width length placeholder is written instead,
+    and patched once the parts were serialized, so that generators are consumed while they are written. This requires
+    an uncompressed output to a file path, a seekable stream or a :class:`bytearray`.
+
+    Alternatively, when `chunk_size` is set, `data` must be an iterable, and is serialized as a sequence of WXF
+    documents, each a `List` of at most `chunk_size` elements. This works with compression and any stream. Such
+    sequences are read with :func:`~wolframclient.deserializers.binary_deserialize_sequence`.
+
+    When `workers` is set, a top-level :class:`list`, :class:`tuple` or :class:`dict` with at least
+    :attr:`parallel_min_length` parts is split into slices serialized in parallel, by a pool of `workers` processes, or
+    threads when the interpreter runs without a GIL. An instance of :class:`~concurrent.futures.Executor` can be
+    passed instead to reuse a pool, with its number of workers as `worker_count`, which defaults to the number of CPUs.
+    Data and named parameters must then be picklable. When compressed, each slice is deflated independently and the
+    segments are joined into a single zlib stream. With `chunk_size`, the documents share the same pool.
+    """
+
+    parallel_min_length = 1000
+
+    def __init__(
+        self,
+        normalizer=None,
+        compress=False,
+        buffered=False,
+        memory_map=False,
+        streaming=False,
+        chunk_size=None,
+        workers=None,
+        worker_count=None,
+        **opts
+    ):
         super().__init__(normalizer=normalizer, **opts)
         self.compress = compress
+        self.buffered = buffered
+        self.memory_map = memory_map
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.workers = workers
+        if isinstance(workers, futures.Executor):
+            self.worker_count = worker_count or os.cpu_count() or 1
+        else:
+            self.worker_count = workers
+        self._writers = {}
+        # parameters used to build the serializers of the workers.
+        self._worker_options = dict(opts, normalizer=normalizer)
+
+    def export(self, data, stream=None):
+        if self.streaming:
+            return self.write_streaming(data, stream)
+
+        if self.is_parallel(data):
+            if isinstance(stream, bytearray):
+                for token in self.generate_bytes(data):
+                    stream += token
+                return stream
+            return super().export(data, stream=stream)
+
+        if self.chunk_size:
+            if isinstance(stream, bytearray):
+                for token in self.generate_bytes(data):
+                    stream += token
+                return stream
+            return super().export(data, stream=stream)
+
+        if isinstance(stream, bytearray):
+            return self.write_bytes(data, stream)
+
+        if self.memory_map and isinstance(stream, six.string_types):
+            return self.write_mmap(data, stream)
+
+        if not self.buffered:
+            return super().export(data, stream=stream)
+
+        buffer = self.write_bytes(data)
+
+        if stream:
+            if isinstance(stream, six.string_types):
+                with open(stream, "wb") as file:
+                    file.write(buffer)
+                    return stream
+
+            stream.write(buffer)
+            return stream
+
+        return bytes(buffer)
+
+    def write_bytes(self, data, buffer=None):
+        """Append the WXF serialization of `data`, header included, to `buffer` and return it.
+
+        A new :class:`bytearray` is allocated when `buffer` is :data:`None`."""
+
+        if buffer is None:
+            buffer = bytearray()
+
+        if self.compress:
+            body = bytearray()
+            self.write_expr(body, data)
+            compressor = zlib.compressobj()
+            buffer += WXF_VERSION
+            buffer += WXF_HEADER_COMPRESS
+            buffer += WXF_HEADER_SEPARATOR
+            buffer += compressor.compress(body)
+            buffer += compressor.flush()
+        else:
+            buffer += WXF_VERSION
+            buffer += WXF_HEADER_SEPARATOR
+            self.write_expr(buffer, data)
+
+        return buffer
+
+    def write_mmap(self, data, path):
+        """Write the WXF serialization of `data` to the file at `path` through a memory mapping and return `path`."""
+
+        # chunks are written as they are generated. The file and its mapping grow by doubling, and the file is
+        # truncated to the final size.
+        size = MMAP_INITIAL_SIZE
+        offset = 0
+        with open(path, "w+b") as file:
+            file.truncate(size)
+            mapped = mmap.mmap(file.fileno(), size)
+            try:
+                for chunk in self.generate_bytes(data):
+                    end = offset + memoryview(chunk).nbytes
+                    if end > size:
+                        size = max(2 * size, end)
+                        mapped.close()
+                        file.truncate(size)
+                        mapped = mmap.mmap(file.fileno(), size)
+                    mapped[offset:end] = chunk
+                    offset = end
+            finally:
+                mapped.close()
+            file.truncate(offset)
+
+        return path
+
+    def write_streaming(self, data, stream=None):
+        """Write `data` to `stream`, patching the length of iterables once they are consumed."""
+        if self.compress:
+            raise ValueError(
+                "Streaming export cannot patch compressed data. Use chunk_size to export in parts."
+            )
+
+        if stream is None or isinstance(stream, bytearray):
+            buffer = bytearray() if stream is None else stream
+            for token in self.generate_bytes(data):
+                if token.__class__ is LengthPlaceholder:
+                    if token.length is None:
+                        token.position = len(buffer)
+                        buffer += fixed_width_varint_bytes(0, STREAMING_LENGTH_WIDTH)
+                    else:
+                        buffer[token.position : token.position + STREAMING_LENGTH_WIDTH] = (
+                            fixed_width_varint_bytes(token.length, STREAMING_LENGTH_WIDTH)
+                        )
+                else:
+                    buffer += token
+            return bytes(buffer) if stream is None else buffer
+
+        if isinstance(stream, six.string_types):
+            with open(stream, "wb") as file:
+                self.write_streaming(data, file)
+            return stream
+
+        if not getattr(stream, "seekable", lambda: False)():
+            raise ValueError(
+                "Streaming export requires a seekable stream. Use chunk_size to export in parts."
+            )
+
+        for token in self.generate_bytes(data):
+            if token.__class__ is LengthPlaceholder:
+                if token.length is None:
+                    token.position = stream.tell()
+                    stream.write(fixed_width_varint_bytes(0, STREAMING_LENGTH_WIDTH))
+                else:
+                    end = stream.tell()
+                    stream.seek(token.position)
+                    stream.write(fixed_width_varint_bytes(token.length, STREAMING_LENGTH_WIDTH))
+                    stream.seek(end)
+            else:
+                stream.write(token)
+        return stream
+
+    def write_expr(self, buffer, o):
+        """Append the WXF serialization of `o`, without header, to `buffer`."""
+        if self.normalizer is None:
+            try:
+                writer = self._writers[o.__class__]
+            except KeyError:
+                writer = self._writers[o.__class__] = BUFFER_WRITERS.get(
+                    self.encoder.resolve(o)
+                )
+            if writer is not None:
+                return writer(self, buffer, o)
+
+        for chunk in self.encode(o):
+            buffer += chunk
 
     def generate_bytes(self, data):
 
+        if self.chunk_size:
+            return self.generate_chunked_bytes(data)
+
+        return self.generate_document_bytes(data)
+
+    def generate_chunked_bytes(self, data):
+        # documents serialized in parallel share the same pool.
+        executor = self.executor() if self.workers and not self.streaming else None
+        try:
+            empty = True
+            for part in partition(data, self.chunk_size):
+                empty = False
+                yield from self.generate_document_bytes(part, executor)
+            # an empty iterable is still written as one document.
+            if empty:
+                yield from self.generate_document_bytes((), executor)
+        finally:
+            if executor is not None and executor is not self.workers:
+                executor.shutdown()
+
+    def generate_document_bytes(self, data, executor=None):
+
+        body = None
+        if self.is_parallel(data):
+            packed = self.get_property("auto_pack") and pack_numbers(data)
+            if not packed:
+                return self.generate_parallel_bytes(data, executor)
+            # numbers are written as a single PackedArray, without packing them again.
+            body = self.serialize_packed_array(*packed)
+
+        if body is None:
+            body = self.encode(data)
+
         if self.compress:
 
             return chain(
                 (WXF_VERSION, WXF_HEADER_COMPRESS, WXF_HEADER_SEPARATOR),
-                compress(self.encode(data)),
+                compress(body),
+            )
+
+        return chain((WXF_VERSION, WXF_HEADER_SEPARATOR), body)
+
+    def is_parallel(self, data):
+        """Whether `data` is large enough to be serialized in parallel by workers.
+
+        Lists of numbers packed by `auto_pack` are not, which is only checked when they are serialized."""
+        if not self.workers or self.streaming:
+            return False
+        return data.__class__ in (list, tuple, dict) and len(data) >= self.parallel_min_length
+
+    def executor(self):
+        if isinstance(self.workers, futures.Executor):
+            return self.workers
+        if _free_threading():
+            return futures.ThreadPoolExecutor(max_workers=self.workers)
+        return futures.ProcessPoolExecutor(max_workers=self.workers)
+
+    def generate_parallel_bytes(self, data, executor=None):
+        is_mapping = isinstance(data, dict)
+
+        prefix = bytearray()
+        if is_mapping:
+            prefix += WXF_CONSTANTS.Association
+            write_varint(prefix, len(data))
+            data = tuple(data.items())
+        else:
+            prefix += WXF_CONSTANTS.Function
+            write_varint(prefix, len(data))
+            prefix += symbol_to_wxf("List")
+
+        owned = executor is None
+        if owned:
+            executor = self.executor()
+        # a few slices per worker to balance uneven parts.
+        size = -(-len(data) // (4 * self.worker_count))
+        slices = tuple(data[i : i + size] for i in range(0, len(data), size))
+        lasts = (i == len(slices) - 1 for i in range(len(slices)))
+
+        try:
+            segments = executor.map(
+                _serialize_segment,
+                repeat(self._worker_options),
+                slices,
+                repeat(is_mapping),
+                repeat(self.compress),
+                lasts,
             )
 
-        return chain((WXF_VERSION, WXF_HEADER_SEPARATOR), self.encode(data))
+            if not self.compress:
+                yield WXF_VERSION
+                yield WXF_HEADER_SEPARATOR
+                yield prefix
+                yield from segments
+                return
+
+            yield WXF_VERSION
+            yield WXF_HEADER_COMPRESS
+            yield WXF_HEADER_SEPARATOR
+            # zlib header for the default compression level.
+            yield b"x\x9c"
+            compressor = zlib.compressobj(wbits=-15)
+            yield compressor.compress(prefix) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            checksum = zlib.adler32(prefix)
+            for segment, adler, length in segments:
+                yield segment
+                checksum = adler32_combine(checksum, adler, length)
+            yield checksum.to_bytes(4, "big")
+        finally:
+            if owned and executor is not self.workers:
+                executor.shutdown()
 
     def serialize_symbol(self, name):
         yield WXF_CONSTANTS.Symbol
@@ -76,12 +585,27 @@ class WXFSerializer(FormatSerializer):
 
     def serialize_function(self, head, args, **opts):
 
+        if self.streaming and opts.get("length") is None and safe_len(args) is None:
+            return self.serialize_streaming_function(head, args)
+
         iterable, length = get_length(args, **opts)
 
         return chain(
             (WXF_CONSTANTS.Function, varint_bytes(length)), head, chain.from_iterable(iterable)
         )
 
+    def serialize_streaming_function(self, head, args):
+        placeholder = LengthPlaceholder()
+        yield WXF_CONSTANTS.Function
+        yield placeholder
+        yield from head
+        length = 0
+        for arg in args:
+            yield from arg
+            length += 1
+        placeholder.length = length
+        yield placeholder
+
     # numeric
     def serialize_int(self, number):
         try:
@@ -126,6 +650,9 @@ class WXFSerializer(FormatSerializer):
     def serialize_mapping(self, keyvalue, **opts):
         # the normalizer is always sending an generator key, value
 
+        if self.streaming and opts.get("length") is None and safe_len(keyvalue) is None:
+            return self.serialize_streaming_mapping(keyvalue)
+
         iterable, length = get_length(keyvalue, **opts)
 
         return chain(
@@ -133,6 +660,17 @@ class WXFSerializer(FormatSerializer):
             chain.from_iterable(starmap(serialize_rule, iterable)),
         )
 
+    def serialize_streaming_mapping(self, keyvalue):
+        placeholder = LengthPlaceholder()
+        yield WXF_CONSTANTS.Association
+        yield placeholder
+        length = 0
+        for key, value in keyvalue:
+            yield from serialize_rule(key, value)
+            length += 1
+        placeholder.length = length
+        yield placeholder
+
     def serialize_numeric_array(self, data, dimensions, wl_type):
         return numeric_array_to_wxf(data, dimensions, wl_type)
 
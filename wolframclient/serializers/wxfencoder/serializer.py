@@ -163,16 +163,6 @@ class SerializationContext(_Context):
             self._in_assoc_stack, self._depth, is_assoc
         )
 
-        if len(self._expected_length_stack) <= self._depth:
-            self._expected_length_stack.append(length)
-        else:
-            self._expected_length_stack[self._depth] = length
-
-        if len(self._current_index_stack) <= self._depth:
-            self._current_index_stack.append(0)
-        else:
-            self._current_index_stack[self._depth] = 0
-
         self._step_out_finalized_expr()
 
     def is_valid_final_state(self):
@@ -48,6 +48,28 @@ class ExactSizeReader:
 
         return self._read_rest(data, size)
 
+    def readinto(self, buffer):
+        """Fill the writable `buffer` with exactly as many bytes as it can hold and return that count.
+
+        The underlying readable object :meth:`readinto` method is used when available, so that data is copied to its
+        final destination without intermediary bytes objects.
+        """
+        view = memoryview(buffer).cast("B")
+        size = len(view)
+        out_len = 0
+        readinto = getattr(self._reader, "readinto", None)
+        while out_len < size:
+            if readinto is not None:
+                count = readinto(view[out_len:])
+            else:
+                chunk = self._reader.read(size - out_len)
+                count = len(chunk)
+                view[out_len : out_len + count] = chunk
+            if not count:
+                raise EOFError("Not enough data to read.")
+            out_len += count
+        return out_len
+
     @decorate(concatenate_bytes)
     def _read_rest(self, data, size=-1):
         # need an intermediary buffer
@@ -111,3 +133,24 @@ class ZipCompressedReader:
             # check requested size against output length.
             if size > 0 and out_len == size:
                 break
+
+    def readinto(self, buffer):
+        """Inflate compressed data into the writable `buffer`, and return the amount of bytes written.
+
+        Decompressed chunks are copied into their final location as soon as they are produced. Less bytes than the
+        buffer size are written only when the source reader is exhausted.
+        """
+        view = memoryview(buffer).cast("B")
+        size = len(view)
+        out_len = 0
+        while out_len < size:
+            if self._compressor.unconsumed_tail:
+                data_in = self._compressor.unconsumed_tail
+            else:
+                data_in = self._reader.read(ZipCompressedReader.CHUNK_SIZE)
+                if not data_in:
+                    break
+            chunk = self._compressor.decompress(data_in, size - out_len)
+            view[out_len : out_len + len(chunk)] = chunk
+            out_len += len(chunk)
+        return out_len
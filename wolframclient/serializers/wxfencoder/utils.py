@@ -42,6 +42,22 @@ def varint_bytes(int_value):
     return buf[:count]
 
 
+def fixed_width_varint_bytes(int_value, width):
+    """Serialize `int_value` into exactly `width` varint bytes, padding with continuation bytes.
+
+    Those bytes can be overwritten in place once the actual value is known."""
+    if int_value < 0:
+        raise TypeError("Negative values cannot be encoded as varint.")
+    if int_value >> (7 * width):
+        raise ValueError("Value %i cannot be encoded in %i varint bytes." % (int_value, width))
+    buf = bytearray(width)
+    for i in range(width - 1):
+        buf[i] = int_value & 0x7F | 0x80
+        int_value >>= 7
+    buf[width - 1] = int_value
+    return buf
+
+
 _exceptions = {
     0: (WXF_CONSTANTS.Integer8, 1),
     -(1 << 7): (WXF_CONSTANTS.Integer8, 1),
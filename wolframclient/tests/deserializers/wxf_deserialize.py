@@ -4,15 +4,25 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import decimal
 import os
+import tempfile
 
 from wolframclient.deserializers import (
+    LazyWXF,
     WXFConsumer,
     WXFConsumerNumpy,
+    WXFPushParser,
     WXFToken,
     binary_deserialize,
+    binary_deserialize_file,
 )
-from wolframclient.deserializers.wxf.wxfparser import parse_varint
+from wolframclient.deserializers.wxf.wxfparser import (
+    WXFBufferParser,
+    WXFParser,
+    parse_varint,
+)
+from wolframclient.evaluation.result import WolframKernelEvaluationResult
 from wolframclient.exception import WolframParserException
+from wolframclient.language import wl
 from wolframclient.serializers import export
 from wolframclient.serializers.wxfencoder.utils import write_varint
 from wolframclient.tests.configure import skip_for_jython
@@ -59,6 +69,162 @@ class TestCase(BaseTestCase):
         self.varint_round_trip_integer(1 << (7 * 8))
         self.varint_round_trip_integer((1 << (7 * 9)) - 1)
 
+    def test_buffer_parser_tokens(self):
+        for compress in (False, True):
+            wxf = export(
+                [1, 1 << 40, 1.5, "élève", b"bytes", {"a": wl.Foo(1)}, 1 << 100, "x" * 200],
+                target_format="wxf",
+                compress=compress,
+            )
+            for wxf_input in (wxf, bytearray(wxf), memoryview(wxf)):
+                self.assertEqual(
+                    list(map(str, WXFBufferParser(wxf_input).tokens())),
+                    list(map(str, WXFParser(wxf).tokens())),
+                )
+
+    def test_direct_decoder(self):
+        for compress in (False, True):
+            wxf = export(
+                [
+                    {"a": wl.Foo(1, None), "b": (1.5, True)},
+                    1 << 100,
+                    decimal.Decimal("1.23"),
+                    b"bytes",
+                    wl.Foo(wl.Bar)(2),
+                    numpy.arange(6).reshape(2, 3),
+                ],
+                target_format="wxf",
+                compress=compress,
+            )
+            direct = binary_deserialize(wxf)
+            tokens = binary_deserialize(wxf, consumer=WXFConsumerNumpy())
+            self.assertEqual(direct[:-1], tokens[:-1])
+            numpy.assert_array_equal(direct[-1], tokens[-1])
+
+    def test_direct_decoder_dict_class(self):
+        res = binary_deserialize(export({"a": {"b": 1}}, target_format="wxf"), dict_class=dict)
+        self.assertEqual(res, {"a": {"b": 1}})
+        self.assertIs(type(res["a"]), dict)
+
+    def test_direct_decoder_rule_outside_assoc(self):
+        with self.assertRaises(WolframParserException):
+            binary_deserialize(b"8:f\x01s\x04List-C\x01C\x02")
+
+    def test_lazy_wxf(self):
+        value = {
+            "Result": [1, 2, 3],
+            "Log": ["log", numpy.arange(6).reshape(2, 3), 2**80, b"bytes", wl.f(wl.g(1.5), {"a": 2})],
+            "Count": -1,
+        }
+        for compress in (False, True):
+            wxf = export(value, target_format="wxf", compress=compress)
+            doc = LazyWXF(wxf)
+            self.assertEqual(len(doc), 3)
+            self.assertEqual(list(doc), ["Result", "Log", "Count"])
+            self.assertEqual(doc["Result"], (1, 2, 3))
+            self.assertEqual(doc["Count"], -1)
+            self.assertEqual(doc.get("Missing"), None)
+            log = doc.lazy("Log")
+            self.assertEqual(log.head, wl.List)
+            self.assertEqual(log[-1], wl.f(wl.g(1.5), {"a": 2}))
+            self.assertEqual(log[2:4], (2**80, b"bytes"))
+            numpy.assert_array_equal(log[1], value["Log"][1])
+            self.assertEqual(LazyWXF(wxf, index=doc.index)["Count"], -1)
+            self.assertEqual(doc.decode()["Result"], binary_deserialize(wxf)["Result"])
+
+    def test_lazy_wxf_atom(self):
+        doc = LazyWXF(export("abc", target_format="wxf"))
+        self.assertEqual(doc.decode(), "abc")
+        with self.assertRaises(TypeError):
+            doc[0]
+
+    def test_kernel_batch_results(self):
+        def evaluation_data(value, messages=()):
+            return {
+                "Result": export(value, target_format="wxf"),
+                "Success": not messages,
+                "FailureType": "MessageFailure" if messages else None,
+                "Messages": [wl.MessageName(wl.f, "msg")] * len(messages),
+                "MessagesText": list(messages),
+            }
+
+        reply = export(
+            [evaluation_data(2), evaluation_data([1, 2]), evaluation_data(None, ["warning"])],
+            target_format="wxf",
+        )
+        results = WolframKernelEvaluationResult.from_batch(reply)
+        self.assertEqual(len(results), 3)
+        self.assertEqual([result.get() for result in results], [2, (1, 2), None])
+        self.assertTrue(results[1].success)
+        self.assertFalse(results[2].success)
+        self.assertEqual(results[2].messages, ("warning",))
+        self.assertEqual(WolframKernelEvaluationResult.from_batch(export([], target_format="wxf")), [])
+
+    def push_chunks(self, wxf, size):
+        parser = WXFPushParser()
+        elements = []
+        for i in range(0, len(wxf), size):
+            elements.extend(parser.feed(wxf[i : i + size]))
+        parser.close()
+        return parser, elements
+
+    def test_push_parser(self):
+        value = [1, "abc", b"bytes", 2**80, wl.f(1.5, {"a": ()}), numpy.arange(1000)]
+        for compress in (False, True):
+            wxf = export(value, target_format="wxf", compress=compress)
+            for size in (1, 7, len(wxf)):
+                parser, elements = self.push_chunks(wxf, size)
+                self.assertTrue(parser.is_list)
+                self.assertEqual(elements[:-1], value[:-1])
+                numpy.assert_array_equal(elements[-1], value[-1])
+
+    def test_push_parser_association(self):
+        wxf = export({"a": 1, "b": [2, {"c": 3}]}, target_format="wxf")
+        parser, elements = self.push_chunks(wxf, 3)
+        self.assertTrue(parser.is_association)
+        self.assertEqual(elements, [("a", 1), ("b", (2, {"c": 3}))])
+
+    def test_push_parser_expression(self):
+        parser = WXFPushParser()
+        wxf = export(wl.f(1, 2), target_format="wxf")
+        self.assertEqual(parser.feed(wxf[:-1]), [])
+        self.assertEqual(parser.feed(wxf[-1:]), [wl.f(1, 2)])
+        parser.close()
+
+    def test_push_parser_incomplete(self):
+        parser = WXFPushParser()
+        parser.feed(export([1, 2], target_format="wxf")[:-1])
+        with self.assertRaises(WolframParserException):
+            parser.close()
+        parser = WXFPushParser()
+        parser.feed(export(1, target_format="wxf") + b"C")
+        self.assertEqual(parser.unused_data, b"C")
+        with self.assertRaises(WolframParserException):
+            parser.close()
+
+    def test_buffer_parser_eof(self):
+        with self.assertRaises(EOFError):
+            binary_deserialize(export("abc", target_format="wxf")[:-1])
+
+    def test_buffer_parser_invalid_compressed(self):
+        wxf = export(list(range(100)), target_format="wxf", compress=True)
+        with self.assertRaises(EOFError):
+            binary_deserialize(wxf[:-10], consumer=WXFConsumer())
+        with self.assertRaises(WolframParserException):
+            binary_deserialize(wxf[:3] + b"not zlib data", consumer=WXFConsumer())
+
+    def test_push_parser_invalid_compressed(self):
+        parser = WXFPushParser()
+        with self.assertRaises(WolframParserException):
+            parser.feed(b"8C:" + b"not zlib data")
+
+    def test_buffer_parser_eof_numbers(self):
+        for value in (1, 1000, 1 << 20, 1 << 40, 1.5):
+            with self.assertRaises(EOFError):
+                binary_deserialize(
+                    export(value, target_format="wxf")[:-1], consumer=WXFConsumer()
+                )
+
     def wxf_assert_roundtrip(self, value):
         wxf = export(value, target_format="wxf")
         o = binary_deserialize(wxf, consumer=WXFConsumer())
@@ -257,6 +423,35 @@ class TestCaseNumPyArray(BaseTestCase):
         res = binary_deserialize(wxf, consumer=WXFConsumerNumpy())
         self.assertEqual(res.tolist(), arr.tolist())
 
+    def test_numpy_zero_copy(self):
+        arr = numpy.arange(100, dtype="float64")
+        wxf = bytearray(export([arr], target_format="wxf"))
+        res = binary_deserialize(wxf, zero_copy=True)[0]
+        numpy.assert_array_equal(res, arr)
+        self.assertFalse(res.flags.writeable)
+        self.assertTrue(numpy.shares_memory(res, numpy.frombuffer(wxf, dtype="uint8")))
+
+    def test_numpy_compressed_stream(self):
+        arr = numpy.arange(10000, dtype="int32").reshape(100, 100)
+        wxf = export(arr, target_format="wxf", compress=True)
+        numpy.assert_array_equal(binary_deserialize(six.BytesIO(wxf)), arr)
+        numpy.assert_array_equal(binary_deserialize(wxf, zero_copy=True), arr)
+
+    def test_numpy_memory_map(self):
+        arr = numpy.arange(10000, dtype="float64").reshape(100, 100)
+        path = os.path.join(tempfile.mkdtemp(), "array.wxf")
+        for compress in (False, True):
+            export([arr, "a"], stream=path, target_format="wxf", memory_map=True, compress=compress)
+            with open(path, "rb") as fp:
+                self.assertEqual(
+                    fp.read(), export([arr, "a"], target_format="wxf", compress=compress)
+                )
+            res = binary_deserialize_file(path)
+            numpy.assert_array_equal(res[0], arr)
+            self.assertFalse(res[0].flags.writeable)
+            self.assertEqual(res[1], "a")
+            numpy.assert_array_equal(binary_deserialize_file(path, memory_map=False)[0], arr)
+
     def test_numpy_packedarray(self):
         # Range[1]
         wxf = b"8:\xc1\x00\x01\x01\x01"
@@ -1,6 +1,7 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import asyncio
+import json
 import logging
 import os
 
@@ -9,6 +10,10 @@ from wolframclient.evaluation.cloud.asynccloudsession import (
     WolframCloudAsyncSession,
 )
 from wolframclient.evaluation.cloud.base import SecuredAuthenticationKey
+from wolframclient.evaluation.result import (
+    WolframAPIResponseBuilder,
+    WolframAPIResponseGenericAsync,
+)
 from wolframclient.exception import (
     AuthenticationException,
     RequestException,
@@ -164,6 +169,21 @@ class TestCase(TestCaseSettings):
         )
         self.assertEqual('"edcba"', force_text(await response.get()))
 
+    @run_in_loop
+    async def test_section_api_call_many(self):
+        api = (self.api_owner, "api/private/stringreverse")
+        inputs = [{"str": "abc%i" % i} for i in range(10)]
+        results = []
+        async for response in self.cloud_session_async.call_many(api, inputs, concurrency=3):
+            results.append(force_text(await response.get()))
+        self.assertEqual(results, ['"%icba"' % i for i in range(10)])
+        results = {}
+        async for index, response in self.cloud_session_async.call_many(
+            api, inputs, concurrency=3, ordered=False
+        ):
+            results[index] = force_text(await response.get())
+        self.assertEqual(results, {i: '"%icba"' % i for i in range(10)})
+
     @run_in_loop
     async def test_section_api_permission_key(self):
         async with WolframCloudAsyncSession(server=server) as cloud:
@@ -464,3 +484,154 @@ class TestWolframAPI(TestCaseSettings):
             apicall.set_parameter("str", "abcde")
             response = await apicall.perform()
             self.assertEqual("edcba", await response.get())
+
+
+class FakeResponse:
+    """An asynchronous HTTP response adapter holding a JSON body."""
+
+    asynchronous = True
+
+    def __init__(self, status, body=None, headers=None):
+        self._status = status
+        self._body = json.dumps(body).encode("utf-8")
+        self._headers = {"Content-Type": "application/json"}
+        self._headers.update(headers or {})
+
+    def status(self):
+        return self._status
+
+    def headers(self):
+        return self._headers
+
+    def url(self):
+        return "https://www.wolframcloud.com/obj/api"
+
+    async def text(self):
+        return force_text(self._body)
+
+    async def content(self):
+        return self._body
+
+
+def api_response(response):
+    """Build the asynchronous API response of an adapter, as WolframAPIResponseBuilder does."""
+    return WolframAPIResponseBuilder.async_response_mapper.get(
+        response.status(), WolframAPIResponseGenericAsync
+    )(response)
+
+
+class StubCloudAsyncSession(WolframCloudAsyncSession):
+    """A cloud session answering API calls with the responses returned by `respond`, without a server.
+
+    Calls take `delay(x)` seconds, where `x` is the only input parameter."""
+
+    def __init__(self, respond, delay=lambda x: 0):
+        super().__init__()
+        self.respond = respond
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    @property
+    def started(self):
+        return True
+
+    async def call(self, api, input_parameters={}, **kwargs):
+        x = input_parameters["x"]
+        self.calls.append(x)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay(x))
+            status, headers = self.respond(x, self.calls.count(x))
+            return api_response(FakeResponse(status, x, headers))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+class TestCallMany(BaseTestCase):
+    @run_in_loop
+    async def test_call_many_window(self):
+        # later inputs complete first.
+        session = StubCloudAsyncSession(lambda x, attempt: (200, None), lambda x: 0.01 / (1 + x))
+        inputs = [{"x": i} for i in range(20)]
+        results = [
+            await response.get()
+            async for response in session.call_many("api", inputs, concurrency=4)
+        ]
+        self.assertEqual(results, list(range(20)))
+        self.assertEqual(session.max_in_flight, 4)
+
+    @run_in_loop
+    async def test_call_many_unordered(self):
+        session = StubCloudAsyncSession(lambda x, attempt: (200, None), lambda x: 0.01 / (1 + x))
+        inputs = ({"x": i} for i in range(10))
+        results = {}
+        async for index, response in session.call_many("api", inputs, concurrency=5, ordered=False):
+            results[index] = await response.get()
+        self.assertEqual(results, {i: i for i in range(10)})
+
+    @run_in_loop
+    async def test_call_many_retries(self):
+        def respond(x, attempt):
+            if x == 1 and attempt == 1:
+                return 429, {"Retry-After": "0"}
+            if x == 2 and attempt < 3:
+                return 503, None
+            if x == 3:
+                return 500, None
+            if x == 4:
+                return 404, None
+            return 200, None
+
+        session = StubCloudAsyncSession(respond)
+        responses = [
+            response
+            async for response in session.call_many(
+                "api", [{"x": i} for i in range(5)], max_retries=2, backoff=0
+            )
+        ]
+        self.assertEqual([response.status for response in responses], [200, 200, 200, 500, 404])
+        self.assertEqual(await responses[2].get(), 2)
+        self.assertEqual(
+            [session.calls.count(i) for i in range(5)],
+            # the last attempt answered with 500 is returned, other failures are not retried.
+            [1, 2, 3, 3, 1],
+        )
+
+    def test_retry_after(self):
+        for headers, expected in (
+            ({"Retry-After": "2"}, 2.0),
+            ({"Retry-After": "0.5"}, 0.5),
+            ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, None),
+            ({}, None),
+        ):
+            response = api_response(FakeResponse(429, headers=headers))
+            self.assertTrue(response.retryable)
+            self.assertEqual(response.retry_after, expected)
+
+    @run_in_loop
+    async def test_call_many_cancel_on_error(self):
+        def respond(x, attempt):
+            if x == 5:
+                raise RequestException(None, msg="Connection lost.")
+            return 200, None
+
+        session = StubCloudAsyncSession(respond, lambda x: 0 if x == 5 else 1)
+        calls = session.call_many(
+            "api", [{"x": i} for i in range(20)], concurrency=8, ordered=False
+        )
+        with self.assertRaises(RequestException):
+            async for index, response in calls:
+                pass
+        # the call of input 5 fails first, and the other calls in flight are cancelled.
+        await asyncio.sleep(0)
+        self.assertEqual(session.cancelled, 7)
+        self.assertEqual(session.in_flight, 0)
+        with self.assertRaises(StopAsyncIteration):
+            await calls.__anext__()
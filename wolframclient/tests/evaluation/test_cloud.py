@@ -3,7 +3,11 @@ from __future__ import absolute_import, print_function, unicode_literals
 import logging
 import os
 
-from wolframclient.evaluation.cloud.base import SecuredAuthenticationKey
+from wolframclient.evaluation.cloud.base import (
+    SecuredAuthenticationKey,
+    _OAuthSigner,
+    encode_evaluation_input,
+)
 from wolframclient.evaluation.cloud.cloudsession import (
     WolframAPICall,
     WolframCloudSession,
@@ -12,6 +16,7 @@ from wolframclient.evaluation.cloud.cloudsession import (
 from wolframclient.exception import AuthenticationException, WolframLanguageException
 from wolframclient.language import wl
 from wolframclient.language.expression import WLFunction
+from wolframclient.serializers import export
 from wolframclient.tests.configure import (
     api_owner,
     secured_authentication_key,
@@ -21,7 +26,7 @@ from wolframclient.tests.configure import (
     user_configuration,
 )
 from wolframclient.utils import six
-from wolframclient.utils.api import numpy
+from wolframclient.utils.api import numpy, oauth
 from wolframclient.utils.encoding import force_text
 from wolframclient.utils.tests import TestCase as BaseTestCase
 from wolframclient.utils.url import url_join
@@ -369,6 +374,64 @@ class TestCase(TestCaseSettings):
             },
         )
 
+    def test_evaluate_wxf(self):
+        session = self.cloud_session.duplicate()
+        try:
+            for compress in (False, True):
+                session.evaluation_format = "wxf"
+                session.compress = compress
+                self.assertEqual(session.evaluate(wl.Total(numpy.arange(10))), 45)
+        finally:
+            session.terminate()
+
+
+class TestCaseOffline(BaseTestCase):
+    def test_encode_evaluation_input(self):
+        expr = wl.Total(numpy.arange(1000))
+        wl_data, content_type = encode_evaluation_input(expr)
+        self.assertIsNone(content_type)
+        wxf_data, content_type = encode_evaluation_input(expr, target_format="wxf")
+        self.assertEqual(content_type, "application/vnd.wolfram.wxf")
+        self.assertEqual(wxf_data, export(expr, target_format="wxf"))
+        self.assertLess(len(wxf_data), len(wl_data))
+        compressed, _ = encode_evaluation_input(expr, target_format="wxf", compress=True)
+        self.assertTrue(compressed.startswith(b"8C:"))
+        with self.assertRaises(ValueError):
+            encode_evaluation_input(expr, target_format="json")
+
+    def test_oauth_signer(self):
+        client = oauth.Client(
+            "key",
+            client_secret="secret",
+            resource_owner_key="token",
+            resource_owner_secret="token secret",
+            signature_type=oauth.SIGNATURE_TYPE_AUTH_HEADER,
+            realm="https://www.wolframcloud.com",
+            encoding="iso-8859-1",
+        )
+        signer = _OAuthSigner(client)
+        form = {"Content-Type": "application/x-www-form-urlencoded"}
+        for uri, body, headers in (
+            ("https://www.wolframcloud.com/objects/user/api?_key=abc", "x=1&y=%C3%A9", form),
+            # the parameters of a body signed before are cached.
+            ("https://www.wolframcloud.com/objects/user/api?_key=abc", "x=1&y=%C3%A9", form),
+            ("https://www.wolframcloud.com/objects/user/api", None, {}),
+            ("https://www.wolframcloud.com/objects/user/api?a=1&a=2&b=%20c", "x=2", form),
+            ("https://www.wolframcloud.com/objects/user/api?a=1", "x=1&x=0&x=1", form),
+            ("https://www.wolframcloud.com/objects/user/api", b"x=1&y=%E9+z", form),
+            ("https://www.wolframcloud.com/objects/user/api", "x=" + "1" * 5000, form),
+        ):
+            signed = signer.sign(uri, "POST", body=body, headers=headers)
+            authorization = dict(
+                part.split("=", 1) for part in signed[1]["Authorization"][6:].split(", ")
+            )
+            client.nonce = authorization["oauth_nonce"].strip('"')
+            client.timestamp = authorization["oauth_timestamp"].strip('"')
+            self.assertEqual(signed, client.sign(uri, "POST", body=body, headers=headers))
+            self.assertEqual(signed, client.sign(uri, "POST", body=body, headers=headers))
+        # large bodies are signed without being kept.
+        self.assertEqual(len(signer._bodies), 4)
+
 
 class TestWolframAPI(TestCaseSettings):
     def test_wolfram_api_call_image(self):
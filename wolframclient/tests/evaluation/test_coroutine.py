@@ -1,11 +1,13 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import logging
+from threading import Thread
 
 from wolframclient.deserializers import WXFConsumer, binary_deserialize
 from wolframclient.evaluation import (
     WolframCloudAsyncSession,
     WolframEvaluatorPool,
+    WolframKernelStandby,
     WolframLanguageAsyncSession,
     parallel_evaluate,
 )
@@ -106,12 +108,45 @@ class TestCoroutineSession(BaseTestCase):
             if async_session:
                 await async_session.terminate()
 
+    @run_in_loop
+    async def test_eval_concurrent_start(self):
+        async_session = None
+        try:
+            async_session = WolframLanguageAsyncSession(kernel_path)
+            pids = await asyncio.gather(*(async_session.evaluate("$ProcessID") for _ in range(3)))
+            # a single kernel was started.
+            self.assertEqual(len(set(pids)), 1)
+            self.assertEqual(pids[0], async_session.kernel_controller.kernel_proc.pid)
+        finally:
+            if async_session:
+                await async_session.terminate()
+
     @run_in_loop
     async def test_eval_parallel(self):
         tasks = [asyncio.create_task(self.async_session.evaluate(i + 1)) for i in range(10)]
         res = await asyncio.gather(*tasks)
         self.assertEqual(res, list(range(1, 11)))
 
+    @run_in_loop
+    async def test_eval_batch(self):
+        res = await self.async_session.evaluate_batch(["1+1", wl.Range(2)])
+        self.assertEqual(res[0], 2)
+        numpy.assert_array_equal(res[1], numpy.arange(1, 3))
+
+    @run_in_loop
+    async def test_eval_pipelined(self):
+        async_session = None
+        try:
+            async_session = WolframLanguageAsyncSession(kernel_path, PIPELINE_DEPTH=8)
+            # no thread is dedicated to the kernel.
+            self.assertNotIsInstance(async_session.kernel_controller, Thread)
+            await async_session.evaluate("ClearAll[x]; x=0")
+            res = await asyncio.gather(*(async_session.evaluate("x++") for _ in range(50)))
+            self.assertEqual(res, list(range(50)))
+        finally:
+            if async_session:
+                await async_session.terminate()
+
     @run_in_loop
     async def test_quit_restart(self):
         try:
@@ -137,6 +172,11 @@ class TestCoroutineSession(BaseTestCase):
     def test_bad_kwargs_parameters(self):
         TestKernelBase.class_bad_kwargs_parameters(self, WolframLanguageAsyncSession)
 
+    def test_standby_not_supported(self):
+        standby = WolframKernelStandby(kernel_path, size=1)
+        with self.assertRaises(ValueError):
+            WolframLanguageAsyncSession(standby=standby)
+
 
 class TestKernelPool(BaseTestCase):
     @classmethod
@@ -194,6 +234,69 @@ class TestKernelPool(BaseTestCase):
         self.assertFalse(session.started)
         self.assertTrue(session.stopped)
 
+    @run_in_loop
+    async def test_pool_recycling(self):
+        async with WolframEvaluatorPool(
+            kernel_path, poolsize=1, max_evaluations=2, STARTUP_TIMEOUT=5, TERMINATE_TIMEOUT=3
+        ) as pool:
+            pids = set()
+            for _ in range(6):
+                pids.add(await pool.evaluate("$ProcessID"))
+                # leave time to the replacement kernel to start.
+                await asyncio.sleep(1)
+            self.assertGreater(len(pids), 1)
+            self.assertEqual(len(pool), 1)
+
+    @run_in_loop
+    async def test_pool_priority(self):
+        async with WolframEvaluatorPool(
+            kernel_path, poolsize=1, STARTUP_TIMEOUT=5, TERMINATE_TIMEOUT=3
+        ) as pool:
+            order = []
+
+            async def evaluate(expr, **kwargs):
+                order.append(await pool.evaluate(expr, **kwargs))
+
+            first = asyncio.create_task(evaluate("Pause[.5]; 0"))
+            await asyncio.sleep(0.1)
+            batch = [asyncio.create_task(evaluate(i, cost=2)) for i in range(1, 4)]
+            await asyncio.sleep(0.1)
+            await evaluate(-1, priority=-1)
+            await asyncio.gather(first, *batch)
+            self.assertEqual(order, [0, -1, 1, 2, 3])
+
+    @run_in_loop
+    async def test_pool_affinity(self):
+        async with WolframEvaluatorPool(
+            kernel_path, poolsize=3, STARTUP_TIMEOUT=5, TERMINATE_TIMEOUT=3
+        ) as pool:
+            setup = "count = If[IntegerQ[count], count + 1, 1]"
+            pids = await asyncio.gather(
+                *(pool.evaluate("$ProcessID", affinity_key=i % 2) for i in range(10))
+            )
+            self.assertEqual(len(set(pids[0::2])), 1)
+            self.assertEqual(len(set(pids[1::2])), 1)
+            counts = await asyncio.gather(
+                *(pool.evaluate("count", affinity_key=i % 2, setup=setup) for i in range(10))
+            )
+            self.assertEqual(set(counts), {1})
+
+    @run_in_loop
+    async def test_pool_autoscaling(self):
+        async with WolframEvaluatorPool(
+            kernel_path,
+            poolsize=1,
+            max_poolsize=2,
+            scale_up_queue_depth=1,
+            idle_timeout=1,
+            STARTUP_TIMEOUT=5,
+            TERMINATE_TIMEOUT=3,
+        ) as pool:
+            await asyncio.gather(*(pool.evaluate("Pause[.5]") for _ in range(20)))
+            self.assertEqual(len(pool), 2)
+            await asyncio.sleep(2)
+            self.assertEqual(len(pool), 1)
+
     async def _pool_evaluation_check(self, pool):
         tasks = [
             asyncio.create_task(pool.evaluate(wl.FromLetterNumber(i))) for i in range(1, 11)
@@ -236,6 +339,74 @@ class TestKernelCloudPool(TestKernelPool):
                 self.assertTrue(session.stopped)
 
 
+class FakeAsyncSession(WolframLanguageAsyncSession):
+    """A local session evaluating expressions to themselves, without a kernel."""
+
+    start_delay = 0.01
+
+    def __init__(self, started=None):
+        self.stopped = True
+        self.kernel_controller = None
+        self.started_sessions = [] if started is None else started
+
+    @property
+    def started(self):
+        return not self.stopped
+
+    def duplicate(self):
+        return self.__class__(self.started_sessions)
+
+    async def start(self):
+        await asyncio.sleep(self.start_delay)
+        self.stopped = False
+        self.started_sessions.append(self)
+
+    async def stop(self):
+        self.stopped = True
+
+    async def evaluate(self, expr, **kwargs):
+        await asyncio.sleep(0.001)
+        return expr
+
+
+class TestPoolRecyclingOffline(BaseTestCase):
+    @run_in_loop
+    async def test_pool_recycling_under_load(self):
+        poolsize = 2
+        for load_factor, max_evaluations in ((0, 20), (1, 20), (1, 1)):
+            session = FakeAsyncSession()
+            async with WolframEvaluatorPool(
+                session, poolsize=poolsize, load_factor=load_factor, max_evaluations=max_evaluations
+            ) as pool:
+                tasks = [asyncio.ensure_future(pool.evaluate(i)) for i in range(1000)]
+                sizes = set()
+                done = asyncio.ensure_future(asyncio.wait_for(asyncio.gather(*tasks), 30))
+                while not done.done():
+                    sizes.add(len(pool._kernel_evaluation_loop_tasks))
+                    await asyncio.sleep(0.001)
+                self.assertEqual(done.result(), list(range(1000)))
+                self.assertLessEqual(max(sizes), poolsize + 1)
+                # the kernels were recycled under load.
+                self.assertGreater(len(session.started_sessions), poolsize + 10)
+
+
+    @run_in_loop
+    async def test_pool_stopped_during_scale_up(self):
+        class SlowAsyncSession(FakeAsyncSession):
+            start_delay = 0.3
+
+        pool = WolframEvaluatorPool(
+            SlowAsyncSession(), poolsize=1, max_poolsize=3, scale_up_queue_depth=1
+        )
+        await pool.start()
+        await asyncio.gather(*(pool.evaluate(i) for i in range(10)))
+        self.assertIsNotNone(pool._scale_up_task)
+        await pool.stop()
+        # the cancelled start does not limit the pool size.
+        self.assertEqual(pool._size_cap, 3)
+        self.assertTrue(all(evaluator.stopped for evaluator in pool._evaluators))
+
+
 class TestParallelEvaluate(BaseTestCase):
     def test_parallel_evaluate_local(self):
         exprs = [wl.FromLetterNumber(i) for i in range(1, 11)]
@@ -5,7 +5,7 @@ from concurrent.futures import TimeoutError
 from time import time
 
 from wolframclient.deserializers import WXFConsumer, binary_deserialize
-from wolframclient.evaluation import WolframLanguageSession
+from wolframclient.evaluation import WolframKernelStandby, WolframLanguageSession
 from wolframclient.exception import WolframKernelException
 from wolframclient.language import wl, wlexpr
 from wolframclient.language.expression import WLFunction, WLSymbol
@@ -209,6 +209,20 @@ class TestCase(TestCaseSettings):
             session.terminate()
             self.assertTrue(session.stopped)
 
+    def test_kernel_killed_during_evaluation(self):
+        try:
+            session = WolframLanguageSession(kernel_path)
+            session.start()
+            future = session.evaluate_future("Pause[10]")
+            start = time()
+            session.kernel_controller.kernel_proc.kill()
+            with self.assertRaises(WolframKernelException):
+                future.result(timeout=5)
+            self.assertTrue((time() - start) < 5)
+        finally:
+            session.terminate()
+            self.assertTrue(session.stopped)
+
     def test_pure_function_inputform(self):
         f = self.kernel_session.function("#+1&")
         self.assertEqual(f(3), 4)
@@ -245,6 +259,19 @@ class TestCase(TestCaseSettings):
         res = self.kernel_session.evaluate_many(exprs)
         self.assertEqual(res, expected)
 
+    def test_evaluate_batch(self):
+        res = self.kernel_session.evaluate_batch(["ClearAll[y]; y=1", "y+=1", wl.Range(3), "1/0"])
+        self.assertEqual(res[:3], [1, 2, (1, 2, 3)])
+        self.assertEqual(res[3], wl.DirectedInfinity())
+
+    def test_evaluate_batch_wrap(self):
+        results = self.kernel_session.evaluate_batch_wrap(["1+1", "1/0"])
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].get(), 2)
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[1].messages, ("Infinite expression Power[0, -1] encountered.",))
+
     def test_built_in_symbols_as_func(self):
         func_null = self.kernel_session.function("Null")
         res = func_null(5)
@@ -345,6 +372,13 @@ class TestSessionTimeout(TestCaseSettings):
             future3 = kernel_session.evaluate_future("100+1")
             self.assertEqual(future3.result(timeout=2), 101)
 
+    def test_evaluate_pipelined_async(self):
+        with WolframLanguageSession(kernel_path, PIPELINE_DEPTH=8) as kernel_session:
+            kernel_session.evaluate("ClearAll[x]; x=0")
+            futures = [kernel_session.evaluate_future("x++") for _ in range(100)]
+            self.assertEqual([future.result(timeout=10) for future in futures], list(range(100)))
+            self.assertEqual(kernel_session.evaluate("x"), 100)
+
     def test_many_failures_wrap_async(self):
         future = self.kernel_session.evaluate_wrap_future(
             'ImportString["[1,2", "RawJSON"]; 1/0'
@@ -395,6 +429,25 @@ class TestCaseSession(TestCaseSettings):
             if session:
                 session.terminate()
 
+    def test_standby_session(self):
+        with WolframKernelStandby(kernel_path, size=1, init="standbyInit = 42") as standby:
+            session = WolframLanguageSession(standby=standby)
+            try:
+                self.assertEqual(session.evaluate("standbyInit"), 42)
+                pid1 = session.evaluate("$ProcessID")
+                session.restart()
+                pid2 = session.evaluate("$ProcessID")
+                self.assertNotEqual(pid1, pid2)
+                self.assertEqual(session.evaluate("standbyInit"), 42)
+                self.assertEqual(len(standby), 1)
+            finally:
+                session.terminate()
+
+    def test_ipc_sockets(self):
+        with WolframLanguageSession(kernel_path, SOCKET_PROTOCOL="ipc") as session:
+            self.assertEqual(session.evaluate("1+1"), 2)
+            self.assertTrue(session.kernel_controller.kernel_socket_in.uri.startswith("ipc://"))
+
 
 class TestCaseInternalFunctions(TestCaseSettings):
     def test_default_loglevel(self):
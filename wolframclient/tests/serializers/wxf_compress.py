@@ -82,3 +82,16 @@ class TestCase(BaseTestCase):
         reader = ExactSizeReader(ZipCompressedReader(six.BytesIO(zipped)))
         with self.assertRaises(EOFError):
             reader.read(size=total + 1)
+
+    def test_uncompress_readinto(self):
+        data = six.binary_type(bytearray(random.randint(0, 255) for i in range(50000)))
+        reader = ExactSizeReader(ZipCompressedReader(six.BytesIO(zlib.compress(data))))
+        buffer = bytearray(len(data) - 10)
+        self.assertEqual(reader.readinto(buffer), len(buffer))
+        self.assertEqual(buffer, data[:-10])
+        self.assertEqual(reader.read(), data[-10:])
+
+    def test_readinto_exact_len_err(self):
+        reader = ExactSizeReader(six.BytesIO(b"abc"))
+        with self.assertRaises(EOFError):
+            reader.readinto(bytearray(4))
@@ -1,5 +1,6 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
+from wolframclient.exception import WolframLanguageException
 from wolframclient.serializers import export
 from wolframclient.serializers.encoders.numpy import to_little_endian
 from wolframclient.serializers.wxfencoder.serializer import WXFExprSerializer
@@ -57,6 +58,12 @@ class TestCase(BaseTestCase):
 
         self.assertEqual(force_text(err.exception), "Dimensions must be positive integers.")
 
+    def test_zero_size_export(self):
+        for target_format in ("wxf", "wl"):
+            for array in (numpy.ndarray([0, 3]), numpy.ndarray([2, 0], numpy.int8)):
+                with self.assertRaises(WolframLanguageException):
+                    export(array, target_format=target_format)
+
     def test_int8_PA(self):
         self.compare_serializer(
             self.initDefault(),
@@ -3,11 +3,18 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import decimal
+import os
+import tempfile
 import unittest
+import zlib
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+from wolframclient.deserializers import binary_deserialize, binary_deserialize_sequence
 from wolframclient.language import wl, wlexpr
+from wolframclient.language.array import PackedArray
 from wolframclient.serializers import export
+from wolframclient.serializers.wxf import WXFSerializer, adler32_combine
 from wolframclient.serializers.wxfencoder.serializer import WXFExprSerializer
 from wolframclient.serializers.wxfencoder.utils import write_varint
 from wolframclient.serializers.wxfencoder.wxfexpr import (
@@ -327,3 +334,183 @@ class TestCase(SerializeTest):
     def test_string_compression(self):
         wxf = b"\x38\x43\x3a\x78\x9c\x0b\x66\x4e\xcb\xcf\x07\x00\x04\x2f\x01\x9b"
         self.serialize_compare("foo", wxf, compress=True)
+
+    def test_buffered_export(self):
+
+        for value in (
+            1,
+            -200,
+            1 << 70,
+            2.0,
+            float("inf"),
+            1 + 2j,
+            "aaaa",
+            b"bytes",
+            None,
+            True,
+            {1: 2, "a": [1.5, None]},
+            [1, (2, frozenset([3]))],
+            ["hello", decimal.Decimal("1.23")],
+            Association(enumerate("abc")),
+            wl.Foo,
+            wl.Foo(2, wl.Context.Internal),
+        ):
+            for compress in (False, True):
+                self.assertEqual(
+                    export(value, target_format="wxf", compress=compress, buffered=True),
+                    export(value, target_format="wxf", compress=compress),
+                )
+
+        self.assertEqual(
+            export((i for i in range(3)), target_format="wxf", buffered=True),
+            export([0, 1, 2], target_format="wxf"),
+        )
+
+    def test_export_to_bytearray(self):
+        buffer = bytearray(b"prefix")
+        self.assertIs(export([1, 2, 3], stream=buffer, target_format="wxf"), buffer)
+        self.assertEqual(buffer, b"prefix" + export([1, 2, 3], target_format="wxf"))
+
+    def test_export_memory_map(self):
+        path = os.path.join(tempfile.mkdtemp(), "export.wxf")
+        # the last value is larger than the initial size of the file.
+        for value in ("a", ["row%i" % i for i in range(100000)], list(range(300000))):
+            export(value, stream=path, target_format="wxf", memory_map=True)
+            with open(path, "rb") as fp:
+                self.assertEqual(fp.read(), export(value, target_format="wxf"))
+
+    def test_auto_pack(self):
+        for value, expected in (
+            ([1, 2, 3], PackedArray([1, 2, 3], "Integer8")),
+            (((1000, -2), (3, 4)), PackedArray([1000, -2, 3, 4], "Integer16", shape=(2, 2))),
+            ([1 << 40], PackedArray([1 << 40], "Integer64")),
+            ([[1.5], [2.5]], PackedArray([1.5, 2.5], "Real64", shape=(2, 1))),
+            ([1j, 2], None),
+            ([1, 2.0], None),
+            ([True, False], None),
+            ([1.0, float("inf")], None),
+            ([1 << 70], None),
+            (
+                [[1, 2], [3]],
+                [PackedArray([1, 2], "Integer8"), PackedArray([3], "Integer8")],
+            ),
+            ([], None),
+        ):
+            for buffered in (False, True):
+                self.assertEqual(
+                    export(value, target_format="wxf", auto_pack=True, buffered=buffered),
+                    export(
+                        value if expected is None else expected, target_format="wxf"
+                    ),
+                )
+
+    def test_auto_pack_iterables(self):
+        for factory in (
+            lambda: (i for i in range(3)),
+            lambda: {1, 2},
+            lambda: frozenset((1, 2)),
+            lambda: range(3),
+            lambda: [range(2), range(2)],
+        ):
+            for buffered in (False, True):
+                wxf = export(factory(), target_format="wxf", auto_pack=True, buffered=buffered)
+                self.assertEqual(wxf, export(factory(), target_format="wxf"))
+                self.assertEqual(
+                    binary_deserialize(wxf),
+                    binary_deserialize(export(list(factory()), target_format="wxf")),
+                )
+
+    def test_auto_pack_complex(self):
+        value = {"a": [1 + 2j, 3j]}
+        self.assertEqual(
+            binary_deserialize(export(value, target_format="wxf", auto_pack=True))["a"].tolist(),
+            value["a"],
+        )
+
+    def test_parallel_export(self):
+        records = [{"id": i, "name": "row%i" % i, "values": [i * 0.5, None]} for i in range(2000)]
+        mapping = {i: str(i) for i in range(1500)}
+        with ThreadPoolExecutor(2) as executor:
+            for workers in (2, executor):
+                for value in (records, mapping):
+                    self.assertEqual(
+                        export(value, target_format="wxf", workers=workers),
+                        export(value, target_format="wxf"),
+                    )
+                    self.assertEqual(
+                        binary_deserialize(
+                            export(value, target_format="wxf", workers=workers, compress=True)
+                        ),
+                        binary_deserialize(export(value, target_format="wxf")),
+                    )
+
+    def test_parallel_export_chunks(self):
+        class CountingSerializer(WXFSerializer):
+            executors = 0
+
+            def executor(self):
+                self.executors += 1
+                return super().executor()
+
+        records = [{"id": i, "values": [i * 0.5]} for i in range(3000)]
+        with ThreadPoolExecutor(2) as executor:
+            for workers in (2, executor):
+                serializer = CountingSerializer(workers=workers, worker_count=2, chunk_size=1000)
+                self.assertEqual(
+                    serializer.export(records),
+                    export(records, target_format="wxf", chunk_size=1000),
+                )
+                # the three documents are serialized by the same pool.
+                self.assertEqual(serializer.executors, 1)
+
+    def test_parallel_export_packed(self):
+        value = list(range(2000))
+        self.assertEqual(
+            export(value, target_format="wxf", workers=2, auto_pack=True),
+            export(PackedArray(value, "Integer16"), target_format="wxf"),
+        )
+
+    def test_adler32_combine(self):
+        first, second = b"first segment" * 1000, b"second segment" * 3000
+        self.assertEqual(
+            adler32_combine(zlib.adler32(first), zlib.adler32(second), len(second)),
+            zlib.adler32(first + second),
+        )
+
+    def test_streaming_export(self):
+        def rows(n):
+            return ({"i": i, "parts": (j for j in range(i % 3))} for i in range(n))
+
+        for n in (0, 1, 200):
+            expected = binary_deserialize(export(list(rows(n)), target_format="wxf"))
+            wxf = export(rows(n), target_format="wxf", streaming=True)
+            self.assertEqual(binary_deserialize(wxf), expected)
+
+            stream = six.BytesIO()
+            export(rows(n), stream=stream, target_format="wxf", streaming=True)
+            self.assertEqual(stream.getvalue(), wxf)
+
+            buffer = bytearray(b"prefix")
+            export(rows(n), stream=buffer, target_format="wxf", streaming=True)
+            self.assertEqual(buffer, b"prefix" + wxf)
+
+    def test_streaming_export_compress(self):
+        with self.assertRaises(ValueError):
+            export(iter(range(3)), target_format="wxf", streaming=True, compress=True)
+
+    def test_chunked_export(self):
+        for compress in (False, True):
+            for n in (0, 1, 25):
+                wxf = export(
+                    (i * 1000 for i in range(n)),
+                    target_format="wxf",
+                    chunk_size=10,
+                    compress=compress,
+                )
+                self.assertEqual(
+                    list(binary_deserialize_sequence(wxf)), [i * 1000 for i in range(n)]
+                )
+                self.assertEqual(
+                    list(binary_deserialize_sequence(six.BytesIO(wxf), chunk_size=3)),
+                    [i * 1000 for i in range(n)],
+                )
@@ -27,7 +27,15 @@ json = API(
     JSONDecodeError="json.decoder.JSONDecodeError",
 )
 
-zlib = API(compressobj="zlib.compressobj", decompressobj="zlib.decompressobj")
+zlib = API(
+    compressobj="zlib.compressobj",
+    decompressobj="zlib.decompressobj",
+    decompress="zlib.decompress",
+    adler32="zlib.adler32",
+    Z_SYNC_FLUSH="zlib.Z_SYNC_FLUSH",
+    Z_FINISH="zlib.Z_FINISH",
+    error="zlib.error",
+)
 
 os = API(
     X_OK="os.X_OK",
@@ -42,6 +50,8 @@ os = API(
     makedirs="os.makedirs",
     environ="os.environ",
     listdir="os.listdir",
+    close="os.close",
+    pidfd_open="os.pidfd_open",
 )
 
 requests = API(
@@ -51,12 +61,19 @@ requests = API(
     Request="requests.Request",
     Response="requests.Response",
     Session="requests.Session",
+    HTTPAdapter="requests.adapters.HTTPAdapter",
 )
 
 oauth = API(
     Client="oauthlib.oauth1.Client",
     SIGNATURE_HMAC="oauthlib.oauth1.SIGNATURE_HMAC",
     SIGNATURE_TYPE_AUTH_HEADER="oauthlib.oauth1.SIGNATURE_TYPE_AUTH_HEADER",
+    escape="oauthlib.oauth1.rfc5849.utils.escape",
+    base_string_uri="oauthlib.oauth1.rfc5849.signature.base_string_uri",
+    extract_params="oauthlib.common.extract_params",
+    urldecode="oauthlib.common.urldecode",
+    generate_nonce="oauthlib.common.generate_nonce",
+    generate_timestamp="oauthlib.common.generate_timestamp",
 )
 
 pip = API(
@@ -74,6 +91,7 @@ pip = API(
 
 zmq = API(
     Context="zmq.Context",
+    AsyncContext="zmq.asyncio.Context",
     Frame="zmq.Frame",
     PUSH="zmq.PUSH",
     PULL="zmq.PULL",
@@ -83,11 +101,19 @@ zmq = API(
     NOBLOCK="zmq.NOBLOCK",
     LAST_ENDPOINT="zmq.LAST_ENDPOINT",
     Again="zmq.Again",
+    POLLOUT="zmq.POLLOUT",
+    has="zmq.has",
+    Poller="zmq.Poller",
+    POLLIN="zmq.POLLIN",
 )
 
 time = API(perf_counter=("time.perf_counter", "time.time"), sleep="time.sleep")
 
-futures = API(ThreadPoolExecutor="concurrent.futures.ThreadPoolExecutor")
+futures = API(
+    Executor="concurrent.futures.Executor",
+    ThreadPoolExecutor="concurrent.futures.ThreadPoolExecutor",
+    ProcessPoolExecutor="concurrent.futures.ProcessPoolExecutor",
+)
 
 asyncio = API(
     create_task="wolframclient.utils.asyncio.create_task",
@@ -95,16 +121,24 @@ asyncio = API(
     wrap_future="asyncio.wrap_future",
     run="wolframclient.utils.asyncio.run",
     get_event_loop="asyncio.get_event_loop",
+    get_running_loop="asyncio.get_running_loop",
     new_event_loop="asyncio.new_event_loop",
     Queue="asyncio.Queue",
+    PriorityQueue="asyncio.PriorityQueue",
     shield="asyncio.shield",
     CancelledError="asyncio.CancelledError",
     wait="asyncio.wait",
+    current_task="asyncio.current_task",
     FIRST_COMPLETED="asyncio.FIRST_COMPLETED",
     gather="asyncio.gather",
     Future="asyncio.Future",
     sleep="asyncio.sleep",
     BytesIO="asyncio.io.BytesIO",
+    Lock="asyncio.Lock",
+    Semaphore="asyncio.Semaphore",
+    wait_for="asyncio.wait_for",
+    create_subprocess_exec="asyncio.create_subprocess_exec",
+    TimeoutError="asyncio.TimeoutError",
 )
 
 urllib = API(
@@ -121,6 +155,7 @@ numpy = API(
     array="numpy.array",
     ndarray="numpy.ndarray",
     arange="numpy.arange",
+    ascontiguousarray="numpy.ascontiguousarray",
     int8="numpy.int8",
     int16="numpy.int16",
     int32="numpy.int32",
@@ -141,6 +176,7 @@ numpy = API(
     dtype="numpy.dtype",
     frombuffer="numpy.frombuffer",
     reshape="numpy.reshape",
+    shares_memory="numpy.shares_memory",
     integer="numpy.integer",
     floating="numpy.floating",
     complexfloating="numpy.complexfloating",
@@ -181,6 +217,7 @@ aiohttp = API(
     ClientSession="aiohttp.ClientSession",
     FormData="aiohttp.FormData",
     StringPayload="aiohttp.StringPayload",
+    TCPConnector="aiohttp.TCPConnector",
 )
 
 ssl = API(SSLContext="ssl.SSLContext", create_default_context="ssl.create_default_context")